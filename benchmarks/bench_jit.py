@@ -0,0 +1,89 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Benchmark pyufunc's numeric kernels with the numba JIT off and on.
+
+Usage:
+    python benchmarks/bench_jit.py [--size 1000000] [--repeat 5]
+
+Without numba installed only the fallback column is measured. The first compiled call (JIT
+warm-up, or loading numba's on-disk cache) is reported separately and excluded from the timings.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np  # noqa: E402
+
+from pyufunc import set_jit, jit_available  # noqa: E402
+from pyufunc.util_algorithm._sort import (  # noqa: E402
+    _quick_sort_kernel, _merge_sort_kernel, _heap_sort_kernel,
+    _selection_sort_kernel, _insertion_sort_kernel, _bubble_sort_kernel)
+from pyufunc.util_geo._coordinate_convert import _cvt_deltas  # noqa: E402
+from pyufunc.util_geo._geo_circle import _offset  # noqa: E402
+from pyufunc.util_geo._geo_distance import _haversine  # noqa: E402
+
+
+def _cases(size: int) -> list:
+    rng = np.random.default_rng(0)
+    lng, lat = rng.uniform(-30, 30, size), rng.uniform(-30, 20, size)
+    lon2, lat2 = rng.uniform(-180, 180, size), rng.uniform(-90, 90, size)
+    bearings = np.linspace(0, 2 * np.pi, size)
+    small = rng.integers(0, 1_000_000, min(size, 3_000))
+    large = rng.integers(0, 1_000_000, size)
+
+    # (name, kernel, argument factory), fresh arguments per run for the in-place sorts
+    return [
+        ("_cvt_lat/_cvt_lon", _cvt_deltas, lambda: (lng, lat, np.empty(size), np.empty(size))),
+        ("_offset", _offset, lambda: (1.95, 0.58, 1e-5, bearings, np.empty((size, 2)))),
+        ("haversine", _haversine, lambda: (lng, lat, lon2, lat2, 6371.0, np.empty(size))),
+        ("algo_quick_sort", _quick_sort_kernel, lambda: (large.copy(),)),
+        ("algo_merge_sort", _merge_sort_kernel, lambda: (large.copy(),)),
+        ("algo_heap_sort", _heap_sort_kernel, lambda: (large.copy(),)),
+        (f"algo_selection_sort (n={small.size})", _selection_sort_kernel, lambda: (small.copy(),)),
+        (f"algo_insertion_sort (n={small.size})", _insertion_sort_kernel, lambda: (small.copy(),)),
+        (f"algo_bubble_sort (n={small.size})", _bubble_sort_kernel, lambda: (small.copy(),)),
+    ]
+
+
+def _best_time(kernel, make_args, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        args = make_args()
+        time_start = time.perf_counter()
+        kernel(*args)
+        best = min(best, time.perf_counter() - time_start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"numba available: {jit_available()}, size: {args.size}, best of {args.repeat}")
+    print(f"{'kernel':<36}{'fallback (s)':>14}{'first call (s)':>16}{'jit (s)':>10}{'speedup':>10}")
+    for name, kernel, make_args in _cases(args.size):
+        set_jit(False)
+        # the python loop fallbacks of the sorts are slow, time them once
+        fallback = _best_time(kernel, make_args, 1 if kernel.fallback is kernel.py_func else args.repeat)
+        row = f"{name:<36}{fallback:>14.4f}"
+        if jit_available():
+            set_jit(True)
+            first = _best_time(kernel, make_args, 1)
+            compiled = _best_time(kernel, make_args, args.repeat)
+            row += f"{first:>16.4f}{compiled:>10.4f}{fallback / compiled:>9.1f}x"
+        print(row)
+    set_jit(False)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,8 @@
 ##############################################################
 from __future__ import absolute_import
 import os
-import socket
-
-computer_name = socket.gethostname()
-computer_ip = socket.gethostbyname(computer_name)
+import functools
+from collections.abc import ItemsView, ValuesView
 
 # ############## Package Configurations ############## #
 
@@ -19,10 +17,110 @@ __all__ = [
     "config_email",
     "config_gmns",
     "config_color",
-    "computer_name",
-    "computer_ip",
 ]
 
+# ############## Environment variable overrides ############## #
+# host identity and cpu cores are resolved on first use, never at import time,
+# and can be pinned with these environment variables (e.g. on hosts with a slow resolver)
+ENV_HOSTNAME = "PYUFUNC_HOSTNAME"
+ENV_HOST_IP = "PYUFUNC_HOST_IP"
+ENV_CPU_CORES = "PYUFUNC_CPU_CORES"
+
+
+class _Lazy:
+    """A config value computed by ``func`` on first read."""
+    __slots__ = ("func",)
+
+    def __init__(self, func):
+        self.func = func
+
+    def __repr__(self):
+        return f"<computed on first use: {self.func.__name__}>"
+
+
+class _LazyDict(dict):
+    """A dict whose ``_Lazy`` values are computed on first read and then cached in place."""
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, _Lazy):
+            value = value.func()
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __iter__(self):
+        # overriding __iter__ makes dict(...) and {**...} copy through __getitem__
+        return super().__iter__()
+
+    def items(self):
+        return ItemsView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def copy(self):
+        return _LazyDict(dict.items(self))
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_hostname() -> str:
+    import socket
+    return socket.gethostname()
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_host_ip(hostname: str) -> str:
+    import socket
+    try:
+        return socket.gethostbyname(hostname)
+    except OSError:
+        # broken or unreachable resolver: do not fail logging over it
+        return "127.0.0.1"
+
+
+def get_computer_name() -> str:
+    """Return the host name, honoring the ``PYUFUNC_HOSTNAME`` override."""
+    return os.environ.get(ENV_HOSTNAME) or _resolve_hostname()
+
+
+def get_computer_ip() -> str:
+    """Return the host IP address, honoring the ``PYUFUNC_HOST_IP`` override."""
+    return os.environ.get(ENV_HOST_IP) or _resolve_host_ip(get_computer_name())
+
+
+def get_cpu_cores() -> int:
+    """Return the number of cpu cores to use, honoring the ``PYUFUNC_CPU_CORES`` override."""
+    env_cores = os.environ.get(ENV_CPU_CORES, "").strip()
+    if env_cores.isdigit() and int(env_cores) > 0:
+        return int(env_cores)
+    return os.cpu_count() or 1
+
+
+def _build_log_fmt_host() -> str:
+    return (f'%(asctime)s-({get_computer_ip()},{get_computer_name()})-[p%(process)d_t%(thread)d] - %(name)s - '
+            '"%(filename)s:%(lineno)d" - %(funcName)s - %(levelname)s - %(message)s')
+
+
+# computer_name / computer_ip are kept as module attributes for compatibility, but only resolved
+# when someone actually reads them; they are left out of __all__ so that a star import stays lazy
+_LAZY_ATTRIBUTES = ("computer_name", "computer_ip")
+
+
+def __getattr__(name: str):
+    if name == "computer_name":
+        return get_computer_name()
+    if name == "computer_ip":
+        return get_computer_ip()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
+
+
 # ############## Logging Configurations ############## #
 config_logging = {
     # log name
@@ -35,7 +133,7 @@ config_logging = {
     "log_folder": "logs",
 
     # default log format
-    "log_fmt": {
+    "log_fmt": _LazyDict({
         1: '%(asctime)s - %(name)s - %(filename)s - %(funcName)s - %(lineno)d - %(levelname)s - %(message)s',
 
         2: '%(asctime)s - %(name)s - [ File "%(pathname)s", line %(lineno)d, in %(funcName)s ] - %(levelname)s - %(message)s',
@@ -52,8 +150,8 @@ config_logging = {
 
         8: '[p%(process)d_t%(thread)d] %(asctime)s - %(name)s - "%(filename)s:%(lineno)d" - %(levelname)s - %(message)s',
 
-        9: f'%(asctime)s-({computer_ip},{computer_name})-[p%(process)d_t%(thread)d] - %(name)s - "%(filename)s:%(lineno)d" - %(funcName)s - %(levelname)s - %(message)s',
-    },
+        9: _Lazy(_build_log_fmt_host),  # include host ip and name, resolved when first requested
+    }),
 
     # default log date format
     "log_datefmt": "%Y-%m-%d %H:%M:%S",
@@ -173,7 +271,7 @@ config_email = {
 }
 
 # ############### GMNS: General Modeling Network Specification configuration #
-config_gmns = {
+config_gmns = _LazyDict({
     # specify required fields for node.csv and poi.csv and zone.csv (optional)
     "node_fields": ["node_id", "x_coord", "y_coord", "activity_type"],
     "poi_fields": ["poi_id", "building", "amenity", "centroid", "area", "geometry"],
@@ -182,9 +280,10 @@ config_gmns = {
                     "dir_flag", "allowed_uses", "geometry"],
     "zone_geometry_fields": ["zone_id", "geometry"],
     "zone_centroid_fields": ["zone_id", "x_coord", "y_coord"],
-    "data_chunk_size": 1000,  # number of rows to read in each chunk
-    "cpu_cores": os.cpu_count(),  # number of cpu cores to use
-}
+    "data_block_size": 1 << 22,  # bytes of csv to read in each chunk (4 MiB)
+    "parallel_min_size": 1 << 24,  # bytes of csv below which a file is parsed without worker processes (16 MiB)
+    "cpu_cores": _Lazy(get_cpu_cores),  # number of cpu cores to use
+})
 
 # ############### Color initialization ############### #
 config_color = {
@@ -7,35 +7,120 @@
 ##############################################################
 """
 
+from __future__ import annotations
 import sys
-import itertools
-
-from .util_ai import *  # machine learning functions
-from .util_algorithm import *  # algorithm functions
-from .util_magic import *  # unclassified functions are here
-from .util_data_processing import *  # data processing functions including algorithms
-from .util_datetime import *  # datetime functions
-from .util_fullstack import *  # fullstack functions, including front end and back end
-from .util_geo import *  # geographic functions
-from .util_git_pypi import *  # git and pypi functions
-from .util_gui import *  # GUI functions
-from .util_img import *  # image functions
-from .util_log import *  # logging functions
-from .util_network import *  # network functions
-from .util_office import *  # office functions
-from .util_optimization import *  # optimization functions
-from .util_pathio import *  # path and IO functions
-from .util_test import *  # test functions
-from .util_vis import *  # visualization functions
-
-# import adopted functions from other packages
-from .util_pkgs import *
+import os
+import importlib
+from typing import TYPE_CHECKING
+
+# utility categories, ordered as they used to be star-imported,
+# a later category wins when two categories export the same name
+_UTIL_CATEGORIES = (
+    "util_ai",  # machine learning functions
+    "util_algorithm",  # algorithm functions
+    "util_magic",  # unclassified functions are here
+    "util_data_processing",  # data processing functions including algorithms
+    "util_datetime",  # datetime functions
+    "util_fullstack",  # fullstack functions, including front end and back end
+    "util_geo",  # geographic functions
+    "util_git_pypi",  # git and pypi functions
+    "util_gui",  # GUI functions
+    "util_img",  # image functions
+    "util_log",  # logging functions
+    "util_network",  # network functions
+    "util_office",  # office functions
+    "util_optimization",  # optimization functions
+    "util_pathio",  # path and IO functions
+    "util_test",  # test functions
+    "util_vis",  # visualization functions
+    "util_pkgs",  # import adopted functions from other packages
+)
+
+# sub-packages that are importable as attributes but not star-exported
+_UTIL_SUBPACKAGES = (*_UTIL_CATEGORIES, "util_dababase")
+
+# public name -> utility category, filled on first lazy lookup
+_LAZY_NAME_TO_CATEGORY: dict[str, str] = {}
+
+if TYPE_CHECKING:
+    # static analyzers and IDEs see the full namespace, runtime stays lazy
+    from .util_ai import *
+    from .util_algorithm import *
+    from .util_magic import *
+    from .util_data_processing import *
+    from .util_datetime import *
+    from .util_fullstack import *
+    from .util_geo import *
+    from .util_git_pypi import *
+    from .util_gui import *
+    from .util_img import *
+    from .util_log import *
+    from .util_network import *
+    from .util_office import *
+    from .util_optimization import *
+    from .util_pathio import *
+    from .util_test import *
+    from .util_vis import *
+    from .util_pkgs import *
 
 __version__ = "0.4.5"
 __author__ = "Mr. Xiangyong Luo, Dr. Xuesong Simon Zhou"
 __email__ = "luoxiangyong01@gmail.com"
 
 
+def _read_category_all(category: str) -> list[str]:
+    """Read ``__all__`` of a utility category from its source without importing it.
+
+    Falls back to a real import if ``__all__`` is not a plain literal list.
+    """
+    import ast
+
+    init_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), category, "__init__.py")
+    try:
+        with open(init_file, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=init_file)
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and any(
+                    isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets):
+                return list(ast.literal_eval(node.value))
+    except (OSError, SyntaxError, ValueError):
+        pass
+    return list(getattr(importlib.import_module(f"{__name__}.{category}"), "__all__", []))
+
+
+def _lazy_name_to_category() -> dict[str, str]:
+    """Map every public utility name to the category that defines it (computed once)."""
+    if not _LAZY_NAME_TO_CATEGORY:
+        for category in _UTIL_CATEGORIES:
+            for name in _read_category_all(category):
+                _LAZY_NAME_TO_CATEGORY[name] = category
+    return _LAZY_NAME_TO_CATEGORY
+
+
+def __getattr__(name: str) -> object:
+    """Resolve utility functions and sub-packages on first access (PEP 562)."""
+    if name in _UTIL_SUBPACKAGES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    if name == "__all__":
+        all_names = [*_lazy_name_to_category(), "show_util_func_by_category", "find_util_func_by_keyword"]
+        globals()["__all__"] = all_names
+        return all_names
+
+    category = _lazy_name_to_category().get(name)
+    if category is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{category}"), name)
+    # cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_name_to_category()) | set(_UTIL_SUBPACKAGES))
+
+
 def show_util_func_by_category(verbose: bool = True) -> dict:
     """
     Show all available utility functions in pyufunc by category or by prefix keywords.
@@ -61,50 +146,11 @@ def show_util_func_by_category(verbose: bool = True) -> dict:
            ** get_time_diff_in_unit
 
     """
-    # import package configurations and utilities
-    from . import (
-        util_ai,
-        util_algorithm,
-        util_magic,
-        util_data_processing,
-        util_datetime,
-        util_fullstack,
-        util_geo,
-        util_git_pypi,
-        util_gui,
-        util_img,
-        util_log,
-        util_network,
-        util_office,
-        util_optimization,
-        util_pathio,
-        util_test,
-        util_vis,
-        util_pkgs,
-    )
-
-    config_func_category = {
-        "util_ai": util_ai.__all__,
-        "util_algorithm": util_algorithm.__all__,
-        "util_magic": util_magic.__all__,
-        "util_data_processing": util_data_processing.__all__,
-        "util_datetime": util_datetime.__all__,
-        "util_fullstack": util_fullstack.__all__,
-        "util_geo": util_geo.__all__,
-        "util_git_pypi": util_git_pypi.__all__,
-        "util_gui": util_gui.__all__,
-        "util_img": util_img.__all__,
-        "util_log": util_log.__all__,
-        "util_network": util_network.__all__,
-        "util_office": util_office.__all__,
-        "util_optimization": util_optimization.__all__,
-        "util_pathio": util_pathio.__all__,
-        "util_test": util_test.__all__,
-        "util_vis": util_vis.__all__,
-        "util_pkgs": util_pkgs.__all__,
-        "pkg_utils": ["show_util_func_by_category",
-                      "find_util_func_by_keyword"],
-    }
+    # read names from the static catalog, no util_* category (or its dependencies) is imported
+    from ._func_catalog import load_catalog
+
+    config_func_category = {category: list(func_names)
+                            for category, func_names in load_catalog()["categories"].items()}
 
     res_str_by_category = ""
     func_count = 0
@@ -122,7 +168,8 @@ def show_util_func_by_category(verbose: bool = True) -> dict:
     return config_func_category
 
 
-def find_util_func_by_keyword(keyword: str | None = None, verbose: bool = True) -> list[str]:
+def find_util_func_by_keyword(keyword: str | None = None, verbose: bool = True,
+                              search_doc: bool = False) -> list[str]:
     """
     Find all available utility functions in pyufunc by keyword.
 
@@ -156,6 +203,8 @@ def find_util_func_by_keyword(keyword: str | None = None, verbose: bool = True)
                 - **pytest**: functions related pytest usage
 
         verbose (bool): whether to print string information. Defaults to True.
+        search_doc (bool): also match the words of keyword against the first line of each docstring.
+            Defaults to False.
 
     Returns:
         list: if verbose is True, print the result string; otherwise return the result list.
@@ -186,11 +235,12 @@ def find_util_func_by_keyword(keyword: str | None = None, verbose: bool = True)
     res_str_lst = []
     func_count = 0
 
-    for func_str in itertools.chain.from_iterable(config_func_category.values()):
-        if keyword.lower() in func_str.lower():
-            res_str_by_keyword += f"  \n{func_count + 1}. {func_str}\n"
-            res_str_lst.append(func_str)
-            func_count += 1
+    from ._func_catalog import search_catalog
+
+    for func_str in search_catalog(keyword, search_doc=search_doc):
+        res_str_by_keyword += f"  \n{func_count + 1}. {func_str}\n"
+        res_str_lst.append(func_str)
+        func_count += 1
 
     if verbose:
         res_str_head = f"Available functions by keyword: {keyword}"
@@ -214,3 +264,8 @@ def __check_python_version(min_version: str = "3.10") -> tuple:
     return version_tuple
 
 __check_python_version()
+
+# set PYUFUNC_EAGER_IMPORT=1 to load every category up front (e.g. for freezing tools such as PyInstaller)
+if os.environ.get("PYUFUNC_EAGER_IMPORT", "").strip().lower() in {"1", "true", "yes"}:
+    for _func_name in list(_lazy_name_to_category()):
+        __getattr__(_func_name)
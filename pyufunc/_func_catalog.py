@@ -0,0 +1,263 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""
+Static catalog of pyufunc utility functions.
+
+The catalog (name, category, signature, first docstring line and required
+dependencies of every public function) is extracted from the source code with
+``ast``, so building or searching it never imports a util_* category or any of
+its optional dependencies. It ships as ``_func_catalog.json`` next to this file.
+
+Regenerate the json after adding, renaming or removing utility functions::
+
+    python -m pyufunc._func_catalog
+"""
+
+from __future__ import annotations
+import os
+import re
+import json
+import functools
+
+CATALOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_func_catalog.json")
+CATALOG_VERSION = 1
+
+# keep in sync with pyufunc/__init__.py
+PKG_UTILS = ["show_util_func_by_category", "find_util_func_by_keyword"]
+
+_PKG_DIR = os.path.dirname(os.path.abspath(__file__))
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# very common words that would make the docstring index noisy
+_STOP_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "by", "with", "from", "as",
+    "is", "it", "be", "at", "this", "that", "into", "if", "all", "its", "are", "not", "no",
+})
+
+
+def _tokenize(text: str) -> list[str]:
+    return [tok for tok in _TOKEN_PATTERN.findall(text.lower()) if len(tok) > 1 and tok not in _STOP_WORDS]
+
+
+def _module_file(module: str) -> str:
+    """Source file of a pyufunc module given its dotted name."""
+    rel = module.split(".")[1:]
+    pkg_path = os.path.join(_PKG_DIR, *rel)
+    if os.path.isdir(pkg_path):
+        return os.path.join(pkg_path, "__init__.py")
+    return f"{pkg_path}.py"
+
+
+def _resolve_relative(module: str, is_pkg: bool, level: int, target: str | None) -> str:
+    base = module.split(".")
+    if not is_pkg:
+        base = base[:-1]
+    if level > 1:
+        base = base[:-(level - 1)]
+    return ".".join(base + ([target] if target else []))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_module(module: str):
+    import ast
+
+    file_path = _module_file(module)
+    with open(file_path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=file_path)
+
+    is_pkg = file_path.endswith("__init__.py")
+    definitions = {}
+    imports = {}
+    all_names = None
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            definitions[node.name] = node
+        elif isinstance(node, ast.ImportFrom):
+            source = _resolve_relative(module, is_pkg, node.level, node.module) if node.level else node.module
+            if source and source.split(".")[0] == "pyufunc":
+                for alias in node.names:
+                    imports[alias.asname or alias.name] = (source, alias.name)
+        elif isinstance(node, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets):
+            all_names = list(ast.literal_eval(node.value))
+    return definitions, imports, all_names
+
+
+def _find_definition(module: str, name: str, depth: int = 0):
+    """Follow pyufunc-internal imports until the ast node defining ``name`` is found."""
+    definitions, imports, _ = _parse_module(module)
+    if name in definitions:
+        return module, definitions[name]
+    if name in imports and depth < 10:
+        source, orig_name = imports[name]
+        try:
+            return _find_definition(source, orig_name, depth + 1)
+        except OSError:
+            return source, None
+    return module, None
+
+
+def _signature(node) -> str:
+    import ast
+
+    if node is None:
+        return "(...)"
+
+    if isinstance(node, ast.ClassDef):
+        init = next((item for item in node.body
+                     if isinstance(item, ast.FunctionDef) and item.name == "__init__"), None)
+        if init is not None:
+            args = ast.unparse(init.args)
+            args = re.sub(r"^self(,\s*)?", "", args)
+            return f"({args})"
+        # dataclass style: annotated class attributes are the parameters
+        fields = []
+        for item in node.body:
+            if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+                field = f"{item.target.id}: {ast.unparse(item.annotation)}"
+                if item.value is not None:
+                    field += f" = {ast.unparse(item.value)}"
+                fields.append(field)
+        return f"({', '.join(fields)})"
+
+    sig = f"({ast.unparse(node.args)})"
+    if node.returns is not None:
+        sig += f" -> {ast.unparse(node.returns)}"
+    return sig
+
+
+def _required_deps(node) -> list[str]:
+    """Install names listed in ``@requires(...)`` decorators of the definition."""
+    import ast
+
+    deps = []
+    if node is None:
+        return deps
+    for deco in node.decorator_list:
+        if not isinstance(deco, ast.Call):
+            continue
+        func = deco.func
+        deco_name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", "")
+        if deco_name != "requires":
+            continue
+        for arg in deco.args:
+            try:
+                value = ast.literal_eval(arg)
+            except ValueError:
+                continue
+            deps.append(value if isinstance(value, str) else value[0])
+    return deps
+
+
+def _first_doc_line(node) -> str:
+    import ast
+
+    if node is None:
+        return ""
+    doc = ast.get_docstring(node) or ""
+    return next((line.strip() for line in doc.splitlines() if line.strip()), "")
+
+
+def build_catalog() -> dict:
+    """Build the function catalog from pyufunc's source code without importing any category.
+
+    Returns:
+        dict: {"version", "categories", "functions", "index"}
+    """
+    import pyufunc
+
+    categories = {}
+    functions = {}
+    for category in pyufunc._UTIL_CATEGORIES:
+        module = f"pyufunc.{category}"
+        _, _, all_names = _parse_module(module)
+        categories[category] = list(all_names or [])
+        for name in categories[category]:
+            def_module, node = _find_definition(module, name)
+            functions[name] = {
+                "category": category,
+                "module": def_module,
+                "signature": _signature(node),
+                "summary": _first_doc_line(node),
+                "requires": _required_deps(node),
+            }
+
+    categories["pkg_utils"] = list(PKG_UTILS)
+    for name in PKG_UTILS:
+        _, node = _find_definition("pyufunc", name)
+        functions[name] = {
+            "category": "pkg_utils",
+            "module": "pyufunc",
+            "signature": _signature(node),
+            "summary": _first_doc_line(node),
+            "requires": [],
+        }
+
+    # inverted index: token of the name or summary -> function names
+    index: dict[str, list[str]] = {}
+    for name, info in functions.items():
+        for token in dict.fromkeys(_tokenize(name.replace("_", " ")) + _tokenize(info["summary"])):
+            index.setdefault(token, []).append(name)
+
+    return {
+        "version": CATALOG_VERSION,
+        "categories": categories,
+        "functions": functions,
+        "index": dict(sorted(index.items())),
+    }
+
+
+def write_catalog(path: str = CATALOG_FILE) -> str:
+    """Regenerate the catalog json file shipped with the package."""
+    catalog = build_catalog()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, indent=1, sort_keys=False)
+        f.write("\n")
+    return path
+
+
+@functools.lru_cache(maxsize=1)
+def load_catalog() -> dict:
+    """Load the shipped catalog, or build it from source if the json is missing or unreadable."""
+    try:
+        with open(CATALOG_FILE, "r", encoding="utf-8") as f:
+            catalog = json.load(f)
+        if catalog.get("version") == CATALOG_VERSION:
+            return catalog
+    except (OSError, ValueError):
+        pass
+    return build_catalog()
+
+
+def search_catalog(keyword: str, search_doc: bool = False) -> list[str]:
+    """Find function names containing ``keyword``; optionally also match words of their docstring summary.
+
+    Args:
+        keyword (str): case-insensitive keyword.
+        search_doc (bool): also look up every word of ``keyword`` in the docstring index. Defaults to False.
+
+    Returns:
+        list[str]: matching function names in catalog order.
+    """
+    catalog = load_catalog()
+    keyword_lower = keyword.lower().strip()
+    matched = {name for name in catalog["functions"] if keyword_lower in name.lower()}
+
+    if search_doc:
+        tokens = _tokenize(keyword_lower)
+        if tokens:
+            index = catalog["index"]
+            doc_hits = set(index.get(tokens[0], []))
+            for token in tokens[1:]:
+                doc_hits &= set(index.get(token, []))
+            matched |= doc_hits
+
+    return [name for name in catalog["functions"] if name in matched]
+
+
+if __name__ == "__main__":
+    print(f"  :Catalog written to {write_catalog()}")
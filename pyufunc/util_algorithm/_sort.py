@@ -8,6 +8,149 @@
 
 from collections.abc import Iterable
 import math
+from pyufunc.util_magic import jit, is_jit_enabled
+
+
+def _numeric_array(array: Iterable):
+    """A copy of array as a 1-D NumPy array for the compiled kernels.
+
+    None unless the JIT is on (see set_jit) and array is a numeric ndarray or a list / tuple
+    of only ints or only floats, other inputs are sorted by the pure Python code.
+    """
+    if not is_jit_enabled():
+        return None
+    import numpy as np
+
+    if isinstance(array, np.ndarray):
+        return array.copy() if array.ndim == 1 and array.dtype.kind in "iuf" else None
+    if not isinstance(array, (list, tuple)) or not array:
+        return None
+    if not (all(type(value) is int for value in array) or all(type(value) is float for value in array)):
+        return None
+    try:
+        return np.array(array)
+    except OverflowError:
+        return None
+
+
+@jit
+def _quick_sort_kernel(array) -> None:
+    # iterative quick sort with a middle pivot (Hoare partition), in place
+    stack = [(0, array.shape[0] - 1)]
+    while len(stack) > 0:
+        low, high = stack.pop()
+        if low >= high:
+            continue
+        pivot = array[(low + high) // 2]
+        i, j = low, high
+        while i <= j:
+            while array[i] < pivot:
+                i += 1
+            while array[j] > pivot:
+                j -= 1
+            if i <= j:
+                array[i], array[j] = array[j], array[i]
+                i += 1
+                j -= 1
+        stack.append((low, j))
+        stack.append((i, high))
+
+
+@jit
+def _merge_sort_kernel(array) -> None:
+    # bottom-up merge sort through a buffer, in place
+    n = array.shape[0]
+    source = array
+    target = array.copy()
+    width = 1
+    while width < n:
+        for start in range(0, n, 2 * width):
+            mid = min(start + width, n)
+            end = min(start + 2 * width, n)
+            left, right, k = start, mid, start
+            while left < mid and right < end:
+                if source[right] < source[left]:
+                    target[k] = source[right]
+                    right += 1
+                else:
+                    target[k] = source[left]
+                    left += 1
+                k += 1
+            while left < mid:
+                target[k] = source[left]
+                left += 1
+                k += 1
+            while right < end:
+                target[k] = source[right]
+                right += 1
+                k += 1
+        source, target = target, source
+        width *= 2
+    if source is not array:
+        array[:] = source
+
+
+@jit
+def _heap_sort_kernel(array) -> None:
+    n = array.shape[0]
+
+    for end in range(n, 0, -1):
+        if end == n:
+            # build a max heap
+            roots = range(n // 2 - 1, -1, -1)
+        else:
+            # move the current max to the end, restore the heap on the rest
+            array[0], array[end] = array[end], array[0]
+            roots = range(0, 1)
+        for root in roots:
+            i = root
+            while True:
+                largest = i
+                left = 2 * i + 1
+                right = left + 1
+                if left < end and array[largest] < array[left]:
+                    largest = left
+                if right < end and array[largest] < array[right]:
+                    largest = right
+                if largest == i:
+                    break
+                array[i], array[largest] = array[largest], array[i]
+                i = largest
+
+
+@jit
+def _selection_sort_kernel(array) -> None:
+    n = array.shape[0]
+    for i in range(n):
+        min_idx = i
+        for j in range(i + 1, n):
+            if array[min_idx] > array[j]:
+                min_idx = j
+        array[i], array[min_idx] = array[min_idx], array[i]
+
+
+@jit
+def _insertion_sort_kernel(array) -> None:
+    for i in range(1, array.shape[0]):
+        key_item = array[i]
+        j = i - 1
+        while j >= 0 and key_item < array[j]:
+            array[j + 1] = array[j]
+            j -= 1
+        array[j + 1] = key_item
+
+
+@jit
+def _bubble_sort_kernel(array) -> None:
+    n = array.shape[0]
+    for i in range(n):
+        swapped = False
+        for j in range(n - i - 1):
+            if array[j] > array[j + 1]:
+                array[j], array[j + 1] = array[j + 1], array[j]
+                swapped = True
+        if not swapped:
+            break
 
 
 def algo_quick_sort(array: Iterable, verbose: bool = False) -> Iterable:
@@ -37,6 +180,14 @@ def algo_quick_sort(array: Iterable, verbose: bool = False) -> Iterable:
     if not isinstance(array, Iterable):
         raise ValueError("Input should be iterable")
 
+    # numeric input with the JIT on: compiled in-place kernel
+    values = _numeric_array(array)
+    if values is not None:
+        _quick_sort_kernel(values)
+        if verbose:
+            print("Running time of quick_sort: O(n log n)")
+        return values.tolist()
+
     array = list(array)
 
     array = list(array)
@@ -84,6 +235,14 @@ def algo_merge_sort(array: Iterable, verbose: bool = False) -> Iterable:
     if not isinstance(array, Iterable):
         raise ValueError("Input should be iterable")
 
+    # numeric input with the JIT on: compiled in-place kernel
+    values = _numeric_array(array)
+    if values is not None:
+        _merge_sort_kernel(values)
+        if verbose:
+            print(f"Running time of merge_sort: O(n log n): {len(values) * math.log2(len(values))}")
+        return values.tolist()
+
     array = list(array)
 
     # check if the input array is larger than 1
@@ -162,6 +321,14 @@ def algo_heap_sort(array: Iterable, verbose: bool = False) -> Iterable:
     if not isinstance(array, Iterable):
         raise ValueError("Input should be iterable")
 
+    # numeric input with the JIT on: compiled in-place kernel
+    values = _numeric_array(array)
+    if values is not None:
+        _heap_sort_kernel(values)
+        if verbose:
+            print(f"Running time of heap_sort: O(n log n): {len(values) * math.log2(len(values))}")
+        return values.tolist()
+
     array = list(array)
 
     # heapify the array with subtree rooted at index i of the array
@@ -234,6 +401,14 @@ def algo_selection_sort(array: Iterable, verbose: bool = False) -> Iterable:
     if not isinstance(array, Iterable):
         raise ValueError("Input should be a sequence")
 
+    # numeric input with the JIT on: compiled in-place kernel
+    values = _numeric_array(array)
+    if values is not None:
+        _selection_sort_kernel(values)
+        if verbose:
+            print("Running time of selection_sort: O(n^2)")
+        return values.tolist()
+
     array = list(array)
 
     for i in range(len(array)):
@@ -284,6 +459,14 @@ def algo_insertion_sort(array: Iterable, verbose: bool = False) -> Iterable:
     if not isinstance(array, Iterable):
         raise ValueError("Input should be iterable")
 
+    # numeric input with the JIT on: compiled in-place kernel
+    values = _numeric_array(array)
+    if values is not None:
+        _insertion_sort_kernel(values)
+        if verbose:
+            print("Running time of insertion_sort: O(n^2)")
+        return values.tolist()
+
     array = list(array)
 
     for i in range(1, len(array)):
@@ -328,6 +511,14 @@ def algo_bubble_sort(array: Iterable, verbose: bool = False) -> Iterable:
     if not isinstance(array, Iterable):
         raise ValueError("Input should be iterable")
 
+    # numeric input with the JIT on: compiled in-place kernel
+    values = _numeric_array(array)
+    if values is not None:
+        _bubble_sort_kernel(values)
+        if verbose:
+            print("Running time of bubble_sort: O(n^2)")
+        return values.tolist()
+
     array = list(array)
 
     n = len(array)
@@ -5,7 +5,10 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
+from pyufunc.util_magic import batch
 
+
+@batch
 def cvt_int_to_alpha(num: int) -> str:
     """
     Convert an integer to an alphabet string.
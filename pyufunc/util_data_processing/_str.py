@@ -6,6 +6,7 @@
 ##############################################################
 
 import re
+from pyufunc.util_magic import batch
 
 
 def str_strip(string: str) -> str:
@@ -30,6 +31,7 @@ def str_strip(string: str) -> str:
     return re.sub(pattern=r"[\s  ]+", repl=" ", string=str(string)).strip()
 
 
+@batch
 def str_digit_to_int(string: str) -> int:
     """Convert a string to an integer.
 
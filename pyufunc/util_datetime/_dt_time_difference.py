@@ -8,6 +8,7 @@
 
 from datetime import datetime
 from pyufunc.util_data_processing._str import str_strip
+from pyufunc.util_magic import batch
 
 
 def get_time_diff_in_unit(start_time: datetime | str,
@@ -151,6 +152,7 @@ def time_unit_converter(value: float, from_unit: str, to_unit: str, verbose: boo
     return int(result)
 
 
+@batch
 def time_str_to_seconds(time_str: str, to_unit: str = "seconds", verbose: bool = False) -> float:
     """Convert a time string to seconds
 
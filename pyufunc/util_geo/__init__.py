@@ -37,6 +37,17 @@ from pyufunc.util_geo._gmns import read_node as gmns_read_node
 from pyufunc.util_geo._gmns import read_poi as gmns_read_poi
 from pyufunc.util_geo._gmns import read_link as gmns_read_link
 from pyufunc.util_geo._gmns import read_zone as gmns_read_zone
+from pyufunc.util_geo._gmns import iter_nodes as gmns_iter_nodes
+from pyufunc.util_geo._gmns import iter_links as gmns_iter_links
+from pyufunc.util_geo._gmns import iter_pois as gmns_iter_pois
+from pyufunc.util_geo._gmns import iter_zones as gmns_iter_zones
+from pyufunc.util_geo._gmns_table import NodeTable as gmns_NodeTable
+from pyufunc.util_geo._gmns_table import LinkTable as gmns_LinkTable
+from pyufunc.util_geo._gmns_table import POITable as gmns_POITable
+from pyufunc.util_geo._gmns_table import ZoneTable as gmns_ZoneTable
+from pyufunc.util_geo._gmns_index import IdIndex as gmns_IdIndex
+from pyufunc.util_geo._shortest_path import CSRGraph, ShortestPath
+from pyufunc.util_geo._contraction_hierarchy import ContractionHierarchy
 from pyufunc.util_geo._get_osm_place import get_osm_place
 from pyufunc.util_geo._get_osm_data import get_osm_by_relation_id, get_osm_by_bbox, extract_bbox_coordinates
 
@@ -80,6 +91,20 @@ __all__ = [
     # "gmns_read_zone_by_geometry",
     # "gmns_read_zone_by_centroid",
     "gmns_read_zone",
+    "gmns_iter_nodes",
+    "gmns_iter_links",
+    "gmns_iter_pois",
+    "gmns_iter_zones",
+    "gmns_NodeTable",
+    "gmns_LinkTable",
+    "gmns_POITable",
+    "gmns_ZoneTable",
+    "gmns_IdIndex",
+
+    # shortest path
+    "CSRGraph",
+    "ShortestPath",
+    "ContractionHierarchy",
 
     # find osm place
     "get_osm_place",
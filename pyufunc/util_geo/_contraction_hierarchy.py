@@ -0,0 +1,546 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Saturday, October 17th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Contraction hierarchies (CH) for repeated point-to-point shortest paths on a static network.
+
+Preprocessing contracts the nodes of a CSRGraph one by one, least important first (by edge
+difference, contracted neighbors and depth in the hierarchy). Contracting node v removes it and adds
+a shortcut u -> w for every path u -> v -> w that is the only shortest path between u and w, found by
+a witness search limited to witness_limit settled nodes. A query is then two small Dijkstra searches
+that only follow links to more important nodes, from the source forward and from the target backward,
+with stall-on-demand pruning; shortcuts are unpacked to the original links for the path.
+
+The contracted graph is a set of flat arrays, numbered by contraction order (the most important nodes
+last, close together in memory), that is saved to one file and memory-mapped back by load.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import os
+import json
+import math
+import heapq
+import hashlib
+from pathlib import Path
+
+from pyufunc.util_magic._dependency_requires_decorator import requires
+from pyufunc.util_magic._jit import jit
+from pyufunc.util_geo._gmns_index import IdIndex
+from pyufunc.util_geo._gmns_cache import _atomic_write
+from pyufunc.util_geo._shortest_path import ShortestPath, _kernel_args
+
+if TYPE_CHECKING:
+    import numpy as np
+    from pyufunc.util_geo._shortest_path import CSRGraph
+
+__all__ = ['ContractionHierarchy']
+
+# bump when the file layout changes, older files are refused
+_CH_FORMAT = 1
+_CH_MAGIC = b"PYUFCH\x00\x00"
+# arrays start at multiples of this many bytes in the file
+_ALIGN = 64
+
+# the arrays of a contraction hierarchy, as stored in its file
+_ARRAYS = ("rank", "f_indptr", "f_heads", "f_weights", "f_edges", "b_indptr", "b_heads", "b_weights", "b_edges",
+           "edge_first", "edge_second", "edge_link", "node_ids", "link_ids", "link_heads")
+
+
+def _graph_digest(graph: CSRGraph) -> str:
+    """blake2b of the arrays of a graph, telling network versions apart."""
+    h = hashlib.blake2b(digest_size=16)
+    for array in (graph.node_index.ids, graph.indptr, graph.heads, graph.weights, graph.link_ids):
+        h.update(str(array.dtype).encode())
+        h.update(array.tobytes() if array.dtype != object else repr(array.tolist()).encode())
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------- preprocessing
+
+def _witness_costs(out_adj: list, source: int, skip: int, targets: dict, max_cost: float, limit: int) -> dict:
+    """Costs from source avoiding node skip, searched until the targets are settled, past max_cost or limit nodes.
+
+    Costs of nodes reached but not settled are upper bounds, still valid witnesses.
+    """
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    settled = 0
+    remaining = len(targets)
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if d > max_cost or settled >= limit:
+            break
+        settled += 1
+        if u in targets:
+            remaining -= 1
+            if not remaining:
+                break
+        for x, (w, _) in out_adj[u].items():
+            if x != skip and d + w < dist.get(x, math.inf):
+                dist[x] = d + w
+                heapq.heappush(heap, (d + w, x))
+    return dist
+
+
+def _shortcuts(out_adj: list, in_adj: list, v: int, limit: int) -> list:
+    """(u, w, cost, edge u->v, edge v->w) of the shortcuts contracting v needs."""
+    outs = out_adj[v]
+    if not outs or not in_adj[v]:
+        return []
+    shortcuts = []
+    for u, (w_uv, e_uv) in in_adj[v].items():
+        targets = {x: w_uv + w_vx for x, (w_vx, _) in outs.items() if x != u}
+        if not targets:
+            continue
+        dist = _witness_costs(out_adj, u, v, targets, max(targets.values()), limit)
+        for x, cost in targets.items():
+            if dist.get(x, math.inf) > cost:
+                shortcuts.append((u, x, cost, e_uv, outs[x][1]))
+    return shortcuts
+
+
+def _contract(graph: CSRGraph, witness_limit: int, verbose: bool) -> dict:
+    """Contract every node of graph; the arrays of the hierarchy, in contraction order."""
+    import numpy as np
+    from tqdm import tqdm  # pyright: ignore[reportMissingModuleSource]
+
+    n = graph.n_nodes
+    # remaining graph: out_adj[u] = {w: (cost, edge)}, in_adj[w] = {u: (cost, edge)}
+    out_adj = [{} for _ in range(n)]
+    in_adj = [{} for _ in range(n)]
+    # edges: original (link position in the graph) or shortcut (first and second edge)
+    edge_first, edge_second, edge_link = [], [], []
+    for position, (u, w, cost) in enumerate(zip(graph._tails.tolist(), graph.heads.tolist(),
+                                                graph.weights.tolist())):
+        if u == w or (w in out_adj[u] and out_adj[u][w][0] <= cost):
+            continue
+        out_adj[u][w] = in_adj[w][u] = (cost, len(edge_link))
+        edge_first.append(-1)
+        edge_second.append(-1)
+        edge_link.append(position)
+
+    # priority: edge difference, plus contracted neighbors and depth (spread the contraction over the network)
+    contracted_neighbors = [0] * n
+    depth = [0] * n
+
+    def priority(v: int) -> tuple[int, list]:
+        shortcuts = _shortcuts(out_adj, in_adj, v, witness_limit)
+        return len(shortcuts) - len(out_adj[v]) - len(in_adj[v]) + contracted_neighbors[v] + depth[v], shortcuts
+
+    current = [priority(v)[0] for v in tqdm(range(n), desc="  : Order nodes", disable=not verbose)]
+    heap = [(p, v) for v, p in enumerate(current)]
+    heapq.heapify(heap)
+
+    rank = [-1] * n
+    contracted = 0
+    # the links of v to more important nodes: up (v -> w) and down (u -> v), as (v, other, cost, edge)
+    up, down = [], []
+    with tqdm(total=n, desc="  : Contract nodes", disable=not verbose) as bar:
+        while heap:
+            p, v = heapq.heappop(heap)
+            if rank[v] >= 0 or p != current[v]:
+                continue
+            # lazy update: contract v only if its current priority is still the smallest
+            current[v], shortcuts = priority(v)
+            if heap and current[v] > heap[0][0]:
+                heapq.heappush(heap, (current[v], v))
+                continue
+
+            rank[v] = contracted
+            contracted += 1
+            bar.update()
+            neighbors = set(out_adj[v]) | set(in_adj[v])
+            for w, (cost, e) in out_adj[v].items():
+                up.append((v, w, cost, e))
+                del in_adj[w][v]
+            for u, (cost, e) in in_adj[v].items():
+                down.append((v, u, cost, e))
+                del out_adj[u][v]
+            out_adj[v] = in_adj[v] = {}
+            for u, w, cost, e_uv, e_vw in shortcuts:
+                if w in out_adj[u] and out_adj[u][w][0] <= cost:
+                    continue
+                out_adj[u][w] = in_adj[w][u] = (cost, len(edge_link))
+                edge_first.append(e_uv)
+                edge_second.append(e_vw)
+                edge_link.append(-1)
+            for w in neighbors:
+                contracted_neighbors[w] += 1
+                depth[w] = max(depth[w], depth[v] + 1)
+                current[w] = priority(w)[0]
+                heapq.heappush(heap, (current[w], w))
+
+    rank = np.array(rank, dtype="int64")
+    arrays = {"rank": rank}
+    for prefix, links in (("f", up), ("b", down)):
+        table = np.array(links, dtype="float64").reshape(-1, 4)
+        nodes, others, edges = (table[:, i].astype("int64") for i in (0, 1, 3))
+        costs = table[:, 2]
+        # grouped by the rank of their node, so the search touches memory in contraction order
+        nodes, others = rank[nodes], rank[others]
+        order = np.argsort(nodes, kind="stable")
+        indptr = np.zeros(n + 1, dtype="int64")
+        np.cumsum(np.bincount(nodes, minlength=n), out=indptr[1:])
+        arrays.update({f"{prefix}_indptr": indptr, f"{prefix}_heads": others[order],
+                       f"{prefix}_weights": costs[order], f"{prefix}_edges": edges[order]})
+    arrays.update({"edge_first": np.array(edge_first, dtype="int64"),
+                   "edge_second": np.array(edge_second, dtype="int64"),
+                   "edge_link": np.array(edge_link, dtype="int64"),
+                   "node_ids": graph.node_index.ids, "link_ids": graph.link_ids, "link_heads": graph.heads})
+    return arrays
+
+
+# ---------------------------------------------------------------- query kernel
+# written in the numba subset: it runs compiled over NumPy arrays, or as Python over memoryviews
+
+@jit
+def _ch_query(f_indptr, f_heads, f_weights, b_indptr, b_heads, b_weights, sources, targets, costs, meets,
+              dist_f, dist_b, pred_f, pred_b, touched) -> int:
+    """Bidirectional upward searches for every (sources[q], targets[q]); returns the nodes settled.
+
+    Writes the cost to costs[q] (inf if unreachable) and the meeting node to meets[q] (-1), and the
+    predecessor nodes of the last query to pred_f and pred_b. dist_f and dist_b are inf on entry and
+    on return: only the nodes recorded in touched are reset.
+    """
+    settled = 0
+    for q in range(len(sources)):
+        s = sources[q]
+        t = targets[q]
+        dist_f[s] = 0.0
+        pred_f[s] = -1
+        dist_b[t] = 0.0
+        pred_b[t] = -1
+        touched[0] = s
+        touched[1] = t
+        n_touched = 2
+        heap_f = [(0.0, s)]
+        heap_b = [(0.0, t)]
+        best = math.inf
+        meet = -1
+        while heap_f or heap_b:
+            top_f = heap_f[0][0] if heap_f else math.inf
+            top_b = heap_b[0][0] if heap_b else math.inf
+            # each search stops once it cannot improve on best
+            if top_f >= best and top_b >= best:
+                break
+            if top_f <= top_b:
+                d, u = heapq.heappop(heap_f)
+                if d > dist_f[u]:
+                    continue
+                if d + dist_b[u] < best:
+                    best = d + dist_b[u]
+                    meet = u
+                # stall on demand: a shorter way down from a more important node means u is not on an up path
+                stalled = False
+                for r in range(b_indptr[u], b_indptr[u + 1]):
+                    if dist_f[b_heads[r]] + b_weights[r] < d:
+                        stalled = True
+                        break
+                if stalled:
+                    continue
+                settled += 1
+                for e in range(f_indptr[u], f_indptr[u + 1]):
+                    v = f_heads[e]
+                    nd = d + f_weights[e]
+                    if nd < dist_f[v]:
+                        if dist_f[v] == math.inf and dist_b[v] == math.inf:
+                            touched[n_touched] = v
+                            n_touched += 1
+                        dist_f[v] = nd
+                        pred_f[v] = u
+                        heapq.heappush(heap_f, (nd, v))
+            else:
+                d, u = heapq.heappop(heap_b)
+                if d > dist_b[u]:
+                    continue
+                if d + dist_f[u] < best:
+                    best = d + dist_f[u]
+                    meet = u
+                stalled = False
+                for e in range(f_indptr[u], f_indptr[u + 1]):
+                    if dist_b[f_heads[e]] + f_weights[e] < d:
+                        stalled = True
+                        break
+                if stalled:
+                    continue
+                settled += 1
+                for r in range(b_indptr[u], b_indptr[u + 1]):
+                    v = b_heads[r]
+                    nd = d + b_weights[r]
+                    if nd < dist_b[v]:
+                        if dist_f[v] == math.inf and dist_b[v] == math.inf:
+                            touched[n_touched] = v
+                            n_touched += 1
+                        dist_b[v] = nd
+                        pred_b[v] = u
+                        heapq.heappush(heap_b, (nd, v))
+        costs[q] = best
+        meets[q] = meet
+        for i in range(n_touched):
+            dist_f[touched[i]] = math.inf
+            dist_b[touched[i]] = math.inf
+    return settled
+
+
+# ---------------------------------------------------------------- file layout
+# magic, header length (8 bytes little endian), JSON header, then the arrays at multiples of _ALIGN
+
+def _write_arrays(path: str, arrays: dict, meta: dict) -> None:
+    import numpy as np
+
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    for name, array in arrays.items():
+        if array.dtype.hasobject:
+            raise ValueError(f"Column '{name}' of dtype object cannot be stored, ids should be numeric.")
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += -(-array.nbytes // _ALIGN) * _ALIGN
+    header = json.dumps({"format": _CH_FORMAT, "meta": meta, "arrays": layout}).encode("utf-8")
+    data_start = -(-(len(_CH_MAGIC) + 8 + len(header)) // _ALIGN) * _ALIGN
+
+    def write(tmp_name):
+        with open(tmp_name, "wb") as f:
+            f.write(_CH_MAGIC + len(header).to_bytes(8, "little") + header)
+            for name, array in arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(array.tobytes())
+            f.truncate(data_start + offset)
+
+    _atomic_write(Path(path), write)
+
+
+def _read_arrays(path: str, mmap: bool) -> tuple[dict, dict]:
+    import numpy as np
+
+    with open(path, "rb") as f:
+        magic = f.read(len(_CH_MAGIC))
+        header_size = int.from_bytes(f.read(8), "little")
+        try:
+            header = json.loads(f.read(header_size).decode("utf-8")) if magic == _CH_MAGIC else {}
+        except ValueError:
+            header = {}
+    if header.get("format") != _CH_FORMAT:
+        raise ValueError(f"{path} is not a contraction hierarchy file of format {_CH_FORMAT}.")
+    data_start = -(-(len(_CH_MAGIC) + 8 + header_size) // _ALIGN) * _ALIGN
+
+    buffer = np.memmap(path, dtype="uint8", mode="r") if mmap else np.fromfile(path, dtype="uint8")
+    arrays = {}
+    for name, layout in header["arrays"].items():
+        dtype = np.dtype(layout["dtype"])
+        start = data_start + layout["offset"]
+        size = math.prod(layout["shape"]) * dtype.itemsize
+        arrays[name] = buffer[start:start + size].view(dtype).reshape(layout["shape"])
+    return arrays, header["meta"]
+
+
+class ContractionHierarchy:
+    """A contraction hierarchy of a CSRGraph, for many point-to-point queries on a static network.
+
+    Preprocessing takes time (minutes for a regional network in pure Python) and is paid once: save
+    the hierarchy with save() and memory-map it back with load() for every later run. A query settles
+    only a few hundred nodes on road networks. Queries share search buffers, use one hierarchy per
+    thread.
+
+    Args:
+        graph (CSRGraph): the network.
+        witness_limit (int): nodes settled at most by a witness search; smaller contracts faster,
+            with more shortcuts. Defaults to 64.
+        verbose (bool): show progress bars. Defaults to False.
+
+    Examples:
+        >>> from pyufunc import gmns_read_link, CSRGraph, ContractionHierarchy
+        >>> links = gmns_read_link(link_file=r"../dataset/ASU/link.csv", as_table=True)
+        >>> graph = CSRGraph.from_links(links, weight="free_flow_time")
+        >>> ch = ContractionHierarchy(graph)
+        >>> ch.save("network.ch")
+        >>> ch = ContractionHierarchy.load("network.ch", graph=graph)
+        >>> ch.cost(1, 100)
+        12.5
+        >>> ch.shortest_path(1, 100).links
+        [3, 18, ...]
+        >>> ch.costs([1, 2, 3], [100, 200, 300])
+        array([12.5, 7.25, inf])
+    """
+    __slots__ = ("_arrays", "digest", "node_index", "_buffers")
+
+    @requires("numpy", "tqdm")
+    def __init__(self, graph: CSRGraph, witness_limit: int = 64, verbose: bool = False):
+        if witness_limit < 1:
+            raise ValueError(f"witness_limit should be positive, but got {witness_limit}.")
+        self._arrays = _contract(graph, witness_limit, verbose)
+        self.digest = _graph_digest(graph)
+        self.node_index = graph.node_index
+        self._buffers = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.n_nodes} nodes, {self.n_shortcuts} shortcuts)"
+
+    @property
+    def n_nodes(self) -> int:
+        """The number of nodes."""
+        return len(self._arrays["rank"])
+
+    @property
+    def n_shortcuts(self) -> int:
+        """The number of shortcuts added by the contraction."""
+        return int((self._arrays["edge_first"] >= 0).sum())
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the hierarchy arrays, memory-mapped or not."""
+        return sum(array.nbytes for array in self._arrays.values())
+
+    def save(self, path: str) -> None:
+        """Store the hierarchy in one file (replaced atomically), to be memory-mapped by load.
+
+        Args:
+            path (str): the file.
+
+        Raises:
+            ValueError: if node or link ids are not numeric.
+        """
+        _write_arrays(path, self._arrays, {"digest": self.digest})
+
+    @classmethod
+    @requires("numpy")
+    def load(cls, path: str, graph: CSRGraph | None = None, mmap: bool = True) -> ContractionHierarchy:
+        """Load a hierarchy stored by save.
+
+        Args:
+            path (str): the file.
+            graph (CSRGraph | None): the network the hierarchy should belong to, checked against the
+                network it was built from. Defaults to None, not checked.
+            mmap (bool): memory-map the arrays (read-only, paged in as queries touch them) instead of
+                reading the file into memory. Defaults to True.
+
+        Raises:
+            ValueError: if the file is not a hierarchy, or was built from another network than graph.
+
+        Returns:
+            ContractionHierarchy: the hierarchy.
+        """
+        arrays, meta = _read_arrays(os.fspath(path), mmap)
+        if set(arrays) != set(_ARRAYS):
+            raise ValueError(f"{path} is missing arrays {sorted(set(_ARRAYS) - set(arrays))}.")
+        if graph is not None and _graph_digest(graph) != meta["digest"]:
+            raise ValueError(f"{path} was built from another version of the network.")
+        ch = cls.__new__(cls)
+        ch._arrays = arrays
+        ch.digest = meta["digest"]
+        ch.node_index = graph.node_index if graph is not None else IdIndex(arrays["node_ids"])
+        ch._buffers = None
+        return ch
+
+    def _query(self, sources, targets) -> tuple:
+        """(costs, meets, nodes settled) of the queries; the predecessors of the last one stay in the buffers."""
+        import numpy as np
+
+        if self._buffers is None:
+            n = self.n_nodes
+            self._buffers = (np.full(n, np.inf), np.full(n, np.inf), np.full(n, -1, dtype="int64"),
+                             np.full(n, -1, dtype="int64"), np.empty(2 * n + 2, dtype="int64"))
+        arrays = self._arrays
+        rank = arrays["rank"]
+        sources = np.ascontiguousarray(rank[self.node_index.to_index(sources)])
+        targets = np.ascontiguousarray(rank[self.node_index.to_index(targets)])
+        costs = np.empty(len(sources))
+        meets = np.empty(len(sources), dtype="int64")
+        settled = _ch_query(*_kernel_args(_ch_query, *(arrays[name] for name in _ARRAYS[1:4]),
+                                          *(arrays[name] for name in _ARRAYS[5:8]),
+                                          sources, targets, costs, meets, *self._buffers))
+        return costs, meets, settled
+
+    def cost(self, source, target) -> float:
+        """The shortest path cost from source to target.
+
+        Raises:
+            KeyError: if source or target is not a node of the network.
+
+        Returns:
+            float: the cost, inf if target is not reachable.
+        """
+        return float(self._query([source], [target])[0][0])
+
+    def costs(self, sources, targets) -> np.ndarray:
+        """Shortest path costs of many (source, target) pairs, in one call of the query kernel.
+
+        Args:
+            sources (array-like): source node ids.
+            targets (array-like): target node ids, one per source.
+
+        Raises:
+            KeyError: if a node is not in the network.
+            ValueError: if sources and targets differ in length.
+
+        Returns:
+            np.ndarray: the cost of every pair, inf where the target is not reachable.
+        """
+        import numpy as np
+
+        sources, targets = np.atleast_1d(sources), np.atleast_1d(targets)
+        if sources.shape != targets.shape or sources.ndim != 1:
+            raise ValueError("sources and targets should be one-dimensional and of the same length.")
+        return self._query(sources, targets)[0]
+
+    def shortest_path(self, source, target) -> ShortestPath:
+        """The shortest path from source to target, shortcuts unpacked to the original links.
+
+        Raises:
+            KeyError: if source or target is not a node of the network.
+
+        Returns:
+            ShortestPath: the cost and the node and link ids of the path; cost inf if target is not reachable.
+        """
+        import numpy as np
+
+        costs, meets, settled = self._query([source], [target])
+        meet = int(meets[0])
+        if meet < 0:
+            return ShortestPath(settled=settled)
+        arrays = self._arrays
+        _, _, pred_f, pred_b, _ = self._buffers
+
+        # up from the source to the meeting node, then down to the target, as hierarchy edges
+        edges = []
+        v = meet
+        while pred_f[v] >= 0:
+            u = int(pred_f[v])
+            edges.append(self._edge(arrays["f_indptr"], arrays["f_heads"], arrays["f_edges"], u, v))
+            v = u
+        edges.reverse()
+        v = meet
+        while pred_b[v] >= 0:
+            x = int(pred_b[v])
+            edges.append(self._edge(arrays["b_indptr"], arrays["b_heads"], arrays["b_edges"], x, v))
+            v = x
+
+        positions = []
+        first, second, link = arrays["edge_first"], arrays["edge_second"], arrays["edge_link"]
+        for edge in edges:
+            stack = [edge]
+            while stack:
+                e = stack.pop()
+                if first[e] < 0:
+                    positions.append(int(link[e]))
+                else:
+                    stack.append(int(second[e]))
+                    stack.append(int(first[e]))
+
+        positions = np.asarray(positions, dtype="int64")
+        nodes = np.concatenate([[self.node_index.index_of(source)], arrays["link_heads"][positions]])
+        return ShortestPath(cost=float(costs[0]), nodes=arrays["node_ids"][nodes.astype("int64")].tolist(),
+                            links=arrays["link_ids"][positions].tolist(), settled=settled)
+
+    @staticmethod
+    def _edge(indptr, heads, edges, node: int, head: int) -> int:
+        """The hierarchy edge stored at node towards head."""
+        for slot in range(indptr[node], indptr[node + 1]):
+            if heads[slot] == head:
+                return int(edges[slot])
+        raise KeyError((node, head))
@@ -5,8 +5,11 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
+import math
 from math import pi as PI
-from math import sin, cos, sqrt, fabs, atan2
+from math import sin, cos, sqrt, atan2
+from pyufunc.util_magic import batch, jit
+from pyufunc.util_magic._batch import _to_float_array
 
 
 def cvt_gcj02_to_baidu09(gcj_lng: float, gcj_lat: float) -> tuple[float, float]:
@@ -110,6 +113,7 @@ def cvt_baidu09_to_gcj02(baidu_lng: float, baidu_lat: float) -> tuple[float, flo
     return (gcj_lng, gcj_lat)
 
 
+@batch
 def cvt_wgs84_to_gcj02(wgs84_lng: float, wgs84_lat: float) -> tuple[float, float]:
     """Convert coordinate from WGS84 to GCJ02. GCJ02 also known as Mars coordinate system.
 
@@ -324,19 +328,20 @@ def cvt_wgs84_to_baidu09(wgs84_lng: float, wgs84_lat: float) -> tuple[float, flo
     return (baidu_lng, baidu_lat)
 
 
-def _cvt_lat(lng: float, lat: float) -> float:
+def _cvt_lat(lng: float, lat: float, xp=math) -> float:
     """latitude adjustment based on the longitude and latitude.
 
     Args:
         x (float): longitude
         y (float): latitude
+        xp (module): math for scalars, numpy for arrays. Defaults to math.
 
     Returns:
         float: latitude adjustment on spherical coordinate system.
     """
-
+    sin = xp.sin
     ret = -100.0 + 2.0 * lng + 3.0 * lat + 0.2 * \
-        lat * lat + 0.1 * lng * lat + 0.2 * sqrt(fabs(lng))
+        lat * lat + 0.1 * lng * lat + 0.2 * xp.sqrt(xp.fabs(lng))
     ret = ret + (20.0 * sin(6.0 * lng * PI) + 20.0 *
                  sin(2.0 * lng * PI)) * 2.0 / 3.0
     ret = ret + (20.0 * sin(lat * PI) + 40.0 * sin(lat / 3.0 * PI)) * 2.0 / 3.0
@@ -345,21 +350,80 @@ def _cvt_lat(lng: float, lat: float) -> float:
     return ret
 
 
-def _cvt_lon(lng: float, lat: float) -> float:
+def _cvt_lon(lng: float, lat: float, xp=math) -> float:
     """longitude adjustment based on the longitude and latitude.
 
     Args:
         x (float): longitude
         y (float): latitude
+        xp (module): math for scalars, numpy for arrays. Defaults to math.
 
     Returns:
         float: longitude adjustment on spherical coordinate system.
     """
+    sin = xp.sin
     ret = 300.0 + lng + 2.0 * lat + 0.1 * lng * \
-        lng + 0.1 * lng * lat + 0.1 * sqrt(fabs(lng))
+        lng + 0.1 * lng * lat + 0.1 * xp.sqrt(xp.fabs(lng))
     ret = ret + (20.0 * sin(6.0 * lng * PI) + 20.0 *
                  sin(2.0 * lng * PI)) * 2.0 / 3.0
     ret = ret + (20.0 * sin(lng * PI) + 40.0 * sin(lng / 3.0 * PI)) * 2.0 / 3.0
     ret = ret + (150.0 * sin(lng / 12.0 * PI) + 300.0 *
                  sin(lng * PI / 30.0)) * 2.0 / 3.0
     return ret
+
+
+def _cvt_deltas_numpy(lng, lat, lat_delta, lng_delta) -> None:
+    import numpy as np
+
+    lat_delta[:] = _cvt_lat(lng, lat, np)
+    lng_delta[:] = _cvt_lon(lng, lat, np)
+
+
+@jit(fallback=_cvt_deltas_numpy)
+def _cvt_deltas(lng, lat, lat_delta, lng_delta) -> None:
+    """Latitude and longitude adjustments of coordinate arrays, _cvt_lat and _cvt_lon in one loop.
+
+    Compiled with numba when the JIT is on (see set_jit), otherwise _cvt_lat / _cvt_lon on NumPy arrays.
+    """
+    for i in range(lng.shape[0]):
+        x = lng[i]
+        y = lat[i]
+        common = 0.1 * x * y + (20.0 * math.sin(6.0 * x * PI) + 20.0 * math.sin(2.0 * x * PI)) * 2.0 / 3.0
+        lat_delta[i] = (-100.0 + 2.0 * x + 3.0 * y + 0.2 * y * y + 0.2 * math.sqrt(math.fabs(x)) + common
+                        + (20.0 * math.sin(y * PI) + 40.0 * math.sin(y / 3.0 * PI)) * 2.0 / 3.0
+                        + (160.0 * math.sin(y / 12.0 * PI) + 320.0 * math.sin(y * PI / 30.0)) * 2.0 / 3.0)
+        lng_delta[i] = (300.0 + x + 2.0 * y + 0.1 * x * x + 0.1 * math.sqrt(math.fabs(x)) + common
+                        + (20.0 * math.sin(x * PI) + 40.0 * math.sin(x / 3.0 * PI)) * 2.0 / 3.0
+                        + (150.0 * math.sin(x / 12.0 * PI) + 300.0 * math.sin(x * PI / 30.0)) * 2.0 / 3.0)
+
+
+@cvt_wgs84_to_gcj02.register_kernel
+def _cvt_wgs84_to_gcj02_array(wgs84_lng, wgs84_lat):
+    """Vectorized cvt_wgs84_to_gcj02 kernel: NaN for non-numeric or out-of-China coordinates."""
+    import numpy as np
+
+    lng = _to_float_array(wgs84_lng)
+    lat = _to_float_array(wgs84_lat)
+    lng, lat = np.broadcast_arrays(lng, lat)
+    # same validity checks as the scalar function, failed elements become NaN
+    valid = (72.004 <= lng) & (lng <= 137.8347) & (0.8293 <= lat) & (lat <= 55.8271)
+    lng = np.where(valid, lng, np.nan)
+    lat = np.where(valid, lat, np.nan)
+
+    a = 6378245.0
+    f = 1 / 298.3
+    b = a * (1 - f)
+    ee = 1 - b**2 / a**2
+
+    lat_delta = np.empty(lng.shape)
+    lng_delta = np.empty(lng.shape)
+    _cvt_deltas(np.ravel(lng - 105.0), np.ravel(lat - 35.0), lat_delta.reshape(-1), lng_delta.reshape(-1))
+
+    lat_radius = lat / 180.0 * PI
+    lat_0 = np.sin(lat_radius)
+    lat_1 = 1 - ee * lat_0 * lat_0
+    lat_2 = np.sqrt(lat_1)
+    lat_delta = (lat_delta * 180.0) / ((a * (1 - ee)) / (lat_1 * lat_2) * PI)
+    lng_delta = (lng_delta * 180.0) / (a / lat_2 * np.cos(lat_radius) * PI)
+
+    return (lng + lng_delta, lat + lat_delta)
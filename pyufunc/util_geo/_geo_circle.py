@@ -8,7 +8,7 @@ from __future__ import annotations
 import math
 from typing import TYPE_CHECKING, Any
 from collections.abc import Iterable
-from pyufunc.util_magic import requires
+from pyufunc.util_magic import requires, jit
 
 #  https://stackoverflow.com/questions/61384752/how-to-type-hint-with-an-optional-import
 if TYPE_CHECKING:
@@ -58,36 +58,30 @@ def to_degrees(angle_in_radians: float) -> float:
     return (angle_in_radians * 180) / math.pi
 
 
-def _offset(point: Point, distance: float, earth_radius: float, bearing: float) -> list:
+@jit
+def _offset(lon1: float, lat1: float, d_by_r: float, bearings, out) -> None:
     """
-    Calculate the new longitude and latitude by the distance and bearing from the original point.
+    Calculate the new longitudes and latitudes by the distance and bearings from the original point.
 
-    Args:
-        point (shapely.geometry.Point): the point of longitude and latitude in format POINT (longitude, latitude)
-        distance (float): the distance from the original point, unit is meter
-        earth_radius (float): the earth radius, unit is meter
-        bearing (float): the bearing from the original point, unit is radians
+    Compiled with numba when the JIT is on (see set_jit), plain Python otherwise.
 
-    Returns:
-        list: the new longitude and latitude in degree format [longitude, latitude]
+    Args:
+        lon1 (float): the longitude of the original point, unit is radians
+        lat1 (float): the latitude of the original point, unit is radians
+        d_by_r (float): the distance from the original point divided by the earth radius
+        bearings (np.ndarray): the bearings from the original point, unit is radians
+        out (np.ndarray): (n, 2) array receiving the new [longitude, latitude] in degrees
 
     """
-    from shapely.geometry import Point  # pyright: ignore[reportMissingModuleSource]
-
-    # TDD, test driven development: input validation
-    _validate(isinstance(point, Point), "the point should be a shapely.geometry.Point")
-
-    # convert longitude and latitude to radians
-    lon1 = to_radians(point.x)
-    lat1 = to_radians(point.y)
-
-    d_by_r = distance / earth_radius
+    for i in range(bearings.shape[0]):
+        bearing = bearings[i]
 
-    # calculate the new longitude and latitude
-    lat = math.asin(math.sin(lat1) * math.cos(d_by_r) + math.cos(lat1) * math.sin(d_by_r) * math.cos(bearing))
-    lon = lon1 + math.atan2(math.sin(bearing) * math.sin(d_by_r) * math.cos(lat1),
-                            math.cos(d_by_r) - math.sin(lat1) * math.sin(lat))
-    return [to_degrees(lon), to_degrees(lat)]
+        # calculate the new longitude and latitude
+        lat = math.asin(math.sin(lat1) * math.cos(d_by_r) + math.cos(lat1) * math.sin(d_by_r) * math.cos(bearing))
+        lon = lon1 + math.atan2(math.sin(bearing) * math.sin(d_by_r) * math.cos(lat1),
+                                math.cos(d_by_r) - math.sin(lat1) * math.sin(lat))
+        out[i, 0] = (lon * 180) / math.pi
+        out[i, 1] = (lat * 180) / math.pi
 
 
 @requires("shapely")
@@ -155,6 +149,7 @@ def create_circle_at_point_with_radius(point: Point | Iterable[float],
     if options is None:
         options = {"edges": 32, "bearing": 0, "direction": 1}
 
+    import numpy as np
     from shapely.geometry import Point  # pyright: ignore[reportMissingModuleSource]
 
     # TDD, test driven development: input validation
@@ -179,15 +174,10 @@ def create_circle_at_point_with_radius(point: Point | Iterable[float],
     direction = options["direction"]
 
     start = to_radians(bearing)
-    coordinates = [
-        _offset(
-            point,
-            radius,
-            earth_radius,
-            start + (direction * 2 * math.pi * -i) / edges,
-        )
-        for i in range(edges)
-    ]
+    bearings = np.array([start + (direction * 2 * math.pi * -i) / edges for i in range(edges)], dtype=float)
+    offsets = np.empty((edges, 2))
+    _offset(to_radians(point.x), to_radians(point.y), radius / earth_radius, bearings, offsets)
+    coordinates = offsets.tolist()
     # convert nested level 3 to level 2
     coordinates.append(coordinates[0])
 
@@ -6,11 +6,12 @@
 ##############################################################
 from __future__ import annotations
 import copy
+import math
 from typing import TYPE_CHECKING
 from collections.abc import Iterable
 import functools
 from pyufunc.util_geo._geo_circle import create_circle_at_point_with_radius
-from pyufunc.util_magic import func_running_time, requires
+from pyufunc.util_magic import func_running_time, requires, batch, jit
 
 # https://stackoverflow.com/questions/61384752/how-to-type-hint-with-an-optional-import
 if TYPE_CHECKING:
@@ -59,6 +60,7 @@ def proj_point_to_line(point: Point, line: LineString) -> Point:
     return line.interpolate(line.project(point))
 
 
+@batch
 @requires("numpy", "shapely")
 def calc_distance_on_unit_sphere(pt1: Point | tuple | list | np.array,
                                  pt2: Point | tuple | list | np.array,
@@ -137,6 +139,46 @@ def calc_distance_on_unit_sphere(pt1: Point | tuple | list | np.array,
     return np.arccos(cosine) * earth_radius
 
 
+def _point_columns(points) -> tuple:
+    """Longitudes and latitudes of a (n, 2) array or a sequence of points / (lon, lat) pairs, NaN if invalid."""
+    import numpy as np
+    from shapely.geometry import Point  # pyright: ignore[reportMissingModuleSource]
+
+    points = np.asarray(points)
+    if points.dtype != object and points.ndim == 2 and points.shape[1] >= 2:
+        coords = points[:, :2].astype(float)
+        return coords[:, 0], coords[:, 1]
+
+    coords = np.full((len(points), 2), np.nan)
+    for i, point in enumerate(points):
+        try:
+            coords[i] = (point.x, point.y) if isinstance(point, Point) else (float(point[0]), float(point[1]))
+        except (TypeError, ValueError, IndexError, AttributeError):
+            pass
+    return coords[:, 0], coords[:, 1]
+
+
+@calc_distance_on_unit_sphere.register_kernel
+def _calc_distance_on_unit_sphere_array(pt1, pt2, unit: str = "km"):
+    """Vectorized calc_distance_on_unit_sphere kernel for two sequences of points."""
+    import numpy as np
+
+    _validate(unit in {"meter", "km", "mile"}, "The input unit should be in 'meter', 'km', or 'mile'.")
+    earth_radius = {"meter": 6378137, "km": 6371.0, "mile": 3960.0}[unit]
+    degrees_to_radians = np.pi / 180.0
+
+    lon1, lat1 = _point_columns(pt1)
+    lon2, lat2 = _point_columns(pt2)
+    phi1 = (90.0 - lat1) * degrees_to_radians
+    phi2 = (90.0 - lat2) * degrees_to_radians
+    theta1 = lon1 * degrees_to_radians
+    theta2 = lon2 * degrees_to_radians
+
+    cosine = (np.sin(phi1) * np.sin(phi2) * np.cos(theta1 - theta2) + np.cos(phi1) * np.cos(phi2))
+    with np.errstate(invalid="ignore"):
+        return np.arccos(cosine) * earth_radius
+
+
 @requires("numpy")
 def calc_distance_on_unit_haversine(lon1: np.ndarray, lat1: np.ndarray,
                                     lon2: np.ndarray, lat2: np.ndarray, unit: str = "km") -> np.ndarray:
@@ -176,19 +218,42 @@ def calc_distance_on_unit_haversine(lon1: np.ndarray, lat1: np.ndarray,
     # the default earth radius in meters
     EARTH_RADIUS = {"meter": 6378137, "km": 6371.0, "mile": 3960.0}
 
-    # Convert latitude and longitude from degrees to radians
-    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-
     # get the earth radius
     earth_radius = EARTH_RADIUS.get(unit, 6371.0)
 
+    lon1, lat1, lon2, lat2 = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (lon1, lat1, lon2, lat2)))
+    distances = np.empty(lon1.shape)
+    _haversine(*(np.ravel(v) for v in (lon1, lat1, lon2, lat2)), float(earth_radius), distances.reshape(-1))
+    return distances[()] if distances.ndim == 0 else distances
+
+
+def _haversine_numpy(lon1, lat1, lon2, lat2, earth_radius: float, out) -> None:
+    import numpy as np
+
+    # Convert latitude and longitude from degrees to radians
+    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
+
     # Haversine formula
     dlat = lat2 - lat1
     dlon = lon2 - lon1
     a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
-    c = 2 * np.arcsin(np.sqrt(a))
+    out[:] = earth_radius * (2 * np.arcsin(np.sqrt(a)))
 
-    return earth_radius * c
+
+@jit(fallback=_haversine_numpy)
+def _haversine(lon1, lat1, lon2, lat2, earth_radius: float, out) -> None:
+    """Haversine distances of coordinate arrays in degrees, written to out.
+
+    Compiled with numba when the JIT is on (see set_jit), NumPy vectorized otherwise.
+    """
+    to_radians = math.pi / 180.0
+    for i in range(out.shape[0]):
+        phi1 = lat1[i] * to_radians
+        phi2 = lat2[i] * to_radians
+        half_dlat = (phi2 - phi1) / 2
+        half_dlon = (lon2[i] - lon1[i]) * to_radians / 2
+        a = math.sin(half_dlat) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(half_dlon) ** 2
+        out[i] = earth_radius * (2 * math.asin(math.sqrt(a)))
 
 
 @requires("shapely")
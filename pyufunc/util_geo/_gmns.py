@@ -7,24 +7,30 @@
 # GMNS: General Modeling Network Specification
 ##############################################################
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Iterator
 import os
 import itertools
-from dataclasses import dataclass, field, asdict, fields
-from multiprocessing import Pool
+import warnings
+import importlib.util
+from dataclasses import dataclass, field, asdict, fields, MISSING
 
 from pyufunc.util_magic._func_time_decorator import func_time
+from pyufunc.util_magic._executor import ParallelExecutor
 from pyufunc.util_pathio._path import path2linux
 from pyufunc.util_magic._dependency_requires_decorator import requires
 from pyufunc.__cfg import config_gmns
-from pyufunc.util_data_processing._dataclass import dataclass_extend, dataclass_from_dict
+from pyufunc.util_data_processing._dataclass import dataclass_from_dict
+from pyufunc.util_geo._gmns_csv import read_header, iter_csv_chunks, row_bytes
 
 
 if TYPE_CHECKING:
     import pandas as pd
+    from pyufunc.util_geo._gmns_table import NodeTable, LinkTable, POITable, ZoneTable
+    from pyufunc.util_geo._gmns_index import IdIndex
 
 __all__ = ['Node', 'Link', 'POI', 'Zone', 'Agent',
-           'read_node', 'read_poi', 'read_link', 'read_zone']
+           'read_node', 'read_poi', 'read_link', 'read_zone',
+           'iter_nodes', 'iter_pois', 'iter_links', 'iter_zones']
 
 
 @dataclass
@@ -309,364 +315,426 @@ class Link:
         return (self.from_node_id, self.to_node_id, {**self.as_dict(), **{"weight": self.length}})
 
 
-@requires("shapely")
-def _create_node_from_dataframe(df_node: pd.DataFrame) -> dict[int, Node]:
-    """Create Node from df_node.
+def _records_from_columns(cls: type, columns: dict, ids) -> dict:
+    """Build {id: row dict} from whole columns in one pass.
+
+    Rows have the fields of the dataclass cls first and then the extra columns, as asdict() of an
+    extended dataclass would; fields without a column take their default, a new one per row for
+    default factories.
 
     Args:
-        df_node (pd.DataFrame): the dataframe of node from node.csv
+        cls (type): the GMNS dataclass, e.g. Node.
+        columns (dict): {field name: array or list of values}, one value per row.
+        ids (array-like): the row keys.
 
     Returns:
-        dict[int, Node]: a dict of nodes.{node_id: Node}
+        dict: {id: {field name: value}}
     """
+    ids = ids.tolist() if hasattr(ids, "tolist") else list(ids)
+    n = len(ids)
+    columns = {name: values.tolist() if hasattr(values, "tolist") else values for name, values in columns.items()}
+    field_names = []
+    for f in fields(cls):
+        field_names.append(f.name)
+        if f.name not in columns:
+            if f.default_factory is not MISSING:
+                columns[f.name] = [f.default_factory() for _ in range(n)]
+            else:
+                columns[f.name] = itertools.repeat(f.default, n)
+    keys = field_names + [name for name in columns if name not in field_names]
+    rows = (dict(zip(keys, values)) for values in zip(*(columns[key] for key in keys)))
+    return dict(zip(ids, rows))
+
+
+def _int_ids(values: pd.Series, kind: str):
+    """An id column as an int64 array, raising on the first value that is not an integer."""
+    import pandas as pd
+
+    numeric = pd.to_numeric(values, errors="coerce")
+    invalid = numeric.isna() | (numeric % 1 != 0)
+    if invalid.any():
+        raise Exception(f"  : Unable to create {kind}: {values[invalid].iloc[0]}, error: invalid {kind} id")
+    return numeric.to_numpy(dtype="int64")
+
 
+def _float_column(df: pd.DataFrame, col: str, kind: str):
+    """A column as a float64 array, raising if a value is not a number."""
+    import pandas as pd
+
+    try:
+        return pd.to_numeric(df[col], errors="raise").to_numpy(dtype="float64")
+    except Exception as e:
+        raise Exception(f"  : Unable to create {kind}, invalid {col}: {e}") from e
+
+
+def _from_wkt(values: pd.Series, kind: str):
+    """Parse a column of WKT strings into an array of shapely geometries."""
     import shapely  # pyright: ignore[reportMissingModuleSource]
 
-    # Reset index to avoid index error
-    df_node = df_node.reset_index(drop=True)
-    col_names = df_node.columns.tolist()
+    try:
+        return shapely.from_wkt(values.astype(str).to_numpy(dtype=object), on_invalid="raise")
+    except Exception as e:
+        raise Exception(f"  : Unable to create {kind}, invalid {values.name}: {e}") from e
 
-    if "node_id" in col_names:
-        col_names.remove("node_id")
 
-    # get node dataclass fields
-    # Get the list of attribute names
-    node_attr_names = [f.name for f in fields(Node)]
+def _point_wkb(x_coord, y_coord):
+    """WKB bytes (little endian) of points, packed with NumPy instead of creating shapely points."""
+    import numpy as np
 
-    # check difference between node_attr_names and col_names
-    diff = list(set(col_names) - set(node_attr_names))
+    points = np.empty(len(x_coord), dtype=np.dtype([("order", "u1"), ("type", "<u4"), ("x", "<f8"), ("y", "<f8")]))
+    points["order"] = 1
+    points["type"] = 1
+    points["x"] = x_coord
+    points["y"] = y_coord
+    raw = points.tobytes()
+    size = points.dtype.itemsize
+    wkb = np.empty(len(points), dtype=object)
+    wkb[:] = [raw[i:i + size] for i in range(0, len(raw), size)]
+    return wkb
 
-    # create attributes for node class if diff is not empty
-    if diff:
-        diff_attr = [(val, str, "") for val in diff]
-        Node_ext = dataclass_extend(Node, diff_attr)
-    else:
-        Node_ext = Node
 
-    node_dict = {}
-    for i in range(len(df_node)):
-        try:
-            # check whether zone_id field in node.csv or not
-            # if zone_id field exists and is not empty, assign it to _zone_id
-            try:
-                _zone_id = int(str(df_node.loc[i, 'zone_id']))
-                if pd.isna(_zone_id) or _zone_id in {"", " ", None}:
-                    _zone_id = -1
-            except Exception:
-                _zone_id = -1
+@requires("pandas")
+def _node_columns(df_node: pd.DataFrame) -> tuple:
+    """Node ids and attribute columns (NumPy arrays) of df_node, every column becomes an attribute.
 
-            # get node id
-            node_id = int(str(df_node.loc[i, 'node_id']))
-            x_coord = float(str(df_node.loc[i, 'x_coord']))
-            y_coord = float(str(df_node.loc[i, 'y_coord']))
+    The point geometries are WKB bytes, see _create_node_from_dataframe for shapely points.
+    """
 
-            node = Node_ext()
+    import pandas as pd
+    import numpy as np
 
-            for col in col_names:
-                setattr(node, col, df_node.loc[i, col])
+    node_ids = _int_ids(df_node["node_id"], "node")
+    x_coord = _float_column(df_node, "x_coord", "node")
+    y_coord = _float_column(df_node, "y_coord", "node")
 
-            node.id = node_id
-            node._zone_id = _zone_id
-            node.geometry = shapely.Point(x_coord, y_coord)
+    columns = {col: df_node[col].to_numpy() for col in df_node.columns if col != "node_id"}
 
-            node_dict[node_id] = asdict(node)
+    # if zone_id field exists and holds an integer, assign it to _zone_id, otherwise -1
+    if "zone_id" in df_node.columns:
+        zone_id = pd.to_numeric(df_node["zone_id"], errors="coerce")
+        columns["_zone_id"] = zone_id.where(zone_id % 1 == 0, -1).to_numpy(dtype="int64")
+    else:
+        columns["_zone_id"] = np.full(len(node_ids), -1, dtype="int64")
 
-        except Exception as e:
-            raise Exception(f"  : Unable to create node: {node_id}, error: {e}") from e
+    columns["id"] = node_ids
+    columns["geometry"] = _point_wkb(x_coord, y_coord)
+    return node_ids, columns
 
-    return node_dict
 
+@requires("pandas", "shapely")
+def _create_node_from_dataframe(df_node: pd.DataFrame) -> dict[int, Node]:
+    """Create Node from df_node.
 
-@requires("shapely", "pyproj")
-def _create_poi_from_dataframe(df_poi: pd.DataFrame) -> dict[int, POI]:
-    """Create POI from df_poi.
+    Columns are converted as a whole; every column of df_node becomes a node attribute.
 
     Args:
-        df_poi (pd.DataFrame): the dataframe of poi from poi.csv
+        df_node (pd.DataFrame): the dataframe of node from node.csv
 
     Returns:
-        dict[int, POI]: a dict of POIs.{poi_id: POI}
+        dict[int, Node]: a dict of nodes.{node_id: Node}
     """
     import shapely  # pyright: ignore[reportMissingModuleSource]
+
+    node_ids, columns = _node_columns(df_node)
+    columns["geometry"] = shapely.points(columns["x_coord"], columns["y_coord"])
+    return _records_from_columns(Node, columns, node_ids)
+
+
+@requires("pandas", "shapely", "pyproj")
+def _poi_columns(df_poi: pd.DataFrame) -> tuple:
+    """POI ids and attribute columns (NumPy arrays) of df_poi.
+
+    A missing (or zero) area is computed in one pass from the polygons projected to UTM.
+    """
+    import pandas as pd
+    import numpy as np
+    import shapely  # pyright: ignore[reportMissingModuleSource]
     import pyproj  # pyright: ignore[reportMissingImports]
 
-    df_poi = df_poi.reset_index(drop=True)
-    col_names = df_poi.columns.tolist()
+    poi_ids = _int_ids(df_poi["poi_id"], "poi")
+    centroids = _from_wkt(df_poi["centroid"], "poi")
 
-    if "poi_id" in col_names:
-        col_names.remove("poi_id")
+    columns = {col: df_poi[col].to_numpy() for col in df_poi.columns if col != "poi_id"}
 
-    # get node dataclass fields
-    # Get the list of attribute names
-    poi_attr_names = [f.name for f in fields(POI)]
+    area = df_poi["area"]
+    area_numeric = pd.to_numeric(area, errors="coerce")
+    area_values = area.to_numpy(dtype=object, copy=True)
 
-    # check difference between node_attr_names and col_names
-    diff = list(set(col_names) - set(poi_attr_names))
+    # check if area is empty or not
+    missing = (area.isna() | (area_numeric == 0) | (area.astype(str) == "")).to_numpy()
+    if missing.any():
+        geometry_shapely = _from_wkt(df_poi["geometry"][missing], "poi")
 
-    # create attributes for node class if diff is not empty
-    if diff:
-        diff_attr = [(val, Any, "") for val in diff]
-        POI_ext = dataclass_extend(POI, diff_attr)
-    else:
-        POI_ext = POI
+        # Set up a Transformer to convert from WGS 84 to UTM zone 18N (EPSG:32618)
+        transformer = pyproj.Transformer.from_crs("EPSG:4326", "EPSG:32618", always_xy=True)
 
-    poi_dict = {}
+        def to_utm(coords):
+            return np.column_stack(transformer.transform(coords[:, 0], coords[:, 1]))
 
-    for i in range(len(df_poi)):
-        try:
-            centroid = shapely.from_wkt(str(df_poi.loc[i, 'centroid']))
+        # Transform the polygon's exterior coordinates to UTM, area in square meters
+        exteriors = shapely.transform(shapely.get_exterior_ring(geometry_shapely), to_utm)
+        area_values[missing] = shapely.area(shapely.polygons(exteriors))
 
-            # check if area is empty or not
-            area = df_poi.loc[i, 'area']
-            if pd.isna(area) or not area:
-                geometry_shapely = shapely.from_wkt(str(df_poi.loc[i, 'geometry']))
+    area_values[(area_numeric > 90000).to_numpy() & ~missing] = 0
 
-                # Set up a Transformer to convert from WGS 84 to UTM zone 18N (EPSG:32618)
-                transformer = pyproj.Transformer.from_crs(
-                    "EPSG:4326", "EPSG:32618", always_xy=True)
+    columns["id"] = poi_ids
+    columns["x_coord"] = shapely.get_x(centroids)
+    columns["y_coord"] = shapely.get_y(centroids)
+    columns["area"] = area_values
+    return poi_ids, columns
 
-                # Transform the polygon's coordinates to UTM
-                transformed_coords = [transformer.transform(
-                    x, y) for x, y in geometry_shapely.exterior.coords]
-                transformed_polygon = shapely.Polygon(transformed_coords)
 
-                # square meters
-                area_sqm = transformed_polygon.area
+@requires("pandas", "shapely", "pyproj")
+def _create_poi_from_dataframe(df_poi: pd.DataFrame) -> dict[int, POI]:
+    """Create POI from df_poi.
 
-                # square feet
-                # area = area_sqm * 10.7639104
+    Columns are converted as a whole; a missing (or zero) area is computed in one pass from the
+    polygons projected to UTM.
 
-                area = area_sqm
+    Args:
+        df_poi (pd.DataFrame): the dataframe of poi from poi.csv
 
-            elif float(area) > 90000:
-                area = 0
-            # get poi id
-            poi_id = int(str(df_poi.loc[i, 'poi_id']))
+    Returns:
+        dict[int, POI]: a dict of POIs.{poi_id: POI}
+    """
+    poi_ids, columns = _poi_columns(df_poi)
+    return _records_from_columns(POI, columns, poi_ids)
 
-            poi = POI_ext()
 
-            for col in col_names:
-                setattr(poi, col, df_poi.loc[i, col])
+@requires("shapely")
+def _zone_geometry_columns(df_zone: pd.DataFrame) -> tuple:
+    """Zone ids and attribute columns (NumPy arrays) of df_zone, centroids and bounds from the polygons."""
+
+    import shapely  # pyright: ignore[reportMissingModuleSource]
 
-            poi.id = poi_id
-            poi.x_coord = centroid.x
-            poi.y_coord = centroid.y
-            poi.area = area
+    zone_ids = df_zone["zone_id"].to_numpy()
+    zone_geometry_shapely = _from_wkt(df_zone["geometry"], "zone")
+    centroids = shapely.centroid(zone_geometry_shapely)
+    bounds = shapely.bounds(zone_geometry_shapely)
 
-            poi_dict[poi_id] = asdict(poi)
-        except Exception as e:
-            raise Exception(f"  : Unable to create poi: {poi_id}, error: {e}") from e
-    return poi_dict
+    columns = {col: df_zone[col].to_numpy() for col in df_zone.columns if col != "zone_id"}
+    columns["id"] = zone_ids
+    columns["name"] = zone_ids
+    columns["x_coord"] = shapely.get_x(centroids)
+    columns["y_coord"] = shapely.get_y(centroids)
+    columns["centroid"] = shapely.to_wkt(centroids, rounding_precision=-1)
+    columns["x_min"] = bounds[:, 0]
+    columns["y_min"] = bounds[:, 1]
+    columns["x_max"] = bounds[:, 2]
+    columns["y_max"] = bounds[:, 3]
+    return zone_ids, columns
 
 
 @requires("shapely")
 def _create_zone_from_dataframe_by_geometry(df_zone: pd.DataFrame) -> dict[int, Zone]:
     """Create Zone from df_zone.
 
+    Centroids and bounds are computed for all zone polygons at once.
+
     Args:
         df_zone (pd.DataFrame): the dataframe of zone from zone.csv, the required fields are: [zone_id, geometry]
 
     Returns:
         dict[int, Zone]: a dict of Zones.{zone_id: Zone}
     """
+    zone_ids, columns = _zone_geometry_columns(df_zone)
+    return _records_from_columns(Zone, columns, zone_ids)
 
-    import shapely  # pyright: ignore[reportMissingModuleSource]
 
-    df_zone = df_zone.reset_index(drop=True)
-    col_names = df_zone.columns.tolist()
+@requires("shapely")
+def _zone_centroid_columns(df_zone: pd.DataFrame) -> tuple:
+    """Zone ids and attribute columns (NumPy arrays) of df_zone, centroids from x_coord / y_coord."""
 
-    if "zone_id" in col_names:
-        col_names.remove("zone_id")
+    import numpy as np
+    import shapely  # pyright: ignore[reportMissingModuleSource]
 
-    # get node dataclass fields
-    # Get the list of attribute names
-    zone_attr_names = [f.name for f in fields(Zone)]
+    zone_ids = df_zone["zone_id"].to_numpy()
+    x_coord = _float_column(df_zone, "x_coord", "zone")
+    y_coord = _float_column(df_zone, "y_coord", "zone")
 
-    # check difference between node_attr_names and col_names
-    diff = list(set(col_names) - set(zone_attr_names))
+    columns = {col: df_zone[col].to_numpy() for col in df_zone.columns if col != "zone_id"}
+    columns["id"] = zone_ids
+    columns["name"] = zone_ids
+    columns["centroid"] = shapely.to_wkt(shapely.points(x_coord, y_coord), rounding_precision=-1)
 
-    # create attributes for node class if diff is not empty
-    if diff:
-        diff_attr = [(val, Any, "") for val in diff]
-        Zone_ext = dataclass_extend(Zone, diff_attr)
-    else:
-        Zone_ext = Zone
-
-    zone_dict = {}
-
-    for i in range(len(df_zone)):
-        try:
-            zone_id = df_zone.loc[i, 'zone_id']
-            zone_geometry = df_zone.loc[i, 'geometry']
-
-            zone_geometry_shapely = shapely.from_wkt(zone_geometry)
-            centroid_wkt = zone_geometry_shapely.centroid.wkt
-            x_coord = zone_geometry_shapely.centroid.x
-            y_coord = zone_geometry_shapely.centroid.y
-
-            zone = Zone_ext()
-
-            for col in col_names:
-                setattr(zone, col, df_zone.loc[i, col])
-
-            zone.id = zone_id
-            zone.name = zone_id
-            zone.x_coord = x_coord
-            zone.y_coord = y_coord
-            zone.centroid = centroid_wkt
-            zone.x_min = zone_geometry_shapely.bounds[0]
-            zone.y_min = zone_geometry_shapely.bounds[1]
-            zone.x_max = zone_geometry_shapely.bounds[2]
-            zone.y_max = zone_geometry_shapely.bounds[3]
-
-            # save zone to zone_dict
-            zone_dict[zone_id] = asdict(zone)
-        except Exception as e:
-            raise Exception(f"  : Unable to create zone: {zone_id}, error: {e}") from e
-    return zone_dict
+    # load zone geometry
+    if "geometry" not in columns:
+        columns["geometry"] = np.full(len(zone_ids), "", dtype=object)
+    return zone_ids, columns
 
 
 @requires("shapely")
 def _create_zone_from_dataframe_by_centroid(df_zone: pd.DataFrame) -> dict[int, Zone]:
     """Create Zone from df_zone.
 
+    Centroid points are created for all zones at once.
+
     Args:
         df_zone (pd.DataFrame): the dataframe of zone from zone.csv, the required fields are: [zone_id, geometry]
 
     Returns:
         dict[int, Zone]: a dict of Zones.{zone_id: Zone}
     """
+    zone_ids, columns = _zone_centroid_columns(df_zone)
+    return _records_from_columns(Zone, columns, zone_ids)
 
-    import shapely  # pyright: ignore[reportMissingModuleSource]
 
-    df_zone = df_zone.reset_index(drop=True)
-    col_names = df_zone.columns.tolist()
+def _link_columns(df_link: pd.DataFrame) -> tuple:
+    """Link ids and attribute columns (NumPy arrays) of df_link, allowed_uses is stored as mode_type."""
 
-    if "zone_id" in col_names:
-        col_names.remove("zone_id")
+    link_ids = df_link["link_id"].to_numpy()
 
-    # get node dataclass fields
-    # Get the list of attribute names
-    zone_attr_names = [f.name for f in fields(Zone)]
+    columns = {col: df_link[col].to_numpy() for col in df_link.columns if col not in ("link_id", "allowed_uses")}
+    columns["id"] = link_ids
+    if "allowed_uses" in df_link.columns:
+        columns["mode_type"] = df_link["allowed_uses"].to_numpy()
+    return link_ids, columns
 
-    # check difference between node_attr_names and col_names
-    diff = list(set(col_names) - set(zone_attr_names))
 
-    # create attributes for node class if diff is not empty
-    if diff:
-        diff_attr = [(val, Any, "") for val in diff]
-        Zone_ext = dataclass_extend(Zone, diff_attr)
-    else:
-        Zone_ext = Zone
+def _create_link_from_dataframe(df_link: pd.DataFrame) -> dict[int, Link]:
+    """Create Link from df_link.
 
-    zone_dict = {}
+    Every column of df_link becomes a link attribute, allowed_uses is stored as mode_type.
 
-    for i in range(len(df_zone)):
-        try:
-            zone_id = df_zone.loc[i, 'zone_id']
-            x_coord = df_zone.loc[i, 'x_coord']
-            y_coord = df_zone.loc[i, 'y_coord']
+    Args:
+        df_link (pd.DataFrame): dataframe of link from link.csv
 
-            # load zone geometry
-            try:
-                zone_geometry = df_zone.loc[i, 'geometry']
-            except Exception:
-                zone_geometry = ""
+    Returns:
+        dict[int, Link]: a dict of Link.{link_id: Link}
+    """
+    link_ids, columns = _link_columns(df_link)
+    return _records_from_columns(Link, columns, link_ids)
 
-            zone_centroid_shapely = shapely.Point(x_coord, y_coord)
-            centroid_wkt = zone_centroid_shapely.wkt
 
-            zone = Zone_ext()
+# main functions for reading node, poi, link, zone files and network
 
-            for col in col_names:
-                setattr(zone, col, df_zone.loc[i, col])
 
-            zone.id = zone_id
-            zone.name = zone_id
-            zone.centroid = centroid_wkt
-            zone.geometry = zone_geometry
+# known column types, so the csv engine does not infer them
+_NODE_DTYPES = {"x_coord": "float64", "y_coord": "float64"}
+_POI_DTYPES = {"centroid": "str", "geometry": "str"}
+_LINK_DTYPES = {"length": "float64", "free_speed": "float64", "capacity": "float64", "geometry": "str"}
+_ZONE_DTYPES = {"x_coord": "float64", "y_coord": "float64", "geometry": "str"}
 
-            # save zone to zone_dict
-            zone_dict[zone_id] = asdict(zone)
-        except Exception as e:
-            raise Exception(f"  : Unable to create zone: {zone_id}, error: {e}") from e
-    return zone_dict
 
+# blocks per worker, so that a slow block does not leave the other workers idle
+_BLOCKS_PER_WORKER = 4
+# rows per block at least, so that a block is worth sending to a worker
+_MIN_ROWS_PER_BLOCK = 10_000
 
-def _create_link_from_dataframe(df_link: pd.DataFrame) -> dict[int, Link]:
-    """Create Link from df_link.
 
-    Args:
-        df_link (pd.DataFrame): dataframe of link from link.csv
+def _chunk_plan(source: str, cpu_cores: int) -> tuple[int, int]:
+    """(workers, block_size in bytes) to parse source with.
 
-    Returns:
-        dict[int, Link]: a dict of Link.{link_id: Link}
+    A file smaller than config_gmns["parallel_min_size"] is parsed in this process: starting and
+    feeding worker processes would take longer than the parse. Otherwise blocks are sized from the
+    bytes per row so that every worker gets about _BLOCKS_PER_WORKER blocks of at least
+    _MIN_ROWS_PER_BLOCK rows, and no block is larger than config_gmns["data_block_size"].
     """
+    max_block_size = config_gmns["data_block_size"]
+    file_size = os.path.getsize(source)
+    if cpu_cores <= 1 or file_size < config_gmns["parallel_min_size"]:
+        return 1, max_block_size
 
-    df_link = df_link.reset_index(drop=True)
-    col_names = df_link.columns.tolist()
+    min_block_size = int(_MIN_ROWS_PER_BLOCK * row_bytes(source))
+    workers = max(1, min(cpu_cores, file_size // max(min_block_size, 1)))
+    block_size = -(-file_size // (workers * _BLOCKS_PER_WORKER))
+    return workers, max(min(block_size, max_block_size), min(min_block_size, max_block_size))
 
-    if "link_id" in col_names:
-        col_names.remove("link_id")
 
-    if "allowed_uses" in col_names:
-        col_names.remove("allowed_uses")
+def _iter_in_parallel(create_func, df_chunks, workers: int) -> Iterator:
+    """Lazily run create_func over dataframe chunks, results in chunk order.
 
-    # get node dataclass fields
-    # Get the list of attribute names
-    link_attr_names = [f.name for f in fields(Link)]
+    With one worker the chunks are processed in this process. Otherwise they go to the shared
+    worker pool, where create_func runs while the next chunks are parsed here. The pool keeps its
+    configured size: workers only bounds the chunks in flight, so memory does not grow with the
+    file and reading files of different sizes never restarts the pool. A failing chunk raises, no
+    chunk is run twice or dropped.
+    """
+    if workers <= 1:
+        return map(create_func, df_chunks)
+    executor = ParallelExecutor(backend="process", max_workers=workers, on_error="raise", shared_pool=True,
+                                max_inflight=workers)
+    return executor.imap(create_func, df_chunks, chunksize=1)
 
-    # check difference between node_attr_names and col_names
-    diff = list(set(col_names) - set(link_attr_names))
 
-    # create attributes for node class if diff is not empty
-    if diff:
-        diff_attr = [(val, Any, "") for val in diff]
-        Link_ext = dataclass_extend(Link, diff_attr)
-    else:
-        Link_ext = Link
+def _create_in_parallel(create_func, df_chunks, workers: int, table_cls: type | None = None):
+    """Run create_func over dataframe chunks (see _iter_in_parallel) and merge the results.
 
-    link_dict = {}
-    for i in range(len(df_link)):
-        try:
-            link_id = df_link.loc[i, 'link_id']
+    create_func returns a dict per chunk, merged into one dict; or, with table_cls, (ids, columns)
+    per chunk, concatenated into a table_cls.
+    A failing chunk raises instead of falling back to a second run over the (already consumed) chunks.
+    """
+    results = _iter_in_parallel(create_func, df_chunks, workers)
 
-            link = Link_ext()
+    if table_cls is not None:
+        return table_cls._from_chunks(results)
 
-            # assign values to link attributes
-            for col in col_names:
-                setattr(link, col, df_link.loc[i, col])
+    # Combine results using itertools.chain for efficiency
+    return dict(itertools.chain.from_iterable(result.items() for result in results))
 
-            # assign additional values to link attributes
-            link.id = link_id
-            link.mode_type = df_link.loc[i, 'allowed_uses']
 
-            # save link to link_dict
-            link_dict[link_id] = asdict(link)
+def _cache_supported(source: str) -> bool:
+    """Whether the parsed table of source can be cached; warns and returns False without pyarrow or shapely."""
+    missing = [name for name in ("pyarrow", "shapely") if importlib.util.find_spec(name) is None]
+    if missing:
+        warnings.warn(f"  : cache=True needs {', '.join(missing)}, {source} is parsed without the cache.")
+    return not missing
 
-        except Exception as e:
-            raise Exception(f"Error: Unable to create link {link_id}: error: {e}") from e
 
-    return link_dict
+@requires("pyarrow", "shapely")
+def _load_cached_table(source: str, table_cls_name: str, options: dict, cache_dir: str, verbose: bool) -> tuple:
+    """(cached table, None) of source, or (None, state of source) to store the table parsed next.
 
-# main functions for reading node, poi, link, zone files and network
+    The size, mtime and content hash of source are taken before parsing, so a file changed while
+    it is parsed is parsed again on the next read.
+    """
+    from pyufunc.util_geo import _gmns_table
+    from pyufunc.util_geo._gmns_cache import load_table, _source_stamp, _file_digest
+
+    table = load_table(source, getattr(_gmns_table, table_cls_name), options, cache_dir)
+    if table is not None:
+        if verbose:
+            print(f"  : Loaded {len(table)} rows of {source} from cache.")
+        return table, None
+    return None, (_source_stamp(source), _file_digest(source))
+
+
+def _save_cached_table(source: str, table, options: dict, cache_dir: str, state: tuple, verbose: bool) -> None:
+    from pyufunc.util_geo._gmns_cache import save_table
+
+    stamp, digest = state
+    if save_table(source, table, options, cache_dir, digest=digest, stamp=stamp) and verbose:
+        print(f"  : Cached parsed {source}.")
+
+
+def _attach_node_index(links: LinkTable, node_index) -> None:
+    """Add from_node_index / to_node_index to links if a node index is given."""
+    if node_index is not None:
+        links.attach_index("from_node_id", node_index)
+        links.attach_index("to_node_id", node_index)
 
 
 @func_time
-@requires("tqdm", "joblib")
-def read_node(node_file: str = "", cpu_cores: int = -1, verbose: bool = False) -> dict:
+@requires("pandas", "tqdm")
+def read_node(node_file: str = "", cpu_cores: int = -1, verbose: bool = False,
+              as_table: bool = False, cache: bool = False, cache_dir: str = "") -> dict | NodeTable:
     """Read node.csv file and return a dict of nodes.
 
     Args:
         node_file (str, optional): node file path. Defaults to "".
         cpu_cores (int, optional): number of cpu cores for parallel processing. Defaults to 1.
         verbose (bool, optional): print processing information. Defaults to False.
+        as_table (bool, optional): return a columnar NodeTable instead of a dict. Defaults to False.
+        cache (bool, optional): load the parsed table from an on-disk cache when the file did not change,
+            and store it after parsing otherwise. Needs pyarrow and shapely, without them a warning is issued
+            and the file is parsed. Defaults to False.
+        cache_dir (str, optional): the cache directory. Defaults to "", a .pyufunc_cache folder next to the file.
 
     Raises:
         FileNotFoundError: File: {node_file} does not exist.
 
     Returns:
-        dict: a dict of nodes.
+        dict | NodeTable: a dict of nodes, or a NodeTable if as_table.
 
     Examples:
         >>> node_dict = read_node(node_file = r"../dataset/ASU/node.csv")
@@ -677,9 +745,6 @@ def read_node(node_file: str = "", cpu_cores: int = -1, verbose: bool = False) -
         >>> node_dict = read_node(node_file = r"../dataset/ASU/node.csv")
         FileNotFoundError: File: ../dataset/ASU/node.csv does not exist.
     """
-    import joblib  # pyright: ignore[reportMissingImports]
-    from tqdm import tqdm  # pyright: ignore[reportMissingModuleSource]
-
     # convert path to linux path
     node_file = path2linux(node_file)
 
@@ -694,55 +759,42 @@ def read_node(node_file: str = "", cpu_cores: int = -1, verbose: bool = False) -
     if cpu_cores <= 0:
         cpu_cores = config_gmns["cpu_cores"]
 
-    # read node.csv with specified columns and chunksize for iterations
-    node_required_cols = config_gmns["node_fields"]
-    chunk_size = config_gmns["data_chunk_size"]
+    # read node.csv with specified columns, in blocks of block_size bytes
+    node_required_cols = list(config_gmns["node_fields"])
+    workers, block_size = _chunk_plan(node_file, cpu_cores)
 
-    # read first two rows to check whether required fields are in node.csv
-    df_node_2rows = pd.read_csv(node_file, nrows=2)
-    col_names = df_node_2rows.columns.tolist()
+    # read the header to check whether zone_id is in node.csv
+    col_names, encoding = read_header(node_file)
 
     if "zone_id" in col_names and "zone_id" not in node_required_cols:
         node_required_cols.append("zone_id")
 
+    # load the parsed nodes from the cache if node.csv did not change
+    cache_options = {"reader": "node", "columns": node_required_cols}
+    cache = cache and _cache_supported(node_file)
+    if cache:
+        table, source_state = _load_cached_table(node_file, "NodeTable", cache_options, cache_dir, verbose)
+        if table is not None:
+            return table if as_table else table.to_dict()
+
     if verbose:
         print(f"  : Reading node.csv with specified columns: {node_required_cols} "
-              f"and chunksize {chunk_size} for iterations...")
+              f"in blocks of {block_size} bytes...")
 
-    try:
-        # Get total rows in poi.csv and calculate total chunks
-        total_rows = sum(1 for _ in open(node_file)) - 1  # Exclude header row
-        total_chunks = total_rows // chunk_size + 1
-        df_node_chunk = pd.read_csv(
-            node_file, usecols=node_required_cols, chunksize=chunk_size)
-    except Exception as e:
-        raise Exception(f"Error: Unable to read node.csv file for: {e}")
+    df_node_chunk = iter_csv_chunks(node_file, node_required_cols, _NODE_DTYPES, block_size, encoding,
+                                    desc="  : Read nodes")
 
     if verbose:
-        print(f"  : Parallel creating Nodes using Pool with {cpu_cores} CPUs. Please wait...")
+        print(f"  : Creating Nodes with {workers} worker(s). Please wait...")
 
-    try:
-        # Parallel processing using joblib with tqdm for progress tracking
-        results = joblib.Parallel(n_jobs=cpu_cores)(
-            joblib.delayed(_create_node_from_dataframe)(chunk)
-            for chunk in tqdm(df_node_chunk, total=total_chunks, desc="  : Read nodes"))
-
-        # Combine results using itertools.chain for efficiency
-        node_dict_final = dict(itertools.chain.from_iterable(result.items() for result in results))
-
-    except Exception:
-        node_dict_final = {}
+    if as_table or cache:
+        from pyufunc.util_geo._gmns_table import NodeTable
+        table = _create_in_parallel(_node_columns, df_node_chunk, workers, table_cls=NodeTable)
+        if cache:
+            _save_cached_table(node_file, table, cache_options, cache_dir, source_state, verbose)
+        return table if as_table else table.to_dict()
 
-        # Parallel processing using Pool
-        with Pool(cpu_cores) as pool:
-            # results = pool.map(_create_node_from_dataframe, df_node_chunk)
-            results = list(
-                tqdm(pool.imap(_create_node_from_dataframe, df_node_chunk), total=total_chunks))
-            pool.close()
-            pool.join()
-
-        for node_dict in results:
-            node_dict_final |= node_dict
+    node_dict_final = _create_in_parallel(_create_node_from_dataframe, df_node_chunk, workers)
 
     if verbose:
         print(f"  : Successfully loaded node.csv: {len(node_dict_final)} Nodes loaded.")
@@ -754,20 +806,26 @@ def read_node(node_file: str = "", cpu_cores: int = -1, verbose: bool = False) -
 
 
 @func_time
-@requires("tqdm", "joblib")
-def read_poi(poi_file: str = "", cpu_cores: int = -1, verbose: bool = False) -> dict:
+@requires("pandas", "tqdm")
+def read_poi(poi_file: str = "", cpu_cores: int = -1, verbose: bool = False,
+             as_table: bool = False, cache: bool = False, cache_dir: str = "") -> dict | POITable:
     """Read poi.csv file and return a dict of POIs.
 
     Args:
         poi_file (str): The poi.csv file path. default is "".
         cpu_cores (int, optional): number of cpu cores for parallel processing. Defaults to 1.
         verbose (bool, optional): print processing information. Defaults to False.
+        as_table (bool, optional): return a columnar POITable instead of a dict. Defaults to False.
+        cache (bool, optional): load the parsed table from an on-disk cache when the file did not change,
+            and store it after parsing otherwise. Needs pyarrow and shapely, without them a warning is issued
+            and the file is parsed. Defaults to False.
+        cache_dir (str, optional): the cache directory. Defaults to "", a .pyufunc_cache folder next to the file.
 
     Raises:
         FileNotFoundError: if poi_file does not exist.
 
     Returns:
-        dict: A dict of POIs.
+        dict | POITable: A dict of POIs, or a POITable if as_table.
 
     Examples:
         >>> poi_dict = read_poi(poi_file = r"../dataset/ASU/poi.csv")
@@ -779,9 +837,6 @@ def read_poi(poi_file: str = "", cpu_cores: int = -1, verbose: bool = False) ->
         FileNotFoundError: File: ../dataset/ASU/poi.csv does not exist.
 
     """
-    import joblib  # pyright: ignore[reportMissingImports]
-    from tqdm import tqdm  # pyright: ignore[reportMissingModuleSource]
-
     # convert path to linux path
     poi_file = path2linux(poi_file)
 
@@ -796,49 +851,41 @@ def read_poi(poi_file: str = "", cpu_cores: int = -1, verbose: bool = False) ->
     if cpu_cores <= 0:
         cpu_cores = config_gmns["cpu_cores"]
 
-    # Read poi.csv with specified columns and chunksize for iterations
+    # Read poi.csv with specified columns, in blocks of block_size bytes
     poi_required_cols = config_gmns["poi_fields"]
-    chunk_size = config_gmns["data_chunk_size"]
+    workers, block_size = _chunk_plan(poi_file, cpu_cores)
 
-    if verbose:
-        print(f"  : Reading poi.csv with specified columns: {poi_required_cols} \
-                    \n    and chunksize {chunk_size} for iterations...")
-    try:
-        # Get total rows in poi.csv and calculate total chunks
-        total_rows = sum(1 for _ in open(poi_file)) - 1  # Exclude header row
-        total_chunks = total_rows // chunk_size + 1
-
-        df_poi_chunk = pd.read_csv(
-            poi_file, usecols=poi_required_cols, chunksize=chunk_size, encoding='utf-8')
-    except Exception:
-        df_poi_chunk = pd.read_csv(
-            poi_file, usecols=poi_required_cols, chunksize=chunk_size, encoding='latin-1')
+    # load the parsed POIs from the cache if poi.csv did not change
+    cache_options = {"reader": "poi", "columns": list(poi_required_cols)}
+    cache = cache and _cache_supported(poi_file)
+    if cache:
+        table, source_state = _load_cached_table(poi_file, "POITable", cache_options, cache_dir, verbose)
+        if table is not None:
+            return table if as_table else {k: dataclass_from_dict("POI", v) for k, v in table.to_dict().items()}
 
-    # Parallel processing using Pool
     if verbose:
-        print(f"  : Parallel creating POIs using Pool with {cpu_cores} CPUs. Please wait...")
-
-    try:
-        # Parallel processing using joblib with tqdm for progress tracking
-        results = joblib.Parallel(n_jobs=cpu_cores)(
-            joblib.delayed(_create_poi_from_dataframe)(chunk)
-            for chunk in tqdm(df_poi_chunk, total=total_chunks, desc="  : Read poi"))
-
-        poi_dict_final = dict(itertools.chain.from_iterable(result.items() for result in results))
+        print(f"  : Reading poi.csv with specified columns: {poi_required_cols} "
+              f"in blocks of {block_size} bytes...")
 
-    except Exception:
+    # utf-8, or latin-1 if the header does not decode
+    _, encoding = read_header(poi_file)
+    df_poi_chunk = iter_csv_chunks(poi_file, list(poi_required_cols), _POI_DTYPES, block_size, encoding,
+                                   desc="  : Read poi")
 
-        poi_dict_final = {}
-
-        with Pool(cpu_cores) as pool:
-            # results = pool.map(_create_poi_from_dataframe, df_poi_chunk)
-            results = list(
-                tqdm(pool.imap(_create_poi_from_dataframe, df_poi_chunk), total=total_chunks))
-            pool.close()
-            pool.join()
-
-        for poi_dict in results:
-            poi_dict_final |= poi_dict
+    # Parallel processing on the shared worker pool
+    if verbose:
+        print(f"  : Creating POIs with {workers} worker(s). Please wait...")
+
+    if as_table or cache:
+        from pyufunc.util_geo._gmns_table import POITable
+        table = _create_in_parallel(_poi_columns, df_poi_chunk, workers, table_cls=POITable)
+        if cache:
+            _save_cached_table(poi_file, table, cache_options, cache_dir, source_state, verbose)
+        if as_table:
+            return table
+        poi_dict_final = table.to_dict()
+    else:
+        poi_dict_final = _create_in_parallel(_create_poi_from_dataframe, df_poi_chunk, workers)
 
     if verbose:
         print(f"  : Successfully loaded poi.csv: {len(poi_dict_final)} POIs loaded.")
@@ -849,8 +896,10 @@ def read_poi(poi_file: str = "", cpu_cores: int = -1, verbose: bool = False) ->
 
 
 @func_time
-@requires("tqdm", "joblib")
-def read_zone_by_geometry(zone_file: str = "", cpu_cores: int = -1, verbose: bool = False) -> dict[int, Zone]:
+@requires("pandas", "tqdm")
+def read_zone_by_geometry(zone_file: str = "", cpu_cores: int = -1, verbose: bool = False,
+                          as_table: bool = False, cache: bool = False,
+                          cache_dir: str = "") -> dict[int, Zone] | ZoneTable:
     """Read zone.csv file and return a dict of Zones.
 
     Raises:
@@ -861,14 +910,16 @@ def read_zone_by_geometry(zone_file: str = "", cpu_cores: int = -1, verbose: boo
         zone_file (str, optional): the input zone file path. Defaults to "".
         cpu_cores (int, optional): number of cpu cores for parallel processing. Defaults to 1.
         verbose (bool, optional): print processing information. Defaults to False.
+        as_table (bool, optional): return a columnar ZoneTable instead of a dict. Defaults to False.
+        cache (bool, optional): load the parsed table from an on-disk cache when the file did not change,
+            and store it after parsing otherwise. Needs pyarrow and shapely, without them a warning is issued
+            and the file is parsed. Defaults to False.
+        cache_dir (str, optional): the cache directory. Defaults to "", a .pyufunc_cache folder next to the file.
 
     Returns:
-        dict: the result dictionary of Zones. {zone_id: Zone}
+        dict | ZoneTable: the result dictionary of Zones. {zone_id: Zone}, or a ZoneTable if as_table.
     """
 
-    import joblib  # pyright: ignore[reportMissingImports]
-    from tqdm import tqdm  # pyright: ignore[reportMissingModuleSource]
-
     # convert path to linux path
     zone_file = path2linux(zone_file)
 
@@ -885,55 +936,43 @@ def read_zone_by_geometry(zone_file: str = "", cpu_cores: int = -1, verbose: boo
 
     # load default settings for zone required fields and chunk size
     zone_required_cols = config_gmns["zone_geometry_fields"]
-    chunk_size = config_gmns["data_chunk_size"]
+    workers, block_size = _chunk_plan(zone_file, cpu_cores)
+
+    # load the parsed zones from the cache if zone.csv did not change
+    cache_options = {"reader": "zone_geometry", "columns": list(zone_required_cols)}
+    cache = cache and _cache_supported(zone_file)
+    if cache:
+        table, source_state = _load_cached_table(zone_file, "ZoneTable", cache_options, cache_dir, verbose)
+        if table is not None:
+            return table if as_table else table.to_dict()
 
     if verbose:
         print(f"  : Reading zone.csv with specified columns: {zone_required_cols} "
-              f"and chunksize {chunk_size} for iterations...")
+              f"in blocks of {block_size} bytes...")
 
     # check whether required fields are in zone.csv
-    df_zone = pd.read_csv(zone_file, nrows=1)
-    col_names = df_zone.columns.tolist()
+    col_names, encoding = read_header(zone_file)
     for col in zone_required_cols:
         if col not in col_names:
             raise FileNotFoundError(f"Required column: {col} is not in zone.csv. \
                 Please make sure you have {zone_required_cols} in zone.csv.")
 
-    # load zone.csv with specified columns and chunksize for iterations
-    try:
-        # Get total rows in poi.csv and calculate total chunks
-        total_rows = sum(1 for _ in open(zone_file)) - 1  # Exclude header row
-        total_chunks = total_rows // chunk_size + 1
-
-        # load zone.csv with specified columns and chunksize for iterations
-        df_zone_chunk = pd.read_csv(zone_file, usecols=zone_required_cols, chunksize=chunk_size)
-    except Exception as e:
-        raise Exception(f"Error: Unable to read zone.csv file for: {e}") from e
+    # load zone.csv with specified columns, in blocks of block_size bytes
+    df_zone_chunk = iter_csv_chunks(zone_file, list(zone_required_cols), _ZONE_DTYPES, block_size, encoding,
+                                    desc="  : Read zone geometry")
 
-    # Parallel processing using Pool
+    # Parallel processing on the shared worker pool
     if verbose:
-        print(f"  : Parallel creating Zones using Pool with {cpu_cores} CPUs. Please wait...")
-
-    try:
-        # Parallel processing using joblib with tqdm for progress tracking
-        results = joblib.Parallel(n_jobs=cpu_cores)(
-            joblib.delayed(_create_zone_from_dataframe_by_geometry)(chunk)
-            for chunk in tqdm(df_zone_chunk, total=total_chunks, desc="  : Read zone geometry"))
-
-        zone_dict_final = dict(itertools.chain.from_iterable(result.items() for result in results))
+        print(f"  : Creating Zones with {workers} worker(s). Please wait...")
 
-    except Exception:
+    if as_table or cache:
+        from pyufunc.util_geo._gmns_table import ZoneTable
+        table = _create_in_parallel(_zone_geometry_columns, df_zone_chunk, workers, table_cls=ZoneTable)
+        if cache:
+            _save_cached_table(zone_file, table, cache_options, cache_dir, source_state, verbose)
+        return table if as_table else table.to_dict()
 
-        zone_dict_final = {}
-
-        with Pool(cpu_cores) as pool:
-            results = pool.map(
-                _create_zone_from_dataframe_by_geometry, df_zone_chunk)
-            pool.close()
-            pool.join()
-
-        for zone_dict in results:
-            zone_dict_final.update(zone_dict)
+    zone_dict_final = _create_in_parallel(_create_zone_from_dataframe_by_geometry, df_zone_chunk, workers)
 
     if verbose:
         print(f"  : Successfully loaded zone.csv: {len(zone_dict_final)} Zones loaded.")
@@ -945,26 +984,30 @@ def read_zone_by_geometry(zone_file: str = "", cpu_cores: int = -1, verbose: boo
 
 
 @func_time
-@requires("tqdm", "joblib")
-def read_zone_by_centroid(zone_file: str = "", cpu_cores: int = -1, verbose: bool = False) -> dict[int, Zone]:
+@requires("pandas", "tqdm")
+def read_zone_by_centroid(zone_file: str = "", cpu_cores: int = -1, verbose: bool = False,
+                          as_table: bool = False, cache: bool = False,
+                          cache_dir: str = "") -> dict[int, Zone] | ZoneTable:
     """Read zone.csv file and return a dict of Zones.
 
     Args:
         zone_file (str, optional): the input zone file path. Defaults to "".
         cpu_cores (int, optional): number of cpu cores for parallel processing. Defaults to 1.
         verbose (bool, optional): print processing information. Defaults to False.
+        as_table (bool, optional): return a columnar ZoneTable instead of a dict. Defaults to False.
+        cache (bool, optional): load the parsed table from an on-disk cache when the file did not change,
+            and store it after parsing otherwise. Needs pyarrow and shapely, without them a warning is issued
+            and the file is parsed. Defaults to False.
+        cache_dir (str, optional): the cache directory. Defaults to "", a .pyufunc_cache folder next to the file.
 
     Raises:
         FileNotFoundError: File: {zone_file} does not exist.
         FileNotFoundError: Required column: {col} is not in zone.csv. Please make sure zone_required_cols in zone.csv.
 
     Returns:
-        dict: a dict of Zones.
+        dict | ZoneTable: a dict of Zones, or a ZoneTable if as_table.
     """
 
-    import joblib  # pyright: ignore[reportMissingImports]
-    from tqdm import tqdm  # pyright: ignore[reportMissingModuleSource]
-
     # convert path to linux path
     zone_file = path2linux(zone_file)
 
@@ -981,55 +1024,43 @@ def read_zone_by_centroid(zone_file: str = "", cpu_cores: int = -1, verbose: boo
 
     # load default settings for zone required fields and chunk size
     zone_required_cols = config_gmns["zone_centroid_fields"]
-    chunk_size = config_gmns["data_chunk_size"]
+    workers, block_size = _chunk_plan(zone_file, cpu_cores)
+
+    # load the parsed zones from the cache if zone.csv did not change
+    cache_options = {"reader": "zone_centroid", "columns": list(zone_required_cols)}
+    cache = cache and _cache_supported(zone_file)
+    if cache:
+        table, source_state = _load_cached_table(zone_file, "ZoneTable", cache_options, cache_dir, verbose)
+        if table is not None:
+            return table if as_table else table.to_dict()
 
     if verbose:
         print(f"  : Reading zone.csv with specified columns: {zone_required_cols} "
-              f"and chunksize {chunk_size} for iterations...")
+              f"in blocks of {block_size} bytes...")
 
     # check whether required fields are in zone.csv
-    df_zone = pd.read_csv(zone_file, nrows=1)
-    col_names = df_zone.columns.tolist()
+    col_names, encoding = read_header(zone_file)
     for col in zone_required_cols:
         if col not in col_names:
             raise FileNotFoundError(f"Required column: {col} is not in zone.csv. \
                 Please make sure you have {zone_required_cols} in zone.csv.")
 
-    # load zone.csv with specified columns and chunksize for iterations
-    try:
-        # Get total rows in poi.csv and calculate total chunks
-        total_rows = sum(1 for _ in open(zone_file)) - 1  # Exclude header row
-        total_chunks = total_rows // chunk_size + 1
-
-        # load zone.csv with specified columns and chunksize for iterations
-        df_zone_chunk = pd.read_csv(zone_file, usecols=zone_required_cols, chunksize=chunk_size)
-    except Exception as e:
-        raise Exception(f"  : Unable to read zone.csv for {e}") from e
+    # load zone.csv with specified columns, in blocks of block_size bytes
+    df_zone_chunk = iter_csv_chunks(zone_file, list(zone_required_cols), _ZONE_DTYPES, block_size, encoding,
+                                    desc="  : Read zone centroid")
 
-    # Parallel processing using Pool
+    # Parallel processing on the shared worker pool
     if verbose:
-        print(f"  : Parallel creating Zones using Pool with {cpu_cores} CPUs. Please wait...")
+        print(f"  : Creating Zones with {workers} worker(s). Please wait...")
 
-    try:
-        # Parallel processing using joblib with tqdm for progress tracking
-        results = joblib.Parallel(n_jobs=cpu_cores)(
-            joblib.delayed(_create_zone_from_dataframe_by_centroid)(chunk)
-            for chunk in tqdm(df_zone_chunk, total=total_chunks, desc="  : Read zone centroid")
-        )
-        zone_dict_final = dict(itertools.chain.from_iterable(
-            result.items() for result in results))
-
-    except Exception:
-        zone_dict_final = {}
-
-        with Pool(cpu_cores) as pool:
-            results = pool.map(
-                _create_zone_from_dataframe_by_centroid, df_zone_chunk)
-            pool.close()
-            pool.join()
-
-        for zone_dict in results:
-            zone_dict_final |= zone_dict
+    if as_table or cache:
+        from pyufunc.util_geo._gmns_table import ZoneTable
+        table = _create_in_parallel(_zone_centroid_columns, df_zone_chunk, workers, table_cls=ZoneTable)
+        if cache:
+            _save_cached_table(zone_file, table, cache_options, cache_dir, source_state, verbose)
+        return table if as_table else table.to_dict()
+
+    zone_dict_final = _create_in_parallel(_create_zone_from_dataframe_by_centroid, df_zone_chunk, workers)
 
     if verbose:
         print(f"  : Successfully loaded zone.csv: {len(zone_dict_final)} Zones loaded.")
@@ -1041,21 +1072,31 @@ def read_zone_by_centroid(zone_file: str = "", cpu_cores: int = -1, verbose: boo
 
 
 @func_time
-@requires("tqdm", "joblib")
-def read_link(link_file: str = "", cpu_cores: int = -1, verbose: bool = False) -> dict[int, Link]:
+@requires("pandas", "tqdm")
+def read_link(link_file: str = "", cpu_cores: int = -1, verbose: bool = False,
+              as_table: bool = False, cache: bool = False, cache_dir: str = "",
+              node_index: IdIndex | NodeTable | None = None) -> dict[int, Link] | LinkTable:
     """Read link.csv file and return a dict of Links.
 
     Args:
         link_file (str): The link.csv file path. default is "".
         cpu_cores (int, optional): number of cpu cores for parallel processing. Defaults to -1.
         verbose (bool, optional): print processing information. Defaults to False.
+        as_table (bool, optional): return a columnar LinkTable instead of a dict. Defaults to False.
+        cache (bool, optional): load the parsed table from an on-disk cache when the file did not change,
+            and store it after parsing otherwise. Needs pyarrow and shapely, without them a warning is issued
+            and the file is parsed. Defaults to False.
+        cache_dir (str, optional): the cache directory. Defaults to "", a .pyufunc_cache folder next to the file.
+        node_index (IdIndex | NodeTable | None, optional): the nodes of the network (or their index). If given,
+            every link gets from_node_index / to_node_index, the dense indices of its end nodes
+            (-1 for a node not in the index). Defaults to None.
 
     Raises:
         FileNotFoundError: File: {link_file} does not exist.
         ValueError: cpu_cores should be integer, but got {type(cpu_cores)}
 
     Returns:
-        dict: A dict of Links.
+        dict | LinkTable: A dict of Links, or a LinkTable if as_table.
 
     Examples:
         >>> from pyufunc import gmns_read_link
@@ -1064,9 +1105,6 @@ def read_link(link_file: str = "", cpu_cores: int = -1, verbose: bool = False) -
         Link(id=1, name='A', from_node_id=1, to_node_id=2, length=0.0, lanes=1, dir_flag=1, free_speed=0.0,
         capacity=0.0, link_type=1, link_type_name='motorway', geometry='LINESTRING (0 0, 1 1)')
     """
-    import joblib  # pyright: ignore[reportMissingImports]
-    from tqdm import tqdm  # pyright: ignore[reportMissingModuleSource]
-
     # convert path to linux path
     link_file = path2linux(link_file)
 
@@ -1081,48 +1119,41 @@ def read_link(link_file: str = "", cpu_cores: int = -1, verbose: bool = False) -
     if cpu_cores <= 0:
         cpu_cores = config_gmns["cpu_cores"]
 
-    # Read link.csv with specified columns and chunksize for iterations
+    # Read link.csv with specified columns, in blocks of block_size bytes
     link_required_cols = config_gmns["link_fields"]
-    chunk_size = config_gmns["data_chunk_size"]
+    workers, block_size = _chunk_plan(link_file, cpu_cores)
+
+    # load the parsed links from the cache if link.csv did not change
+    cache_options = {"reader": "link", "columns": list(link_required_cols)}
+    cache = cache and _cache_supported(link_file)
+    if cache:
+        table, source_state = _load_cached_table(link_file, "LinkTable", cache_options, cache_dir, verbose)
+        if table is not None:
+            _attach_node_index(table, node_index)
+            return table if as_table else table.to_dict()
 
     if verbose:
         print(f"  : Reading link.csv with specified columns: {link_required_cols} "
-              f"and chunksize {chunk_size} for iterations...")
-    # Get total rows in poi.csv and calculate total chunks
-    total_rows = sum(1 for _ in open(link_file)) - 1  # Exclude header row
-    total_chunks = total_rows // chunk_size + 1
-    try:
-        df_link_chunk = pd.read_csv(
-            link_file, usecols=link_required_cols, chunksize=chunk_size, encoding='utf-8')
-    except Exception:
-        df_link_chunk = pd.read_csv(
-            link_file, usecols=link_required_cols, chunksize=chunk_size, encoding='latin-1')
+              f"in blocks of {block_size} bytes...")
+
+    # utf-8, or latin-1 if the header does not decode
+    _, encoding = read_header(link_file)
+    df_link_chunk = iter_csv_chunks(link_file, list(link_required_cols), _LINK_DTYPES, block_size, encoding,
+                                    desc="  : Read links")
 
-    # Parallel processing using Pool
+    # Parallel processing on the shared worker pool
     if verbose:
-        print(f"  : Parallel creating Links using Pool with {cpu_cores} CPUs. Please wait...")
+        print(f"  : Creating Links with {workers} worker(s). Please wait...")
 
-    try:
-        # Parallel processing using joblib with tqdm for progress tracking
-        results = joblib.Parallel(n_jobs=cpu_cores)(
-            joblib.delayed(_create_link_from_dataframe)(chunk)
-            for chunk in tqdm(df_link_chunk, total=total_chunks, desc="  : Read links"))
+    if as_table or cache or node_index is not None:
+        from pyufunc.util_geo._gmns_table import LinkTable
+        table = _create_in_parallel(_link_columns, df_link_chunk, workers, table_cls=LinkTable)
+        if cache:
+            _save_cached_table(link_file, table, cache_options, cache_dir, source_state, verbose)
+        _attach_node_index(table, node_index)
+        return table if as_table else table.to_dict()
 
-        # Combine results using itertools.chain for efficiency
-        link_dict_final = dict(itertools.chain.from_iterable(result.items() for result in results))
-    except Exception as e:
-        if verbose:
-            print(f"  : Error occurred while reading link.csv: {e}, trying with Pool...")
-        link_dict_final = {}
-        with Pool(cpu_cores) as pool:
-            # results = pool.map(_create_link_from_dataframe, df_link_chunk)
-            results = tqdm(pool.imap(_create_link_from_dataframe, df_link_chunk), total=total_chunks)
-            pool.close()
-            pool.join()
-
-        for link_dict in results:
-            # print("link_dict: ", link_dict)
-            link_dict_final |= link_dict
+    link_dict_final = _create_in_parallel(_create_link_from_dataframe, df_link_chunk, workers)
 
     if verbose:
         print(f"  : Successfully loaded link.csv: {len(link_dict_final)} Links loaded.")
@@ -1131,14 +1162,20 @@ def read_link(link_file: str = "", cpu_cores: int = -1, verbose: bool = False) -
 
 
 @func_time
-@requires("tqdm", "joblib")
-def read_zone(zone_file: str = "", cpu_cores: int = -1, verbose: bool = False) -> dict[int, Zone]:
+@requires("pandas", "tqdm")
+def read_zone(zone_file: str = "", cpu_cores: int = -1, verbose: bool = False,
+              as_table: bool = False, cache: bool = False, cache_dir: str = "") -> dict[int, Zone] | ZoneTable:
     """Read zone.csv file and return a dict of Zones.
 
     Args:
         zone_file (str, optional): the input zone file path. Defaults to "".
         cpu_cores (int, optional): number of cpu cores for parallel processing. Defaults to -1.
         verbose (bool, optional): print processing information. Defaults to False.
+        as_table (bool, optional): return a columnar ZoneTable instead of a dict. Defaults to False.
+        cache (bool, optional): load the parsed table from an on-disk cache when the file did not change,
+            and store it after parsing otherwise. Needs pyarrow and shapely, without them a warning is issued
+            and the file is parsed. Defaults to False.
+        cache_dir (str, optional): the cache directory. Defaults to "", a .pyufunc_cache folder next to the file.
 
     Raises:
         FileNotFoundError: Error: File {zone_file} does not exist.
@@ -1146,7 +1183,7 @@ def read_zone(zone_file: str = "", cpu_cores: int = -1, verbose: bool = False) -
         Exception: Error: Failed to read {zone_file}.
 
     Returns:
-        dict: a dict of Zones.
+        dict | ZoneTable: a dict of Zones, or a ZoneTable if as_table.
 
     Examples:
         >>> from pyufunc import gmns_read_zone
@@ -1171,20 +1208,244 @@ def read_zone(zone_file: str = "", cpu_cores: int = -1, verbose: bool = False) -
         cpu_cores = config_gmns["cpu_cores"]
 
     # load zone file column names
-    zone_columns = []
     try:
-        # 1 row, reduce memory and time
-        zone_df = pd.read_csv(zone_file, nrows=1)
-        zone_columns = zone_df.columns
+        zone_columns, _ = read_header(zone_file)
     except Exception as e:
         raise Exception(f"Error: Failed to read {zone_file}.") from e
 
     # update geometry or centroid
     if set(config_gmns.get("zone_geometry_fields")).issubset(set(zone_columns)):
-        zone_dict = read_zone_by_geometry(zone_file, cpu_cores, verbose)
+        zone_dict = read_zone_by_geometry(zone_file, cpu_cores, verbose, as_table, cache, cache_dir)
     elif set(config_gmns.get("zone_centroid_fields")).issubset(set(zone_columns)):
-        zone_dict = read_zone_by_centroid(zone_file, cpu_cores, verbose)
+        zone_dict = read_zone_by_centroid(zone_file, cpu_cores, verbose, as_table, cache, cache_dir)
     else:
         zone_dict = {}
         print(f"Error: No valid zone fields in {zone_file}.", flush=True)
     return zone_dict
+
+
+def _bbox_mask(columns: dict, bbox: tuple):
+    """Rows of a chunk inside bbox: points by their coordinates, lines and polygons by overlapping bounds."""
+    import numpy as np
+    import shapely  # pyright: ignore[reportMissingModuleSource]
+
+    min_x, min_y, max_x, max_y = bbox
+    if "x_min" in columns:
+        # zone polygons, bounds computed while reading
+        bounds = np.column_stack([columns[name].astype("float64") for name in ("x_min", "y_min", "x_max", "y_max")])
+    elif "x_coord" in columns and "y_coord" in columns:
+        x = columns["x_coord"].astype("float64")
+        y = columns["y_coord"].astype("float64")
+        return (x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y)
+    else:
+        # WKT geometry, e.g. links; a missing geometry has NaN bounds and is never inside
+        geometry = columns["geometry"]
+        is_text = np.fromiter((isinstance(value, str) for value in geometry), dtype=bool, count=len(geometry))
+        parsed = np.full(len(geometry), None, dtype=object)
+        parsed[is_text] = shapely.from_wkt(geometry[is_text], on_invalid="ignore")
+        bounds = shapely.bounds(parsed)
+    return (bounds[:, 0] <= max_x) & (bounds[:, 2] >= min_x) & (bounds[:, 1] <= max_y) & (bounds[:, 3] >= min_y)
+
+
+def _attribute_mask(columns: dict, where: dict, element: str):
+    """Rows of a chunk matching every condition of where."""
+    import numpy as np
+
+    mask = np.ones(len(columns["id"]), dtype=bool)
+    for name, condition in where.items():
+        if name not in columns:
+            raise KeyError(f"Key {name} not found in {element}")
+        values = columns[name]
+        if callable(condition):
+            mask &= np.asarray(condition(values), dtype=bool)
+        elif isinstance(condition, (list, tuple, set, frozenset, np.ndarray)):
+            mask &= np.isin(values, list(condition))
+        else:
+            mask &= values == condition
+    return mask
+
+
+def _rebatch(column_chunks, batch_size: int) -> Iterator[dict]:
+    """Regroup column dicts of any length into column dicts of batch_size rows, the last one shorter."""
+    import numpy as np
+
+    pending, n_pending = [], 0
+    for columns in column_chunks:
+        if not len(columns["id"]):
+            continue
+        pending.append(columns)
+        n_pending += len(columns["id"])
+        while n_pending >= batch_size:
+            merged = {name: np.concatenate([chunk[name] for chunk in pending]) for name in pending[0]}
+            yield {name: values[:batch_size] for name, values in merged.items()}
+            n_pending -= batch_size
+            pending = [{name: values[batch_size:] for name, values in merged.items()}] if n_pending else []
+    if pending:
+        yield {name: np.concatenate([chunk[name] for chunk in pending]) for name in pending[0]}
+
+
+def _iter_tables(source: str, columns_func, table_cls_name: str, required_cols: list, dtypes: dict,
+                 cpu_cores: int, batch_size: int, bbox: tuple | None, where: dict | None, desc: str) -> Iterator:
+    """Stream source as tables of batch_size rows, filtering every chunk as soon as it is parsed."""
+    from pyufunc.util_geo import _gmns_table
+
+    table_cls = getattr(_gmns_table, table_cls_name)
+    _, encoding = read_header(source)
+    workers, block_size = _chunk_plan(source, cpu_cores)
+    df_chunks = iter_csv_chunks(source, required_cols, dtypes, block_size, encoding, desc=desc)
+
+    def filtered_chunks():
+        for _, columns in _iter_in_parallel(columns_func, df_chunks, workers):
+            mask = None
+            if bbox is not None:
+                mask = _bbox_mask(columns, bbox)
+            if where:
+                mask = _attribute_mask(columns, where, table_cls.element.__name__) if mask is None \
+                    else mask & _attribute_mask(columns, where, table_cls.element.__name__)
+            yield columns if mask is None else {name: values[mask] for name, values in columns.items()}
+
+    for columns in _rebatch(filtered_chunks(), batch_size):
+        # a repeated id keeps its last row within a batch, ids are not compared across batches
+        yield table_cls._from_chunks([(columns["id"], columns)])
+
+
+def _check_stream_args(source: str, cpu_cores: int, batch_size: int, bbox: tuple | None) -> int:
+    """Validate the arguments of an iter_* function, returning the number of cpu cores to use."""
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"File: {source} does not exist.")
+    if not isinstance(cpu_cores, int):
+        raise ValueError(f"cpu_cores should be integer, but got {type(cpu_cores)}")
+    if not isinstance(batch_size, int) or batch_size <= 0:
+        raise ValueError(f"batch_size should be a positive integer, but got {batch_size!r}")
+    if bbox is not None and len(bbox) != 4:
+        raise ValueError(f"bbox should be (min_x, min_y, max_x, max_y), but got {bbox!r}")
+    return cpu_cores if cpu_cores > 0 else config_gmns["cpu_cores"]
+
+
+@requires("pandas", "shapely", "tqdm")
+def iter_nodes(node_file: str = "", batch_size: int = 100_000, bbox: tuple | None = None,
+               where: dict | None = None, cpu_cores: int = -1) -> Iterator[NodeTable]:
+    """Stream node.csv as NodeTables of batch_size rows, with memory independent of the file size.
+
+    The file is parsed block by block (see read_node); the filters are applied to every block as
+    soon as it is parsed, so only matching nodes are kept.
+
+    Args:
+        node_file (str): node file path. Defaults to "".
+        batch_size (int): nodes per yielded table, the last one may be shorter. Defaults to 100_000.
+        bbox (tuple | None): (min_x, min_y, max_x, max_y), keep nodes with coordinates inside. Defaults to None.
+        where (dict | None): {column: condition}, keep nodes matching every condition. A condition is a
+            value, a list / tuple / set of values, or a callable taking the column array and returning
+            a boolean mask. Defaults to None.
+        cpu_cores (int): number of cpu cores for parsing. Defaults to -1, the configured cpu cores.
+
+    Raises:
+        FileNotFoundError: File: {node_file} does not exist.
+
+    Yields:
+        NodeTable: the next batch of nodes. Ids are unique within a batch, not across batches.
+
+    Examples:
+        >>> n_nodes = sum(len(batch) for batch in iter_nodes(r"../dataset/ASU/node.csv",
+        ...                                                  bbox=(-112.0, 33.3, -111.8, 33.5)))
+        >>> for batch in iter_nodes(r"../dataset/ASU/node.csv", where={"zone_id": [1, 2]}):
+        ...     batch.to_pandas().to_csv("nodes_in_zone_1_2.csv", mode="a")
+    """
+    node_file = path2linux(node_file)
+    cpu_cores = _check_stream_args(node_file, cpu_cores, batch_size, bbox)
+
+    node_required_cols = list(config_gmns["node_fields"])
+    if "zone_id" in read_header(node_file)[0] and "zone_id" not in node_required_cols:
+        node_required_cols.append("zone_id")
+    return _iter_tables(node_file, _node_columns, "NodeTable", node_required_cols, _NODE_DTYPES,
+                        cpu_cores, batch_size, bbox, where, desc="  : Stream nodes")
+
+
+@requires("pandas", "shapely", "pyproj", "tqdm")
+def iter_pois(poi_file: str = "", batch_size: int = 100_000, bbox: tuple | None = None,
+              where: dict | None = None, cpu_cores: int = -1) -> Iterator[POITable]:
+    """Stream poi.csv as POITables of batch_size rows, with memory independent of the file size.
+
+    Args:
+        poi_file (str): poi file path. Defaults to "".
+        batch_size (int): POIs per yielded table, the last one may be shorter. Defaults to 100_000.
+        bbox (tuple | None): (min_x, min_y, max_x, max_y), keep POIs with centroids inside. Defaults to None.
+        where (dict | None): {column: condition}, see iter_nodes. Defaults to None.
+        cpu_cores (int): number of cpu cores for parsing. Defaults to -1, the configured cpu cores.
+
+    Raises:
+        FileNotFoundError: File: {poi_file} does not exist.
+
+    Yields:
+        POITable: the next batch of POIs. Ids are unique within a batch, not across batches.
+    """
+    poi_file = path2linux(poi_file)
+    cpu_cores = _check_stream_args(poi_file, cpu_cores, batch_size, bbox)
+    return _iter_tables(poi_file, _poi_columns, "POITable", list(config_gmns["poi_fields"]), _POI_DTYPES,
+                        cpu_cores, batch_size, bbox, where, desc="  : Stream poi")
+
+
+@requires("pandas", "shapely", "tqdm")
+def iter_links(link_file: str = "", batch_size: int = 100_000, bbox: tuple | None = None,
+               where: dict | None = None, cpu_cores: int = -1) -> Iterator[LinkTable]:
+    """Stream link.csv as LinkTables of batch_size rows, with memory independent of the file size.
+
+    Args:
+        link_file (str): link file path. Defaults to "".
+        batch_size (int): links per yielded table, the last one may be shorter. Defaults to 100_000.
+        bbox (tuple | None): (min_x, min_y, max_x, max_y), keep links whose geometry bounds overlap it;
+            links without geometry are dropped. Defaults to None.
+        where (dict | None): {column: condition}, see iter_nodes. Defaults to None.
+        cpu_cores (int): number of cpu cores for parsing. Defaults to -1, the configured cpu cores.
+
+    Raises:
+        FileNotFoundError: File: {link_file} does not exist.
+
+    Yields:
+        LinkTable: the next batch of links. Ids are unique within a batch, not across batches.
+
+    Examples:
+        >>> total_length = 0.0
+        >>> for batch in iter_links(r"../dataset/ASU/link.csv", where={"lanes": lambda lanes: lanes >= 2}):
+        ...     total_length += batch.column("length").sum()
+    """
+    link_file = path2linux(link_file)
+    cpu_cores = _check_stream_args(link_file, cpu_cores, batch_size, bbox)
+    return _iter_tables(link_file, _link_columns, "LinkTable", list(config_gmns["link_fields"]), _LINK_DTYPES,
+                        cpu_cores, batch_size, bbox, where, desc="  : Stream links")
+
+
+@requires("pandas", "shapely", "tqdm")
+def iter_zones(zone_file: str = "", batch_size: int = 100_000, bbox: tuple | None = None,
+               where: dict | None = None, cpu_cores: int = -1) -> Iterator[ZoneTable]:
+    """Stream zone.csv as ZoneTables of batch_size rows, with memory independent of the file size.
+
+    Zones are read by geometry or by centroid, as in read_zone.
+
+    Args:
+        zone_file (str): zone file path. Defaults to "".
+        batch_size (int): zones per yielded table, the last one may be shorter. Defaults to 100_000.
+        bbox (tuple | None): (min_x, min_y, max_x, max_y), keep zones whose polygon bounds overlap it,
+            or whose centroid is inside it for zones given by centroid. Defaults to None.
+        where (dict | None): {column: condition}, see iter_nodes. Defaults to None.
+        cpu_cores (int): number of cpu cores for parsing. Defaults to -1, the configured cpu cores.
+
+    Raises:
+        FileNotFoundError: File: {zone_file} does not exist.
+        ValueError: zone.csv has neither the geometry nor the centroid fields.
+
+    Yields:
+        ZoneTable: the next batch of zones. Ids are unique within a batch, not across batches.
+    """
+    zone_file = path2linux(zone_file)
+    cpu_cores = _check_stream_args(zone_file, cpu_cores, batch_size, bbox)
+
+    zone_columns = set(read_header(zone_file)[0])
+    if set(config_gmns["zone_geometry_fields"]).issubset(zone_columns):
+        columns_func, required_cols = _zone_geometry_columns, config_gmns["zone_geometry_fields"]
+    elif set(config_gmns["zone_centroid_fields"]).issubset(zone_columns):
+        columns_func, required_cols = _zone_centroid_columns, config_gmns["zone_centroid_fields"]
+    else:
+        raise ValueError(f"No valid zone fields in {zone_file}.")
+    return _iter_tables(zone_file, columns_func, "ZoneTable", list(required_cols), _ZONE_DTYPES,
+                        cpu_cores, batch_size, bbox, where, desc="  : Stream zones")
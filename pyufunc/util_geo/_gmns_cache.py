@@ -0,0 +1,182 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Saturday, October 17th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+# GMNS: General Modeling Network Specification
+##############################################################
+"""On-disk cache of parsed GMNS tables.
+
+A parsed table is stored as an uncompressed Arrow IPC file (geometry as WKB) with a JSON sidecar
+holding the size, mtime and content hash of the source csv. The cache is valid while the size and
+mtime match; if they differ, the content hash decides (a touched or copied file stays cached).
+Loading memory-maps the Arrow file: numeric columns are read-only views of the mapping (the
+table copies a column into memory when it is first written), and WKB geometries are handed to
+the table as bytes, decoded only when they are used.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import os
+import json
+import hashlib
+import tempfile
+import warnings
+from pathlib import Path
+
+from pyufunc.util_magic._cache import stable_hash
+
+if TYPE_CHECKING:
+    from pyufunc.util_geo._gmns_table import GmnsTable
+
+# bump when the cached layout changes, older cache files are ignored
+_CACHE_FORMAT = 2
+
+_CACHE_DIR_NAME = ".pyufunc_cache"
+
+
+def _file_digest(path: str) -> str:
+    """blake2b of the file content, read in 1 MiB blocks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _cache_paths(source: str, options: dict, cache_dir: str) -> tuple[Path, Path]:
+    """(Arrow file, sidecar) of a source file read with the given reader options."""
+    source = os.path.abspath(source)
+    cache_dir = Path(cache_dir) if cache_dir else Path(os.path.dirname(source)) / _CACHE_DIR_NAME
+    key = stable_hash((_CACHE_FORMAT, source, options))[:16]
+    stem = f"{os.path.basename(source)}.{key}"
+    return cache_dir / f"{stem}.arrow", cache_dir / f"{stem}.json"
+
+
+def _source_stamp(source: str) -> dict:
+    stat = os.stat(source)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _atomic_write(path: Path, write) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def _valid_meta(source: str, meta_path: Path) -> dict | None:
+    """The sidecar of a cache entry if it matches the source file, else None."""
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("format") != _CACHE_FORMAT:
+        return None
+
+    stamp = _source_stamp(source)
+    if meta.get("size") == stamp["size"] and meta.get("mtime_ns") == stamp["mtime_ns"]:
+        return meta
+    # size or mtime changed: same content (e.g. touched or copied) keeps the cache valid
+    if meta.get("size") != stamp["size"] or meta.get("digest") != _file_digest(source):
+        return None
+    meta.update(stamp)
+    try:
+        _atomic_write(meta_path, lambda tmp: Path(tmp).write_text(json.dumps(meta), encoding="utf-8"))
+    except OSError:
+        pass
+    return meta
+
+
+def load_table(source: str, table_cls: type, options: dict, cache_dir: str = "") -> GmnsTable | None:
+    """Load the cached table of a source file, or None if there is no valid cache entry.
+
+    Args:
+        source (str): the csv file the table was parsed from.
+        table_cls (type): the table class, e.g. NodeTable.
+        options (dict): the reader options the table was parsed with (part of the cache key).
+        cache_dir (str): the cache directory. Defaults to "", a .pyufunc_cache folder next to source.
+
+    Returns:
+        GmnsTable | None: the table, its numeric columns memory-mapped (copied on first write).
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    data_path, meta_path = _cache_paths(source, options, cache_dir)
+    meta = _valid_meta(source, meta_path)
+    if meta is None or meta.get("table") != table_cls.__name__:
+        return None
+    try:
+        arrow_table = pa.ipc.open_file(pa.memory_map(str(data_path), "r")).read_all()
+    except (OSError, pa.ArrowException):
+        return None
+
+    columns = {}
+    for name, chunked in zip(arrow_table.column_names, arrow_table.columns):
+        column = chunked.combine_chunks() if chunked.num_chunks != 1 else chunked.chunk(0)
+        if pa.types.is_binary(column.type):
+            # WKB geometries, kept as bytes until used
+            columns[name] = column.to_numpy(zero_copy_only=False)
+        elif pa.types.is_list(column.type) or pa.types.is_large_list(column.type):
+            columns[name] = np.empty(len(column), dtype=object)
+            columns[name][:] = column.to_pylist()
+        elif pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            # missing text is NaN, as pandas reads it
+            values = column.to_numpy(zero_copy_only=False)
+            values[column.is_null().to_numpy(zero_copy_only=False)] = np.nan
+            columns[name] = values
+        else:
+            # primitive columns without nulls are views of the memory mapping
+            columns[name] = column.to_numpy(zero_copy_only=False)
+    return table_cls(columns)
+
+
+def save_table(source: str, table: GmnsTable, options: dict, cache_dir: str = "",
+               digest: str = "", stamp: dict | None = None) -> bool:
+    """Store a parsed table in the cache, best effort: a table Arrow cannot store warns and is skipped.
+
+    Args:
+        source (str): the csv file the table was parsed from.
+        table (GmnsTable): the parsed table.
+        options (dict): the reader options the table was parsed with (part of the cache key).
+        cache_dir (str): the cache directory. Defaults to "", a .pyufunc_cache folder next to source.
+        digest (str): the content hash of source taken before parsing. Defaults to "", hashed now.
+        stamp (dict | None): size and mtime_ns of source taken before parsing. Defaults to None, now.
+
+    Returns:
+        bool: whether the table was stored.
+    """
+    import pyarrow as pa
+
+    data_path, meta_path = _cache_paths(source, options, cache_dir)
+    try:
+        arrow_table = table.to_arrow()
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        warnings.warn(f"  : {source} is not cached, a column cannot be stored in Arrow: {e}")
+        return False
+
+    geometry_columns = [field.name for field in arrow_table.schema
+                        if pa.types.is_binary(field.type) and table.column(field.name).dtype == object]
+    meta = {"format": _CACHE_FORMAT, "table": type(table).__name__, "source": os.path.abspath(source),
+            **(stamp or _source_stamp(source)), "digest": digest or _file_digest(source),
+            "geometry_columns": geometry_columns}
+
+    def write_arrow(tmp_name):
+        with pa.OSFile(tmp_name, "wb") as sink, pa.ipc.new_file(sink, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+
+    try:
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(data_path, write_arrow)
+        _atomic_write(meta_path, lambda tmp: Path(tmp).write_text(json.dumps(meta), encoding="utf-8"))
+    except OSError as e:
+        warnings.warn(f"  : Unable to write the cache of {source}: {e}")
+        return False
+    return True
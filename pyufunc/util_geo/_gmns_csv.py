@@ -0,0 +1,175 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Saturday, October 17th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+# GMNS: General Modeling Network Specification
+##############################################################
+"""Single-pass csv ingestion for the GMNS readers.
+
+The header is read once, the file is then streamed in blocks of ``block_size`` bytes by the
+multi-threaded pyarrow csv reader (pandas when pyarrow is not installed) with column projection
+and explicit dtypes, and progress is reported from the bytes consumed.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterator
+import os
+import csv
+import importlib.util
+import warnings
+
+from pyufunc.util_magic._dependency_requires_decorator import requires
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# bytes sampled to estimate rows per chunk for the pandas engine
+_SAMPLE_SIZE = 1 << 16
+
+
+def _is_utf8(encoding: str) -> bool:
+    return encoding.lower().replace("_", "-") in ("utf-8", "utf8")
+
+
+def read_header(path: str, encoding: str = "utf-8") -> tuple[list[str], str]:
+    """Column names of a csv file from its first line.
+
+    Args:
+        path (str): the csv file.
+        encoding (str): the file encoding; latin-1 is tried if the header does not decode. Defaults to "utf-8".
+
+    Returns:
+        tuple[list[str], str]: the column names and the encoding that decoded them.
+    """
+    for enc in dict.fromkeys((encoding, "latin-1")):
+        try:
+            # utf-8-sig drops a byte order mark, as pandas and pyarrow do
+            with open(path, "r", encoding="utf-8-sig" if _is_utf8(enc) else enc, newline="") as f:
+                return next(csv.reader(f), []), enc
+        except UnicodeDecodeError:
+            continue
+    raise UnicodeDecodeError(encoding, b"", 0, 1, f"Unable to decode the header of {path}")
+
+
+def row_bytes(path: str) -> float:
+    """Average bytes per line of a csv file, estimated from its first 64 KiB."""
+    with open(path, "rb") as f:
+        sample = f.read(_SAMPLE_SIZE)
+    return max(len(sample), 1) / max(sample.count(b"\n"), 1)
+
+
+def _rows_per_chunk(path: str, block_size: int) -> int:
+    """Rows in about block_size bytes, estimated from the start of the file."""
+    return max(1, int(block_size / row_bytes(path)))
+
+
+@requires("pyarrow")
+def _pyarrow_reader(f, columns: list, dtypes: dict, block_size: int, encoding: str):
+    """A streaming pyarrow csv reader with the types pandas would give, reopened if pyarrow inferred others."""
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import numpy as np
+
+    column_types = {name: pa.string() if dtype in ("str", "string", "object") else pa.from_numpy_dtype(np.dtype(dtype))
+                    for name, dtype in dtypes.items()}
+    read_options = pa_csv.ReadOptions(block_size=block_size, use_threads=True, encoding=encoding)
+
+    def open_reader():
+        f.seek(0)
+        # strings_can_be_null: empty text is NaN, as in pandas
+        convert_options = pa_csv.ConvertOptions(include_columns=columns, column_types=column_types,
+                                                strings_can_be_null=True)
+        return pa_csv.open_csv(f, read_options=read_options, convert_options=convert_options)
+
+    reader = open_reader()
+    # pandas keeps dates as text and reads an all-empty column as float
+    retyped = {}
+    for field in reader.schema:
+        if field.name in column_types:
+            continue
+        if pa.types.is_temporal(field.type):
+            retyped[field.name] = pa.string()
+        elif pa.types.is_null(field.type):
+            retyped[field.name] = pa.float64()
+    if retyped:
+        column_types.update(retyped)
+        reader = open_reader()
+    return reader
+
+
+@requires("pandas", "tqdm")
+def iter_csv_chunks(path: str, columns: list, dtypes: dict | None = None, block_size: int = 1 << 22,
+                    encoding: str = "utf-8", desc: str = "", engine: str = "auto") -> Iterator[pd.DataFrame]:
+    """Stream a csv file as DataFrames of about block_size bytes each.
+
+    pyarrow parses blocks on several threads; if it meets a value its inferred column types cannot
+    hold, reading continues with pandas from the next row. pandas parses the file from its start
+    then, but drops the rows pyarrow delivered, so no row is yielded twice.
+
+    Args:
+        path (str): the csv file.
+        columns (list): the columns to read, in this order.
+        dtypes (dict | None): {column: dtype} for columns whose type is known, e.g. {"x_coord": "float64"}.
+            Other columns are inferred. Defaults to None.
+        block_size (int): bytes of csv per chunk. Defaults to 4 MiB.
+        encoding (str): the file encoding. Defaults to "utf-8".
+        desc (str): the label of a progress bar over the bytes read. Defaults to "", no bar.
+        engine (str): "pyarrow", "pandas" or "auto" (pyarrow when installed). Defaults to "auto".
+
+    Raises:
+        ValueError: if a column is not in the file.
+
+    Yields:
+        pd.DataFrame: the next rows, with the given columns.
+    """
+    import pandas as pd
+    from tqdm import tqdm  # pyright: ignore[reportMissingModuleSource]
+
+    header, encoding = read_header(path, encoding)
+    missing = [col for col in columns if col not in header]
+    if missing:
+        raise ValueError(f"Required columns {missing} are not in {path}.")
+    dtypes = {col: dtype for col, dtype in (dtypes or {}).items() if col in columns}
+    if engine == "auto":
+        engine = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "pandas"
+
+    rows_done = 0
+    with tqdm(total=os.path.getsize(path), unit="B", unit_scale=True, desc=desc, disable=not desc) as bar:
+
+        def progress(f):
+            # pyarrow reads ahead, the bar never goes past the file size
+            bar.update(min(f.tell(), bar.total) - bar.n)
+
+        if engine == "pyarrow":
+            import pyarrow as pa
+
+            with open(path, "rb") as f:
+                reader = _pyarrow_reader(f, columns, dtypes, block_size, encoding)
+                try:
+                    for batch in reader:
+                        df = batch.to_pandas()
+                        rows_done += len(df)
+                        progress(f)
+                        yield df[columns]
+                    bar.update(bar.total - bar.n)
+                    return
+                except pa.ArrowInvalid as e:
+                    warnings.warn(f"  : pyarrow could not parse {path} past row {rows_done} ({e}), "
+                                  f"reading on with pandas.")
+
+        # pandas: resume after the rows pyarrow delivered. They are dropped as parsed records, not skipped
+        # as file lines: blank lines are no records to either engine but would shift a line count
+        with open(path, "rb") as f:
+            reader = pd.read_csv(f, usecols=columns, dtype=dtypes or None, encoding=encoding,
+                                 chunksize=_rows_per_chunk(path, block_size))
+            for df in reader:
+                progress(f)
+                if rows_done:
+                    dropped = min(rows_done, len(df))
+                    rows_done -= dropped
+                    df = df.iloc[dropped:]
+                    if df.empty:
+                        continue
+                yield df[columns]
+        bar.update(bar.total - bar.n)
@@ -0,0 +1,191 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Saturday, October 17th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+# GMNS: General Modeling Network Specification
+##############################################################
+"""Dense integer indices for GMNS identifiers.
+
+GMNS ids (node_id, link_id, zone_id, ...) are arbitrary integers. An IdIndex numbers N unique ids
+0..N-1 in the order they are given, and translates whole arrays of ids to indices and back, so that
+joins between links, nodes and zones become NumPy array indexing instead of dict lookups.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from pyufunc.util_magic._dependency_requires_decorator import requires
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = ['IdIndex']
+
+# from this many ids translated at once, they are sorted before the binary search
+_SORT_QUERIES_FROM = 4096
+
+
+class IdIndex:
+    """A bijection between N unique ids and the dense indices 0..N-1, the index of an id being its position.
+
+    Ids that are consecutive integers (e.g. 1..N) are translated by subtraction; any other ids through a
+    sorted copy and ``np.searchsorted``. Either way translation is vectorized over NumPy arrays.
+
+    Args:
+        ids (array-like): unique ids; the index of ids[i] is i.
+
+    Raises:
+        ValueError: if an id is repeated.
+
+    Examples:
+        >>> from pyufunc import gmns_IdIndex
+        >>> index = gmns_IdIndex([100, 7, 42])
+        >>> index.to_index([42, 100])
+        array([2, 0])
+        >>> index.to_id([1, 2])
+        array([ 7, 42])
+        >>> index.to_index([42, 5], missing=-1)
+        array([ 2, -1])
+    """
+    __slots__ = ("_ids", "_start", "_sorted_ids", "_order")
+
+    @requires("numpy")
+    def __init__(self, ids):
+        import numpy as np
+
+        self._ids = np.asarray(ids)
+        if self._ids.ndim != 1:
+            raise ValueError(f"ids should be one-dimensional, but got shape {self._ids.shape}.")
+
+        # consecutive integer ids need no lookup structure
+        self._start = self._sorted_ids = self._order = None
+        n = len(self._ids)
+        if n and self._ids.dtype.kind in "iu" and (n == 1 or (np.diff(self._ids) == 1).all()):
+            self._start = int(self._ids[0])
+            return
+
+        self._order = np.argsort(self._ids, kind="stable")
+        self._sorted_ids = self._ids[self._order]
+        repeated = self._sorted_ids[1:] == self._sorted_ids[:-1]
+        if repeated.any():
+            raise ValueError(f"Duplicate id {self._sorted_ids[1:][repeated][0]!r}.")
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, element_id) -> bool:
+        try:
+            self.index_of(element_id)
+        except KeyError:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        kind = f"consecutive from {self._start}" if self._start is not None else "sorted"
+        return f"{type(self).__name__}({len(self)} ids, {kind})"
+
+    @property
+    def ids(self) -> np.ndarray:
+        """The ids, the id of index i at position i."""
+        return self._ids
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the lookup structure, besides the ids."""
+        return 0 if self._start is not None else self._order.nbytes + self._sorted_ids.nbytes
+
+    def index_of(self, element_id) -> int:
+        """The index of one id.
+
+        Raises:
+            KeyError: if the id is not in the index.
+        """
+        import numpy as np
+
+        n = len(self._ids)
+        try:
+            if self._start is not None:
+                i = int(element_id) - self._start
+            else:
+                i = int(np.searchsorted(self._sorted_ids, element_id))
+                i = int(self._order[i]) if i < n else n
+            if 0 <= i < n and self._ids[i] == element_id:
+                return i
+        except (TypeError, ValueError, OverflowError):
+            pass
+        raise KeyError(element_id)
+
+    def _search(self, ids: np.ndarray) -> np.ndarray:
+        """np.searchsorted of ids in the sorted ids.
+
+        Many ids are searched in sorted order: consecutive binary searches then touch the same memory,
+        which is several times faster on large arrays.
+        """
+        import numpy as np
+
+        if ids.size < _SORT_QUERIES_FROM:
+            return np.searchsorted(self._sorted_ids, ids)
+        flat = ids.ravel()
+        order = np.argsort(flat, kind="stable")
+        found = np.empty(flat.shape, dtype="int64")
+        found[order] = np.searchsorted(self._sorted_ids, flat[order])
+        return found.reshape(ids.shape)
+
+    def to_index(self, ids, missing="raise") -> np.ndarray:
+        """Translate ids to indices.
+
+        Args:
+            ids (array-like): ids to translate, of any shape.
+            missing (str | int): "raise" to raise KeyError for an unknown id, or the index to give
+                unknown ids (e.g. -1). Defaults to "raise".
+
+        Raises:
+            KeyError: if an id is not in the index and missing is "raise".
+
+        Returns:
+            np.ndarray: the indices, int64, in the shape of ids.
+        """
+        import numpy as np
+
+        ids = np.asarray(ids)
+        n = len(self._ids)
+        positions = np.zeros(ids.shape, dtype="int64")
+        found = np.zeros(ids.shape, dtype=bool)
+        if n and ids.size:
+            try:
+                if self._start is not None:
+                    positions = np.clip((ids - self._start).astype("int64"), 0, n - 1)
+                else:
+                    positions = self._order[np.minimum(self._search(ids), n - 1)].astype("int64")
+                found = np.asarray(self._ids[positions] == ids, dtype=bool)
+            except (TypeError, ValueError):
+                # ids of another type (e.g. text for integer ids) are all unknown
+                positions = np.zeros(ids.shape, dtype="int64")
+
+        if not found.all():
+            if isinstance(missing, str) and missing == "raise":
+                raise KeyError(ids[~found].ravel()[0].item())
+            positions[~found] = missing
+        return positions
+
+    def to_id(self, indices) -> np.ndarray:
+        """Translate indices back to ids.
+
+        Args:
+            indices (array-like): integer indices in 0..N-1, of any shape.
+
+        Raises:
+            IndexError: if an index is out of range.
+
+        Returns:
+            np.ndarray: the ids, in the shape of indices.
+        """
+        import numpy as np
+
+        indices = np.asarray(indices)
+        if indices.size and indices.dtype.kind not in "iu":
+            raise TypeError(f"indices should be integers, but got {indices.dtype}.")
+        if indices.size and ((indices < 0) | (indices >= len(self._ids))).any():
+            raise IndexError(f"Index out of range for {len(self._ids)} ids.")
+        return self._ids[indices.astype("int64")]
@@ -0,0 +1,482 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+# GMNS: General Modeling Network Specification
+##############################################################
+"""Columnar (struct-of-arrays) containers for GMNS networks.
+
+A table keeps one NumPy array per attribute instead of one dict per element. It is a read-only
+Mapping {id: row} like the dicts returned by the readers, so ``nodes[7]["x_coord"]`` keeps working,
+while whole columns are available for vectorized scans and export to pandas / Arrow.
+
+Geometries are not kept as live shapely objects: geometry columns are stored as WKB bytes (WKT
+text read from the csv files is kept as is) and decoded on first access, then cached.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterator
+from collections.abc import Mapping
+from dataclasses import fields, MISSING
+
+from pyufunc.util_magic._dependency_requires_decorator import requires
+from pyufunc.util_geo._gmns import Node, Link, POI, Zone, _records_from_columns
+from pyufunc.util_geo._gmns_index import IdIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+__all__ = ['NodeTable', 'LinkTable', 'POITable', 'ZoneTable']
+
+# dtypes of dataclass fields without a column, by the type of the field default (not its annotation,
+# so that e.g. production: float = 0 stays the int 0 the dataclass readers return)
+_FIELD_DTYPES = {"int": "int64", "float": "float64", "bool": "bool"}
+
+
+def _share_repeated_strings(values: np.ndarray) -> np.ndarray:
+    """Let rows with the same text share one str object (e.g. link_type_name, allowed_uses).
+
+    pandas creates a new str per row when a text column is converted to an object array, which
+    makes a low-cardinality column cost one string per row.
+    """
+    if values.dtype != object or not len(values) or not isinstance(values[0], str):
+        return values
+    try:
+        import pandas as pd
+    except ImportError:
+        return values
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    if len(uniques) > len(values) // 2:
+        return values
+    return uniques.astype(object)[codes]
+
+
+def _first_value(values: np.ndarray):
+    """The first value of an object array that is not None / NaN, or None."""
+    for value in values:
+        if value is not None and value == value:
+            return value
+    return None
+
+
+def _is_geometry(value) -> bool:
+    return type(value).__module__.startswith("shapely")
+
+
+@requires("shapely")
+def _decode_geometries(values: np.ndarray) -> np.ndarray:
+    """Shapely geometries of an object array of WKB bytes, WKT text or geometries; anything else is None."""
+    import numpy as np
+    import shapely  # pyright: ignore[reportMissingModuleSource]
+
+    # a column of one kind, missing values as None, is decoded in one call
+    first = _first_value(values)
+    try:
+        if isinstance(first, bytes):
+            return shapely.from_wkb(values, on_invalid="ignore")
+        if isinstance(first, str):
+            return shapely.from_wkt(values, on_invalid="ignore")
+    except (TypeError, shapely.errors.GEOSException):
+        pass
+
+    kinds = np.fromiter((2 if isinstance(value, bytes) else 1 if isinstance(value, str) else
+                         3 if _is_geometry(value) else 0 for value in values), dtype="int8", count=len(values))
+    decoded = np.full(len(values), None, dtype=object)
+    decoded[kinds == 2] = shapely.from_wkb(values[kinds == 2])
+    decoded[kinds == 1] = shapely.from_wkt(values[kinds == 1], on_invalid="ignore")
+    decoded[kinds == 3] = values[kinds == 3]
+    return decoded
+
+
+class _RowView:
+    """One row of a table, read and written through the table columns.
+
+    Supports the ``__getitem__`` / ``__setitem__`` / ``as_dict`` interface of the GMNS dataclasses,
+    values are returned as Python scalars and WKB geometries as shapely geometries.
+    """
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: GmnsTable, row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key):
+        if key in self._table._wkb_columns:
+            return self._table._geometry_at(key, self._row)
+        try:
+            value = self._table._columns[key][self._row]
+        except KeyError:
+            raise KeyError(f"Key {key} not found in {self._table.element.__name__}") from None
+        item = getattr(value, "item", None)
+        return item() if item is not None else value
+
+    def __setitem__(self, key, value):
+        column = self._table.column(key)
+        if key in self._table._wkb_columns:
+            self._table._set_geometry_at(key, self._row, value)
+        else:
+            column[self._row] = value
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(str(e)) from None
+
+    def __contains__(self, key) -> bool:
+        return key in self._table._columns
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _RowView):
+            other = other.as_dict()
+        return isinstance(other, dict) and self.as_dict() == other
+
+    def __repr__(self) -> str:
+        attrs = ", ".join(f"{key}={self[key]!r}" for key in self._table._columns)
+        return f"{self._table.element.__name__}({attrs})"
+
+    def get(self, key, default=None):
+        return self[key] if key in self._table._columns else default
+
+    def keys(self) -> list:
+        return list(self._table._columns)
+
+    def as_dict(self) -> dict:
+        return {key: self[key] for key in self._table._columns}
+
+    def to_networkx(self) -> tuple:
+        return self._table._to_networkx(self)
+
+
+class GmnsTable(Mapping):
+    """A struct-of-arrays table of GMNS elements, a read-only Mapping {id: row view}.
+
+    Every attribute is one NumPy array (numeric columns keep their dtype, text and geometry
+    columns are object arrays). Fields of the element dataclass missing from ``columns`` are
+    filled with their defaults. Ids must be unique; they are looked up through an IdIndex whose
+    dense indices are the row positions (``table.index``), which costs at most two arrays instead
+    of one dict entry per element.
+
+    Columns of shapely geometries are stored as WKB bytes. Rows return them decoded (and cached);
+    ``geometries()`` decodes a whole WKB or WKT column at once.
+
+    Args:
+        columns (dict): {attribute: array-like}, all of the same length, including "id".
+    """
+
+    element: type = object
+    __slots__ = ("_columns", "_ids", "_index", "_wkb_columns", "_geometries", "_geometry_rows")
+
+    @requires("numpy")
+    def __init__(self, columns: dict):
+        import numpy as np
+
+        if "id" not in columns:
+            raise ValueError(f"{type(self).__name__} requires an 'id' column.")
+        columns = {name: _share_repeated_strings(np.asarray(values)) for name, values in columns.items()}
+        wkb_columns = set()
+        for name, values in columns.items():
+            first = _first_value(values) if values.dtype == object else None
+            if _is_geometry(first):
+                import shapely  # pyright: ignore[reportMissingModuleSource]
+
+                columns[name] = shapely.to_wkb(values)
+                first = b""
+            if isinstance(first, bytes):
+                wkb_columns.add(name)
+        n = len(columns["id"])
+        for name, values in columns.items():
+            if values.ndim != 1 or len(values) != n:
+                raise ValueError(f"Column '{name}' has length {len(values)}, expected {n}.")
+
+        # the element's fields first, then extra columns, as the dict readers return them
+        ordered = {}
+        for f in fields(self.element):
+            if f.name in columns:
+                ordered[f.name] = columns.pop(f.name)
+            elif f.default_factory is not MISSING:
+                ordered[f.name] = np.empty(n, dtype=object)
+                for i in range(n):
+                    ordered[f.name][i] = f.default_factory()
+            else:
+                ordered[f.name] = np.full(n, f.default, dtype=_FIELD_DTYPES.get(type(f.default).__name__, object))
+        ordered.update(columns)
+
+        self._columns = ordered
+        self._wkb_columns = frozenset(wkb_columns)
+        # decoded geometries: whole columns, and single rows decoded before their column
+        self._geometries = {}
+        self._geometry_rows = {}
+        self._ids = ordered["id"]
+        try:
+            self._index = IdIndex(self._ids)
+        except ValueError as e:
+            raise ValueError(f"{str(e).rstrip('.')} in {type(self).__name__}.") from None
+
+    @classmethod
+    @requires("numpy")
+    def _from_chunks(cls, chunks) -> GmnsTable:
+        """A table from (ids, columns) chunks; for a repeated id the last row is kept, as in a dict."""
+        import numpy as np
+
+        chunks = list(chunks)
+        if not chunks:
+            return cls({"id": np.empty(0, dtype="int64")})
+        names = list(chunks[0][1])
+        columns = {name: np.concatenate([chunk_columns[name] for _, chunk_columns in chunks]) for name in names}
+
+        # keep the last occurrence of every id, in order of appearance
+        ids = columns["id"]
+        _, first_of_reversed = np.unique(ids[::-1], return_index=True)
+        if len(first_of_reversed) < len(ids):
+            keep = np.sort(len(ids) - 1 - first_of_reversed)
+            columns = {name: values[keep] for name, values in columns.items()}
+        return cls(columns)
+
+    @classmethod
+    @requires("pandas")
+    def from_dataframe(cls, df: pd.DataFrame, id_column: str = "id") -> GmnsTable:
+        """Create a table from a DataFrame, one column per attribute.
+
+        Args:
+            df (pd.DataFrame): the elements, one row each.
+            id_column (str): the column holding the element ids. Defaults to "id".
+
+        Returns:
+            GmnsTable: the table.
+        """
+        columns = {name: df[name].to_numpy() for name in df.columns if name != id_column}
+        columns["id"] = df[id_column].to_numpy()
+        return cls(columns)
+
+    # Mapping interface: {id: row view}
+    def __getitem__(self, element_id) -> _RowView:
+        return _RowView(self, self._row_of(element_id))
+
+    def __iter__(self) -> Iterator:
+        return iter(self._ids.tolist())
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, element_id) -> bool:
+        try:
+            self._row_of(element_id)
+        except KeyError:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} rows, columns={self.columns})"
+
+    def _row_of(self, element_id) -> int:
+        return self._index.index_of(element_id)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """The element ids, in row order."""
+        return self._ids
+
+    @property
+    def index(self) -> IdIndex:
+        """The dense index of the ids: the index of an id is its row position."""
+        return self._index
+
+    @property
+    def columns(self) -> list:
+        """The attribute names."""
+        return list(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays and the id index (object columns count their pointers only)."""
+        return sum(values.nbytes for values in self._columns.values()) + self._index.nbytes
+
+    def column(self, name: str) -> np.ndarray:
+        """The array of one attribute: writing to it updates the table.
+
+        A read-only column (memory-mapped from the cache) is copied into memory on first use, so
+        a cached table accepts the same writes as a parsed one and the cache file is never changed.
+        """
+        try:
+            values = self._columns[name]
+        except KeyError:
+            raise KeyError(f"Key {name} not found in {self.element.__name__}") from None
+        if not values.flags.writeable:
+            values = self._columns[name] = values.copy()
+            if name == "id":
+                self._ids = values
+        return values
+
+    def row(self, position: int) -> _RowView:
+        """The row at a position (0 to len - 1) instead of an id."""
+        if not -len(self) <= position < len(self):
+            raise IndexError(f"Row {position} out of range for {len(self)} rows.")
+        return _RowView(self, position % len(self))
+
+    def rows_of(self, element_ids) -> np.ndarray:
+        """The row positions of many ids at once.
+
+        Args:
+            element_ids (array-like): ids to look up.
+
+        Raises:
+            KeyError: if an id is not in the table.
+
+        Returns:
+            np.ndarray: the row positions, int64.
+        """
+        return self._index.to_index(element_ids)
+
+    def attach_index(self, column: str, index: IdIndex | GmnsTable, missing: int = -1) -> np.ndarray:
+        """Add the dense indices of the ids in a column, e.g. link from_node_id into the node table.
+
+        The new column is named after column with "_id" replaced by "_index" (from_node_id ->
+        from_node_index), so that joins become array indexing: ``nodes.column("x_coord")[from_node_index]``.
+
+        Args:
+            column (str): a column of ids, e.g. "from_node_id".
+            index (IdIndex | GmnsTable): the index of the ids, or the table they refer to.
+            missing (int): the index of ids not in index. Defaults to -1.
+
+        Returns:
+            np.ndarray: the new column, int64.
+
+        Examples:
+            >>> links.attach_index("from_node_id", nodes)
+            >>> links.attach_index("to_node_id", nodes)
+            >>> from_x = nodes.column("x_coord")[links.column("from_node_index")]
+        """
+        if isinstance(index, GmnsTable):
+            index = index.index
+        name = f"{column[:-3] if column.endswith('_id') else column}_index"
+        self._columns[name] = index.to_index(self.column(column), missing=missing)
+        return self._columns[name]
+
+    @requires("shapely")
+    def geometries(self, name: str = "geometry") -> np.ndarray:
+        """The shapely geometries of a WKB or WKT column, decoded for all rows at once and cached.
+
+        Args:
+            name (str): the geometry column. Defaults to "geometry".
+
+        Returns:
+            np.ndarray: an object array of shapely geometries, None where a row has no geometry.
+                It is the cache: do not modify it, set rows through the table instead.
+
+        Examples:
+            >>> import shapely
+            >>> links = gmns_read_link(link_file=r"../dataset/ASU/link.csv", as_table=True)
+            >>> lengths = shapely.length(links.geometries())
+        """
+        if name not in self._geometries:
+            self._geometries[name] = _decode_geometries(self.column(name))
+            self._geometry_rows.pop(name, None)
+        return self._geometries[name]
+
+    def _geometry_at(self, name: str, row: int):
+        if name in self._geometries:
+            return self._geometries[name][row]
+        rows = self._geometry_rows.setdefault(name, {})
+        if row not in rows:
+            rows[row] = _decode_geometries(self._columns[name][row:row + 1])[0]
+        return rows[row]
+
+    def _set_geometry_at(self, name: str, row: int, value) -> None:
+        import shapely  # pyright: ignore[reportMissingModuleSource]
+
+        self.column(name)[row] = shapely.to_wkb(value) if _is_geometry(value) else value
+        if name in self._geometries:
+            self._geometries[name][row] = _decode_geometries(self._columns[name][row:row + 1])[0]
+        self._geometry_rows.get(name, {}).pop(row, None)
+
+    def _decoded_columns(self) -> dict:
+        """The columns with WKB columns decoded to shapely geometries."""
+        return {name: self.geometries(name) if name in self._wkb_columns else values
+                for name, values in self._columns.items()}
+
+    def to_dict(self) -> dict:
+        """The elements as {id: {attribute: value}}, the format of the dict readers."""
+        return _records_from_columns(self.element, self._decoded_columns(), self._ids)
+
+    @requires("pandas")
+    def to_pandas(self) -> pd.DataFrame:
+        """A DataFrame with one column per attribute; columns share memory with the table where pandas allows.
+
+        WKB geometry columns are decoded to shapely geometries.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self._decoded_columns(), copy=False)
+
+    @requires("pyarrow")
+    def to_arrow(self) -> pa.Table:
+        """A pyarrow Table with one column per attribute.
+
+        Numeric columns are wrapped without copying; geometry columns are stored as WKB.
+        """
+        import pyarrow as pa
+
+        arrays = {}
+        for name, values in self._columns.items():
+            try:
+                arrays[name] = pa.array(values, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                import shapely  # pyright: ignore[reportMissingModuleSource]
+
+                if not shapely.is_geometry(values).all():
+                    raise
+                arrays[name] = pa.array(shapely.to_wkb(values), type=pa.binary())
+        return pa.table(arrays)
+
+    def _to_networkx(self, row: _RowView) -> tuple:
+        return (row["id"], row.as_dict())
+
+
+class NodeTable(GmnsTable):
+    """Nodes of a GMNS network as columns, a Mapping {node_id: row} with the attributes of Node.
+
+    Examples:
+        >>> from pyufunc import gmns_read_node
+        >>> nodes = gmns_read_node(node_file=r"../dataset/ASU/node.csv", as_table=True)
+        >>> nodes[1]["x_coord"]
+        -111.93
+        >>> nodes.column("x_coord").mean()
+        -111.9
+        >>> df_node = nodes.to_pandas()
+    """
+    element = Node
+    __slots__ = ()
+
+
+class LinkTable(GmnsTable):
+    """Links of a GMNS network as columns, a Mapping {link_id: row} with the attributes of Link.
+
+    Examples:
+        >>> from pyufunc import gmns_read_link
+        >>> links = gmns_read_link(link_file=r"../dataset/ASU/link.csv", as_table=True)
+        >>> links[1].to_networkx()
+        (1, 2, {'id': 1, 'name': 'A', ..., 'weight': 10.0})
+        >>> long_links = links.ids[links.column("length") > 1000]
+    """
+    element = Link
+    __slots__ = ()
+
+    def _to_networkx(self, row: _RowView) -> tuple:
+        return (row["from_node_id"], row["to_node_id"], {**row.as_dict(), "weight": row["length"]})
+
+
+class POITable(GmnsTable):
+    """POIs of a GMNS network as columns, a Mapping {poi_id: row} with the attributes of POI."""
+    element = POI
+    __slots__ = ()
+
+
+class ZoneTable(GmnsTable):
+    """Zones of a GMNS network as columns, a Mapping {zone_id: row} with the attributes of Zone."""
+    element = Zone
+    __slots__ = ()
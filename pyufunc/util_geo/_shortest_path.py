@@ -4,53 +4,461 @@
 # Contact Info: luoxiangyong01@gmail.com
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
+"""Shortest paths over a compressed sparse row (CSR) road graph.
 
-# _shortest_path.py
-# from ._dijkstra import dijkstra
-# from ._floyd import floyd
-# from ._bellman_ford import bellman_ford
-# from ._johnson import johnson
-# from ._astar import astar
-# fomr ._bidirectional_astar import bidirectional_astar
-# from ._landmark import landmark
-# from ._ch import ch
-# from ._contraction import contraction
-# from ._contraction_hierarchical import contraction_hierarchical
-# from ._contraction_parallel import contraction_parallel
-# from ._contraction_parallel_hierarchical import contraction_parallel_hierarchical
-
-# Generally, there are tow type of shortest path algorithms:
-# 1. Single-source shortest path algorithms
-#    - Dijkstra's algorithm
-#    - Bellman-Ford algorithm
-#    - A* search algorithm
-#    - Bidirectional A* search algorithm
-#    - Landmark path algorithm
-#    - Contraction path algorithm
-#    - Contraction Hierarchical path algorithm
-#    - Contraction Parallel path algorithm
-#    - Contraction Parallel Hierarchical path algorithm
-# 2. All-pairs shortest path algorithms
-#    - Floyd-Warshall algorithm
-#    - Johnson's algorithm
-#    - CH algorithm
-
-# Besides, there are two types of implementations for shortest path algorithms:
-# 1. Label setting algorithms
-#    - Dijkstra's algorithm
-#    - Bellman-Ford algorithm
-#    - A* search algorithm
-#    - Bidirectional A* search algorithm
-#    - Landmark path algorithm
-#    - Contraction path algorithm
-#    - Contraction Hierarchical path algorithm
-#    - Contraction Parallel path algorithm
-#    - Contraction Parallel Hierarchical path algorithm
-# 2. Label correcting algorithms
-#    - Floyd-Warshall algorithm
-#    - Johnson's algorithm
-#    - CH algorithm
-#    - Contraction path algorithm
-#    - Contraction Hierarchical path algorithm
-#    - Contraction Parallel path algorithm
-#    - Contraction Parallel Hierarchical path algorithm
+The graph is built from the links of a GMNS network (``from_node_id``, ``to_node_id`` and a weight,
+e.g. ``length``) into flat NumPy arrays: the links leaving node i are at positions
+``indptr[i]:indptr[i + 1]`` of ``heads`` (to-node index), ``weights`` and ``link_ids``. The searches
+are label setting with a binary heap:
+
+- Dijkstra, single source (all nodes) or point to point
+- A*, with a haversine lower bound from the node coordinates
+- bidirectional Dijkstra, a forward search from the source and a backward search from the target
+
+The search kernels are compiled with numba when the JIT is on (see set_jit) and run as plain Python
+over memoryviews of the arrays otherwise; no networkx objects are built.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+import heapq
+import math
+
+from pyufunc.util_magic._dependency_requires_decorator import requires
+from pyufunc.util_magic._jit import jit
+from pyufunc.util_geo._gmns_index import IdIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = ['CSRGraph', 'ShortestPath']
+
+_METHODS = ("dijkstra", "astar", "bidirectional")
+
+
+@dataclass
+class ShortestPath:
+    """A shortest path between two nodes.
+
+    Attributes:
+        cost: the sum of the link weights, inf if the target cannot be reached.
+        nodes: the node ids from source to target, empty if the target cannot be reached.
+        links: the link ids from source to target, one less than nodes.
+        settled: the number of nodes the search settled, a measure of its work.
+    """
+
+    cost: float = math.inf
+    nodes: list = field(default_factory=list)
+    links: list = field(default_factory=list)
+    settled: int = 0
+
+
+# ---------------------------------------------------------------- search kernels
+# written in the numba subset: they run compiled over NumPy arrays, or as Python over memoryviews
+
+@jit
+def _dijkstra_search(indptr, heads, weights, source, target, dist, pred) -> int:
+    """Dijkstra from source until target is settled (all nodes if target is -1); returns nodes settled."""
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    settled = 0
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        settled += 1
+        if u == target:
+            break
+        for e in range(indptr[u], indptr[u + 1]):
+            v = heads[e]
+            nd = d + weights[e]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = e
+                heapq.heappush(heap, (nd, v))
+    return settled
+
+
+@jit
+def _astar_search(indptr, heads, weights, source, target, dist, pred, lat, lon, cos_lat, scale) -> int:
+    """A* from source to target; the heuristic is scale times the central angle to target, a lower bound."""
+    lat_t = lat[target]
+    lon_t = lon[target]
+    cos_t = cos_lat[target]
+    dist[source] = 0.0
+    heap = [(0.0, 0.0, source)]
+    settled = 0
+    while heap:
+        _, d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        settled += 1
+        if u == target:
+            break
+        for e in range(indptr[u], indptr[u + 1]):
+            v = heads[e]
+            nd = d + weights[e]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = e
+                s_lat = math.sin((lat[v] - lat_t) * 0.5)
+                s_lon = math.sin((lon[v] - lon_t) * 0.5)
+                a = s_lat * s_lat + cos_lat[v] * cos_t * s_lon * s_lon
+                h = scale * 2.0 * math.asin(math.sqrt(min(a, 1.0)))
+                heapq.heappush(heap, (nd + h, nd, v))
+    return settled
+
+
+@jit
+def _bidirectional_search(indptr, heads, weights, r_indptr, r_tails, r_weights, source, target,
+                          dist_f, pred_f, dist_b, pred_b, meet) -> int:
+    """Bidirectional Dijkstra; the node where the shortest path meets is written to meet[0] (-1 if none)."""
+    dist_f[source] = 0.0
+    dist_b[target] = 0.0
+    heap_f = [(0.0, source)]
+    heap_b = [(0.0, target)]
+    best = math.inf
+    meet[0] = source if source == target else -1
+    if source == target:
+        best = 0.0
+    settled = 0
+    while heap_f and heap_b:
+        # no path through unsettled nodes can be shorter than the two smallest keys together
+        if heap_f[0][0] + heap_b[0][0] >= best:
+            break
+        if heap_f[0][0] <= heap_b[0][0]:
+            d, u = heapq.heappop(heap_f)
+            if d > dist_f[u]:
+                continue
+            settled += 1
+            for e in range(indptr[u], indptr[u + 1]):
+                v = heads[e]
+                nd = d + weights[e]
+                if nd < dist_f[v]:
+                    dist_f[v] = nd
+                    pred_f[v] = e
+                    heapq.heappush(heap_f, (nd, v))
+                    if nd + dist_b[v] < best:
+                        best = nd + dist_b[v]
+                        meet[0] = v
+        else:
+            d, u = heapq.heappop(heap_b)
+            if d > dist_b[u]:
+                continue
+            settled += 1
+            for r in range(r_indptr[u], r_indptr[u + 1]):
+                v = r_tails[r]
+                nd = d + r_weights[r]
+                if nd < dist_b[v]:
+                    dist_b[v] = nd
+                    pred_b[v] = r
+                    heapq.heappush(heap_b, (nd, v))
+                    if nd + dist_f[v] < best:
+                        best = nd + dist_f[v]
+                        meet[0] = v
+    return settled
+
+
+def _kernel_args(kernel, *arrays) -> tuple:
+    """The arrays for a kernel: as they are when it runs compiled, memoryviews (fast item access) otherwise."""
+    if kernel.compiled:
+        return arrays
+    return tuple(memoryview(array) for array in arrays)
+
+
+def _central_angle(lat1, lon1, lat2, lon2):
+    """Haversine central angle (radians) between points given in radians, NumPy vectorized."""
+    import numpy as np
+
+    a = np.sin((lat2 - lat1) * 0.5) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) * 0.5) ** 2
+    return 2.0 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _link_columns(links, names: tuple) -> dict:
+    """Columns of a LinkTable, or of a {link_id: link} dict as returned by read_link."""
+    import numpy as np
+
+    if hasattr(links, "column") and hasattr(links, "ids"):
+        return {name: links.column(name) for name in names if name in links.columns}
+    rows = list(links.values())
+    columns = {"id": np.fromiter(links.keys(), dtype="int64", count=len(rows))}
+    for name in names:
+        if name != "id" and rows and name in rows[0]:
+            columns[name] = np.array([row[name] for row in rows])
+    return columns
+
+
+class CSRGraph:
+    """A directed road network in compressed sparse row form, for shortest paths without networkx.
+
+    Nodes are numbered by an IdIndex (the index of a node id is its position in node_index.ids); the
+    links leaving node i are at positions indptr[i]:indptr[i + 1] of heads, weights and link_ids.
+    Weights must be finite and non-negative.
+
+    Args:
+        from_nodes (array-like): the from node id of every link.
+        to_nodes (array-like): the to node id of every link.
+        weights (array-like): the weight (length, travel time, ...) of every link.
+        link_ids (array-like | None): the link ids. Defaults to None, the link positions 0..M-1.
+        node_index (IdIndex | None): the node ids. Defaults to None, the sorted ids of the link ends.
+        x_coord (array-like | None): longitude of every node of node_index, in degrees, for A*. Defaults to None.
+        y_coord (array-like | None): latitude of every node of node_index, in degrees, for A*. Defaults to None.
+
+    Raises:
+        ValueError: if a weight is negative or not finite, or a link end is not in node_index.
+
+    Examples:
+        >>> from pyufunc import gmns_read_node, gmns_read_link, CSRGraph
+        >>> nodes = gmns_read_node(node_file=r"../dataset/ASU/node.csv", as_table=True)
+        >>> links = gmns_read_link(link_file=r"../dataset/ASU/link.csv", as_table=True)
+        >>> graph = CSRGraph.from_links(links, nodes, weight="length")
+        >>> path = graph.shortest_path(1, 100)
+        >>> path.cost, path.nodes, path.links
+        (1234.5, [1, 7, ..., 100], [3, 18, ...])
+        >>> graph.shortest_path(1, 100, method="astar").cost
+        1234.5
+    """
+    __slots__ = ("node_index", "indptr", "heads", "weights", "link_ids", "_tails",
+                 "_lat", "_lon", "_cos_lat", "_scale", "_reverse")
+
+    @requires("numpy")
+    def __init__(self, from_nodes, to_nodes, weights, link_ids=None, node_index: IdIndex | None = None,
+                 x_coord=None, y_coord=None):
+        import numpy as np
+
+        from_nodes, to_nodes = np.asarray(from_nodes), np.asarray(to_nodes)
+        weights = np.asarray(weights, dtype="float64")
+        if not (len(from_nodes) == len(to_nodes) == len(weights)):
+            raise ValueError("from_nodes, to_nodes and weights should have the same length.")
+        if len(weights) and not (np.isfinite(weights).all() and (weights >= 0).all()):
+            raise ValueError("Link weights should be finite and non-negative.")
+        link_ids = np.arange(len(weights)) if link_ids is None else np.asarray(link_ids)
+
+        if node_index is None:
+            # sort and drop repeats: faster than np.unique on millions of ids
+            ends = np.sort(np.concatenate([from_nodes, to_nodes]))
+            node_index = IdIndex(ends[np.concatenate([[True], ends[1:] != ends[:-1]])] if len(ends) else ends)
+        self.node_index = node_index
+        try:
+            tails = self.node_index.to_index(from_nodes)
+            heads = self.node_index.to_index(to_nodes)
+        except KeyError as e:
+            raise ValueError(f"Link end node {e.args[0]} is not in node_index.") from None
+
+        # links sorted by from node: the links of node i are indptr[i]:indptr[i + 1]
+        n = len(self.node_index)
+        order = np.argsort(tails, kind="stable")
+        self.indptr = np.zeros(n + 1, dtype="int64")
+        np.cumsum(np.bincount(tails, minlength=n), out=self.indptr[1:])
+        self._tails = np.ascontiguousarray(tails[order], dtype="int64")
+        self.heads = np.ascontiguousarray(heads[order], dtype="int64")
+        self.weights = np.ascontiguousarray(weights[order])
+        self.link_ids = link_ids[order]
+        self._reverse = None
+
+        self._lat = self._lon = self._cos_lat = None
+        self._scale = 0.0
+        if x_coord is not None and y_coord is not None:
+            self._set_coordinates(np.asarray(x_coord, dtype="float64"), np.asarray(y_coord, dtype="float64"))
+
+    @classmethod
+    @requires("numpy")
+    def from_links(cls, links, nodes=None, weight: str = "length") -> CSRGraph:
+        """Build the graph of a GMNS network from read_link (and read_node) output.
+
+        Links with dir_flag -1 run from to_node_id to from_node_id, links with dir_flag 0 both ways.
+
+        Args:
+            links (LinkTable | dict): links as returned by read_link, with or without as_table.
+            nodes (NodeTable | dict | None): nodes as returned by read_node. With nodes, every node is
+                in the graph (also without links) and A* can use the coordinates. Defaults to None.
+            weight (str): the link cost: a link attribute such as "length", or "free_flow_time" for
+                length / free_speed. Defaults to "length".
+
+        Returns:
+            CSRGraph: the graph.
+        """
+        import numpy as np
+
+        names = ("id", "from_node_id", "to_node_id", "dir_flag", "length", "free_speed", weight)
+        columns = _link_columns(links, names)
+        if weight == "free_flow_time":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                weights = np.asarray(columns["length"], dtype="float64") / np.asarray(columns["free_speed"],
+                                                                                      dtype="float64")
+        elif weight in columns:
+            weights = np.asarray(columns[weight], dtype="float64")
+        else:
+            raise KeyError(f"Key {weight} not found in Link")
+
+        from_nodes, to_nodes, link_ids = columns["from_node_id"], columns["to_node_id"], columns["id"]
+        if "dir_flag" in columns:
+            dir_flag = np.asarray(columns["dir_flag"])
+            backward = dir_flag == -1
+            both = dir_flag == 0
+            from_nodes, to_nodes = np.where(backward, to_nodes, from_nodes), np.where(backward, from_nodes, to_nodes)
+            from_nodes = np.concatenate([from_nodes, to_nodes[both]])
+            to_nodes = np.concatenate([to_nodes, np.asarray(columns["from_node_id"])[both]])
+            weights = np.concatenate([weights, weights[both]])
+            link_ids = np.concatenate([link_ids, link_ids[both]])
+
+        node_index = x_coord = y_coord = None
+        if nodes is not None:
+            if hasattr(nodes, "index") and hasattr(nodes, "column"):
+                node_index = nodes.index
+                x_coord, y_coord = nodes.column("x_coord"), nodes.column("y_coord")
+            elif isinstance(nodes, Mapping):
+                node_index = IdIndex(np.fromiter(nodes.keys(), dtype="int64", count=len(nodes)))
+                x_coord = np.array([node["x_coord"] for node in nodes.values()], dtype="float64")
+                y_coord = np.array([node["y_coord"] for node in nodes.values()], dtype="float64")
+        return cls(from_nodes, to_nodes, weights, link_ids, node_index, x_coord, y_coord)
+
+    def _set_coordinates(self, x_coord, y_coord) -> None:
+        """Node coordinates for A*, and the largest scale keeping the haversine heuristic a lower bound."""
+        import numpy as np
+
+        if len(x_coord) != len(self.node_index) or len(y_coord) != len(self.node_index):
+            raise ValueError("x_coord and y_coord should give one coordinate per node.")
+        self._lat = np.ascontiguousarray(np.radians(y_coord))
+        self._lon = np.ascontiguousarray(np.radians(x_coord))
+        self._cos_lat = np.cos(self._lat)
+
+        # every link costs at least scale * angle between its ends, so scale * angle to the target
+        # never exceeds the remaining cost (and is consistent, by the triangle inequality)
+        angle = _central_angle(self._lat[self._tails], self._lon[self._tails],
+                               self._lat[self.heads], self._lon[self.heads])
+        valid = angle > 0
+        ratio = self.weights[valid] / angle[valid]
+        ratio = ratio[np.isfinite(ratio)]
+        self._scale = float(ratio.min()) * (1 - 1e-9) if len(ratio) and np.isfinite(self._lat).all() \
+            and np.isfinite(self._lon).all() else 0.0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.n_nodes} nodes, {self.n_links} links)"
+
+    @property
+    def n_nodes(self) -> int:
+        """The number of nodes."""
+        return len(self.indptr) - 1
+
+    @property
+    def n_links(self) -> int:
+        """The number of (directed) links."""
+        return len(self.heads)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the graph arrays."""
+        arrays = [self.indptr, self.heads, self.weights, self.link_ids, self._tails,
+                  self._lat, self._lon, self._cos_lat, *(self._reverse or ())]
+        return sum(array.nbytes for array in arrays if array is not None) + self.node_index.nbytes
+
+    def _reversed(self) -> tuple:
+        """(indptr, tails, weights, link positions) of the links entering every node, built on first use."""
+        import numpy as np
+
+        if self._reverse is None:
+            order = np.argsort(self.heads, kind="stable")
+            r_indptr = np.zeros(self.n_nodes + 1, dtype="int64")
+            np.cumsum(np.bincount(self.heads, minlength=self.n_nodes), out=r_indptr[1:])
+            self._reverse = (r_indptr, np.ascontiguousarray(self._tails[order]),
+                             np.ascontiguousarray(self.weights[order]), order.astype("int64"))
+        return self._reverse
+
+    def _buffers(self, n_buffers: int) -> list:
+        import numpy as np
+
+        return [buffer for _ in range(n_buffers)
+                for buffer in (np.full(self.n_nodes, np.inf), np.full(self.n_nodes, -1, dtype="int64"))]
+
+    def distances(self, source) -> np.ndarray:
+        """Shortest path costs from source to every node (Dijkstra).
+
+        Args:
+            source: the source node id.
+
+        Raises:
+            KeyError: if source is not a node of the graph.
+
+        Returns:
+            np.ndarray: the cost to every node in node index order, inf where not reachable.
+        """
+        s = self.node_index.index_of(source)
+        dist, pred = self._buffers(1)
+        _dijkstra_search(*_kernel_args(_dijkstra_search, self.indptr, self.heads, self.weights),
+                         s, -1, *_kernel_args(_dijkstra_search, dist, pred))
+        return dist
+
+    def shortest_path(self, source, target, method: str = "bidirectional") -> ShortestPath:
+        """The shortest path from source to target.
+
+        Args:
+            source: the source node id.
+            target: the target node id.
+            method (str): "dijkstra", "astar" (requires node coordinates) or "bidirectional".
+                Defaults to "bidirectional".
+
+        Raises:
+            KeyError: if source or target is not a node of the graph.
+            ValueError: if method is unknown, or "astar" without node coordinates.
+
+        Returns:
+            ShortestPath: the cost and the node and link ids of the path; cost inf if target is not reachable.
+        """
+        if method not in _METHODS:
+            raise ValueError(f"method should be one of {_METHODS}, but got {method!r}.")
+        s, t = self.node_index.index_of(source), self.node_index.index_of(target)
+
+        if method == "bidirectional":
+            r_indptr, r_tails, r_weights, r_links = self._reversed()
+            dist_f, pred_f, dist_b, pred_b = self._buffers(2)
+            meet = self.indptr[:1].copy()
+            settled = _bidirectional_search(
+                *_kernel_args(_bidirectional_search, self.indptr, self.heads, self.weights,
+                              r_indptr, r_tails, r_weights), s, t,
+                *_kernel_args(_bidirectional_search, dist_f, pred_f, dist_b, pred_b, meet))
+            m = int(meet[0])
+            if m < 0:
+                return ShortestPath(settled=settled)
+            edges = self._edges_to(m, pred_f)
+            # from the meeting node on, follow the backward search's links to the target
+            v = m
+            while v != t:
+                e = int(r_links[pred_b[v]])
+                edges.append(e)
+                v = int(self.heads[e])
+            return self._path(s, edges, float(dist_f[m] + dist_b[m]), settled)
+
+        dist, pred = self._buffers(1)
+        if method == "astar":
+            if self._lat is None:
+                raise ValueError("A* needs node coordinates, build the graph with nodes.")
+            settled = _astar_search(
+                *_kernel_args(_astar_search, self.indptr, self.heads, self.weights), s, t,
+                *_kernel_args(_astar_search, dist, pred, self._lat, self._lon, self._cos_lat), self._scale)
+        else:
+            settled = _dijkstra_search(*_kernel_args(_dijkstra_search, self.indptr, self.heads, self.weights),
+                                       s, t, *_kernel_args(_dijkstra_search, dist, pred))
+        if not dist[t] < math.inf:
+            return ShortestPath(settled=settled)
+        return self._path(s, self._edges_to(t, pred), float(dist[t]), settled)
+
+    def _edges_to(self, node: int, pred) -> list:
+        """Link positions from the search source to node, following the predecessor links."""
+        edges = []
+        while pred[node] >= 0:
+            e = int(pred[node])
+            edges.append(e)
+            node = int(self._tails[e])
+        edges.reverse()
+        return edges
+
+    def _path(self, s: int, edges: list, cost: float, settled: int) -> ShortestPath:
+        import numpy as np
+
+        edges = np.asarray(edges, dtype="int64")
+        node_positions = np.concatenate([[s], self.heads[edges]]).astype("int64")
+        return ShortestPath(cost=cost, nodes=self.node_index.to_id(node_positions).tolist(),
+                            links=self.link_ids[edges].tolist(), settled=settled)
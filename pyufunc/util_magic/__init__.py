@@ -22,12 +22,26 @@ from ._import_package import (
     get_user_imported_module,
     is_user_defined_func)
 
-from ._dependency_requires_decorator import requires
+from ._dependency_requires_decorator import requires, get_missing_dependencies
 from ._func_time_decorator import func_running_time, func_time
+from ._instrument import (instrument,
+                          record_timing,
+                          set_instrumentation,
+                          reset_instrumentation,
+                          get_instrumentation_stats,
+                          export_instrumentation)
 from ._run_parallel_decorator import run_parallel
+from ._run_concurrent import run_concurrent, run_concurrent_async
+from ._executor import ParallelExecutor, TaskError
+from ._worker_pool import configure_worker_pool, get_worker_pool, shutdown_worker_pool
+from ._shared_memory import SharedMemoryTransport
+from ._cache import memoize, stable_hash
+from ._batch import batch
+from ._jit import jit, set_jit, is_jit_enabled, jit_available
+from ._task_graph import TaskGraph, TaskRef, FileInput
 from ._end_of_life_decorator import end_of_life
 from ._count_code_size import count_lines_of_code
-from ._time_out import timeout, timeout_linux
+from ._time_out import timeout, timeout_linux, CancellationToken
 from ._convert_py_to_dll import cvt_py_to_dll
 
 
@@ -51,14 +65,57 @@ __all__ = [
 
     # _decorator_dependency_requires
     "requires",
+    "get_missing_dependencies",
 
     # _decorator_func_time
     "func_running_time",
     "func_time",
 
+    # _instrument
+    "instrument",
+    "record_timing",
+    "set_instrumentation",
+    "reset_instrumentation",
+    "get_instrumentation_stats",
+    "export_instrumentation",
+
     # _decorator_run_parallel
     "run_parallel",
 
+    # _executor
+    "ParallelExecutor",
+    "TaskError",
+
+    # _run_concurrent
+    "run_concurrent",
+    "run_concurrent_async",
+
+    # _worker_pool
+    "configure_worker_pool",
+    "get_worker_pool",
+    "shutdown_worker_pool",
+
+    # _shared_memory
+    "SharedMemoryTransport",
+
+    # _cache
+    "memoize",
+    "stable_hash",
+
+    # _batch
+    "batch",
+
+    # _jit
+    "jit",
+    "set_jit",
+    "is_jit_enabled",
+    "jit_available",
+
+    # _task_graph
+    "TaskGraph",
+    "TaskRef",
+    "FileInput",
+
     # _decorator_end_of_life
     "end_of_life",
 
@@ -68,6 +125,7 @@ __all__ = [
     # _time_out
     "timeout",
     "timeout_linux",
+    "CancellationToken",
 
     # _convert_py_to_dll
     "cvt_py_to_dll"
@@ -0,0 +1,199 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import math
+import numbers
+import functools
+from collections.abc import Callable, Iterable
+
+from pyufunc.util_magic._dependency_requires_decorator import requires
+from pyufunc.util_magic._executor import ParallelExecutor, TaskError
+
+# below this many elements the element-wise path runs in the calling process
+_PARALLEL_MIN_SIZE = 50_000
+
+
+def _call_element(func: Callable, kwargs: dict, args: tuple):
+    return func(*args, **kwargs)
+
+
+def _is_scalar(value) -> bool:
+    return value is None or isinstance(value, (str, bytes, numbers.Number))
+
+
+def _as_column(value):
+    """A per-element input as a sequence: ndarray as is, Series / iterables as ndarray or list."""
+    import numpy as np
+
+    if isinstance(value, np.ndarray):
+        return value
+    if hasattr(value, "to_numpy"):  # pandas Series / Index
+        return value.to_numpy()
+    if isinstance(value, Iterable):
+        return list(value)
+    raise TypeError(f"batch inputs should be arrays, Series or iterables, but got {type(value).__name__}.")
+
+
+def _to_float_array(values):
+    """Convert a kernel input to a float array, non-numeric elements become NaN."""
+    import numpy as np
+
+    values = np.asarray(values)
+    if values.dtype.kind in "biuf":
+        return values.astype(float, copy=False)
+    return np.array([value if isinstance(value, numbers.Real) else np.nan for value in values.ravel()],
+                    dtype=float).reshape(values.shape)
+
+
+def _kernel_input(column):
+    """A column as ndarray for kernels, mixed lists as object arrays instead of coerced strings."""
+    import numpy as np
+
+    try:
+        array = np.asarray(column)
+    except ValueError:  # ragged elements
+        array = None
+    if array is None or (array.dtype.kind in "US" and not all(isinstance(v, str) for v in column)):
+        array = np.empty(len(column), dtype=object)
+        array[:] = list(column)
+    return array
+
+
+def _is_failure(value) -> bool:
+    if value is None or isinstance(value, TaskError):
+        return True
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _assemble(results: list):
+    """Stack element results into a float array (n,) / (n, k), or an object array for other values."""
+    import numpy as np
+
+    failed = np.fromiter((_is_failure(value) for value in results), dtype=bool, count=len(results))
+    ok = [value for value, bad in zip(results, failed) if not bad]
+
+    def _is_number(value):
+        return isinstance(value, numbers.Real)
+
+    if ok and all(_is_number(value) for value in ok):
+        values = np.full(len(results), np.nan)
+        values[~failed] = ok
+    elif ok and all(isinstance(value, tuple) and all(_is_number(v) for v in value) for value in ok) \
+            and len({len(value) for value in ok}) == 1:
+        values = np.full((len(results), len(ok[0])), np.nan)
+        values[~failed] = ok
+    else:
+        values = np.empty(len(results), dtype=object)
+        values[:] = [np.nan if bad else value for value, bad in zip(results, failed)]
+    return values, failed
+
+
+@requires("numpy")
+def _run_batch(func: Callable, state: dict, *args, parallel: bool | None = None, max_workers: int | None = None,
+               return_mask: bool = False, **kwargs):
+    import numpy as np
+
+    columns = {i: _as_column(arg) for i, arg in enumerate(args) if not _is_scalar(arg)}
+    if not columns:
+        raise ValueError("batch needs at least one array, Series or iterable positional argument.")
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) != 1:
+        raise ValueError(f"batch inputs should have the same length, but got lengths {sorted(lengths)}.")
+    size = lengths.pop()
+
+    kernel = state["kernel"]
+    if kernel is not None:
+        kernel_args = [_kernel_input(columns[i]) if i in columns else arg for i, arg in enumerate(args)]
+        values = kernel(*kernel_args, **kwargs)
+        if isinstance(values, tuple):
+            values = np.column_stack(values)
+        values = np.asarray(values, dtype=float)
+        if values.shape[0] != size:
+            raise ValueError(f"The kernel of {func.__name__} returned {values.shape[0]} rows for {size} inputs.")
+        failed = np.isnan(values) if values.ndim == 1 else np.isnan(values).any(axis=1)
+        if values.ndim > 1:
+            values[failed] = np.nan
+    else:
+        rows = zip(*(columns[i] if i in columns else [arg] * size for i, arg in enumerate(args)))
+        call = functools.partial(_call_element, func, kwargs)
+        if parallel is None:
+            parallel = size >= _PARALLEL_MIN_SIZE
+        if parallel:
+            # max_workers=None defers to the shared pool's size, a given value only caps the running chunks
+            executor = ParallelExecutor(backend="process", max_workers=max_workers, on_error="capture",
+                                        shared_pool=True)
+            results = executor.map(call, rows)
+        else:
+            results = []
+            for row in rows:
+                try:
+                    results.append(call(row))
+                except Exception:
+                    results.append(None)
+        values, failed = _assemble(results)
+
+    return (values, failed) if return_mask else values
+
+
+def batch(func: Callable = None, *, kernel: Callable | None = None) -> Callable:
+    """A decorator that adds a ``.batch()`` entry point to a scalar function.
+
+    The decorated function itself is returned unchanged, so scalar calls cost nothing extra.
+    ``func.batch(*args, **kwargs)`` runs it over NumPy arrays, pandas Series or iterables:
+    positional arguments that are arrays / iterables are taken element by element (2-D arrays
+    row by row), scalar positional arguments and all keyword arguments are passed to every call.
+
+    With a registered vectorized kernel, the whole batch is computed by the kernel in one call.
+    Otherwise the function is mapped element by element, in chunks on the shared worker pool for
+    large inputs (see ParallelExecutor). Failed elements (raised, returned None or NaN) are NaN in
+    the result.
+
+    Args:
+        func (Callable): the scalar function.
+        kernel (Callable | None): a vectorized kernel taking the same arguments as NumPy arrays and
+            returning an array (or a tuple of arrays for tuple results) with NaN for failed elements.
+            Kernels can also be registered later with ``@func.register_kernel``. Defaults to None.
+
+    Note:
+        ``func.batch`` accepts ``parallel`` (None: automatic from the input size, True, False),
+        ``max_workers`` (chunks running at once, None: as many as the shared pool has workers; the pool
+        itself keeps its configured size) and ``return_mask`` (also return the boolean array of failed elements).
+
+        Numeric results give a float array of shape (n,), tuples of numbers an array of shape (n, k),
+        other results an object array.
+
+    Examples:
+        >>> from pyufunc import batch
+        >>> @batch
+        ... def safe_ratio(a, b):
+        ...     return a / b
+        >>> safe_ratio.batch([1, 2, 3], [2, 0, 4], return_mask=True)
+        (array([0.5 , nan, 0.75]), array([False,  True, False]))
+
+        >>> from pyufunc import cvt_wgs84_to_gcj02
+        >>> cvt_wgs84_to_gcj02.batch(lng_array, lat_array)  # vectorized kernel, shape (n, 2)
+
+    Returns:
+        Callable: the function, with ``batch`` and ``register_kernel`` attributes.
+    """
+    if func is None:
+        return lambda f: batch(f, kernel=kernel)
+
+    state = {"kernel": kernel}
+
+    def register_kernel(kernel_func: Callable) -> Callable:
+        state["kernel"] = kernel_func
+        return kernel_func
+
+    @functools.wraps(func)
+    def _batch(*args, **kwargs):
+        return _run_batch(func, state, *args, **kwargs)
+
+    func.batch = _batch
+    func.register_kernel = register_kernel
+    return func
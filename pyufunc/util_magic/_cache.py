@@ -0,0 +1,355 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import os
+import sys
+import time
+import pickle
+import struct
+import hashlib
+import tempfile
+import threading
+import types
+from pathlib import Path
+from functools import wraps
+from collections import OrderedDict
+
+
+# stands in for the contents of an unassigned closure cell
+_EMPTY_CELL = "<empty cell>"
+
+
+def _update_code_hash(h, code: types.CodeType) -> None:
+    """Feed the bytecode, names and constants of code (nested code objects included) into h."""
+    h.update(f"code:{code.co_name}:{code.co_argcount}:{code.co_kwonlyargcount}:".encode() + code.co_code)
+    _update_hash(h, code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code_hash(h, const)
+        else:
+            _update_hash(h, const)
+
+
+def _update_hash(h, obj, _seen: frozenset = frozenset()) -> None:
+    """Feed a type-tagged, run-independent representation of obj into the hash object h.
+
+    _seen holds the ids of the functions being hashed, so a closure referring to itself terminates.
+    """
+    obj_type = type(obj)
+
+    if obj is None or obj_type in (bool, int, float, complex):
+        h.update(f"{obj_type.__name__}:{obj!r};".encode())
+        return
+    if obj_type is str:
+        data = obj.encode("utf-8", "surrogatepass")
+        h.update(b"str:" + struct.pack("<Q", len(data)) + data)
+        return
+    if obj_type in (bytes, bytearray, memoryview):
+        data = bytes(obj)
+        h.update(b"bytes:" + struct.pack("<Q", len(data)) + data)
+        return
+    if obj_type in (tuple, list):
+        h.update(f"{obj_type.__name__}:{len(obj)}(".encode())
+        for item in obj:
+            _update_hash(h, item, _seen)
+        h.update(b")")
+        return
+    if obj_type is dict:
+        # order independent: sort the items by the hash of their keys
+        items = sorted((stable_hash(key), value) for key, value in obj.items()) if obj else []
+        h.update(f"dict:{len(obj)}(".encode())
+        for key_hash, value in items:
+            h.update(key_hash.encode())
+            _update_hash(h, value, _seen)
+        h.update(b")")
+        return
+    if obj_type in (set, frozenset):
+        item_hashes = "".join(sorted(stable_hash(item) for item in obj))
+        h.update(f"set:{len(obj)}({item_hashes})".encode())
+        return
+
+    np = sys.modules.get("numpy")
+    if np is not None:
+        if isinstance(obj, np.ndarray):
+            h.update(f"ndarray:{obj.dtype.str}:{obj.shape}:".encode())
+            if obj.dtype.hasobject:
+                _update_hash(h, obj.tolist(), _seen)
+            else:
+                h.update(np.ascontiguousarray(obj).data)
+            return
+        if isinstance(obj, np.generic):
+            h.update(f"npscalar:{obj.dtype.str}:".encode() + obj.tobytes())
+            return
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        h.update(f"{obj_type.__name__}:{obj.shape}:".encode())
+        if isinstance(obj, pd.DataFrame):
+            _update_hash(h, [str(col) for col in obj.columns])
+            _update_hash(h, [str(dtype) for dtype in obj.dtypes])
+        else:
+            _update_hash(h, [str(obj.name), str(obj.dtype)])
+        h.update(pd.util.hash_pandas_object(obj, index=not isinstance(obj, pd.Index)).to_numpy().data)
+        return
+
+    if obj_type.__module__.startswith("shapely") and hasattr(obj, "wkb"):
+        h.update(f"geometry:{obj.geom_type}:".encode() + obj.wkb)
+        return
+
+    if obj_type is types.FunctionType:
+        # lambdas, and closures made by one factory, share their qualname: hash what the call runs on
+        h.update(f"function:{obj.__module__}.{obj.__qualname__};".encode())
+        if id(obj) in _seen:
+            return
+        _seen = _seen | {id(obj)}
+        _update_code_hash(h, obj.__code__)
+        _update_hash(h, (obj.__defaults__, obj.__kwdefaults__), _seen)
+        cells = []
+        for cell in obj.__closure__ or ():
+            try:
+                cells.append(cell.cell_contents)
+            except ValueError:  # a cell not assigned yet
+                cells.append(_EMPTY_CELL)
+        _update_hash(h, cells, _seen)
+        return
+    if obj_type is types.MethodType:
+        h.update(b"method:")
+        _update_hash(h, obj.__func__, _seen)
+        _update_hash(h, obj.__self__, _seen)
+        return
+    if callable(obj) and hasattr(obj, "__qualname__"):
+        h.update(f"callable:{getattr(obj, '__module__', '')}.{obj.__qualname__};".encode())
+        return
+
+    try:
+        data = pickle.dumps(obj, protocol=4)
+        h.update(f"pickle:{obj_type.__module__}.{obj_type.__qualname__}:".encode() + data)
+    except Exception:
+        h.update(f"repr:{obj!r}".encode())
+
+
+def stable_hash(obj) -> str:
+    """Return a hex digest of obj that is stable across processes and runs.
+
+    NumPy arrays are hashed by dtype, shape and raw bytes, pandas objects with
+    ``pandas.util.hash_pandas_object`` plus column names and dtypes, shapely geometries by
+    their WKB. Python functions by their code, defaults and closure contents, so two lambdas
+    or two closures of one factory differ. Containers are hashed recursively (dicts and sets
+    independent of order), other objects by their pickle, or repr as last resort.
+
+    Args:
+        obj: the object to hash.
+
+    Examples:
+        >>> import numpy as np
+        >>> from pyufunc import stable_hash
+        >>> stable_hash(np.arange(3)) == stable_hash(np.array([0, 1, 2]))
+        True
+
+    Returns:
+        str: a 32 character hex digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    _update_hash(h, obj)
+    return h.hexdigest()
+
+
+def _approx_nbytes(obj) -> int:
+    """Approximate memory held by obj."""
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        return obj.nbytes + 112
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if type(obj).__module__.startswith("shapely") and hasattr(obj, "wkb"):
+        return len(obj.wkb) + 64
+    if isinstance(obj, (tuple, list, set, frozenset)):
+        return sys.getsizeof(obj) + sum(_approx_nbytes(item) for item in obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(_approx_nbytes(k) + _approx_nbytes(v) for k, v in obj.items())
+    return sys.getsizeof(obj)
+
+
+def _function_fingerprint(func) -> str:
+    # disk entries are keyed on the function's code too, so editing the function invalidates them
+    code = getattr(func, "__code__", None)
+    return stable_hash((func.__module__, func.__qualname__,
+                        code.co_code if code else b"", repr(code.co_consts) if code else ""))
+
+
+class _MemoCache:
+    """The LRU/TTL memory tier and optional disk tier behind memoize."""
+
+    def __init__(self, func, maxsize: int | None, max_bytes: int | None, ttl: float | None, disk_dir: str):
+        self.func = func
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_path = None
+        if disk_dir:
+            func_name = f"{func.__module__}.{func.__qualname__}".replace("<", "").replace(">", "")
+            self.disk_path = Path(disk_dir) / func_name
+        self.fingerprint = _function_fingerprint(func) if disk_dir else ""
+
+        # key -> (value, expires_at, nbytes)
+        self.entries: OrderedDict[str, tuple] = OrderedDict()
+        self.nbytes = 0
+        self.lock = threading.RLock()
+        self.stats = {"hits": 0, "misses": 0, "disk_hits": 0, "evictions": 0, "expired": 0}
+
+    # ---------------------------------------------------------------- memory tier
+    def get(self, key: str):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                value, expires_at, nbytes = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self.entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return True, value
+                del self.entries[key]
+                self.nbytes -= nbytes
+                self.stats["expired"] += 1
+
+        found, value = self._disk_get(key)
+        with self.lock:
+            if found:
+                self.stats["disk_hits"] += 1
+                self._put_memory(key, value)
+            else:
+                self.stats["misses"] += 1
+        return found, value
+
+    def _put_memory(self, key: str, value) -> None:
+        nbytes = _approx_nbytes(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self.lock:
+            if key in self.entries:
+                self.nbytes -= self.entries.pop(key)[2]
+            self.entries[key] = (value, expires_at, nbytes)
+            self.nbytes += nbytes
+            while self.entries and ((self.maxsize is not None and len(self.entries) > self.maxsize)
+                                    or (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+                self.nbytes -= self.entries.popitem(last=False)[1][2]
+                self.stats["evictions"] += 1
+
+    def put(self, key: str, value) -> None:
+        self._put_memory(key, value)
+        self._disk_put(key, value)
+
+    # ---------------------------------------------------------------- disk tier
+    def _disk_file(self, key: str) -> Path:
+        return self.disk_path / f"{self.fingerprint[:12]}-{key}.pkl"
+
+    def _disk_get(self, key: str):
+        if self.disk_path is None:
+            return False, None
+        path = self._disk_file(key)
+        try:
+            with open(path, "rb") as f:
+                created_at, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            return False, None
+        if self.ttl is not None and time.time() - created_at >= self.ttl:
+            path.unlink(missing_ok=True)
+            return False, None
+        return True, value
+
+    def _disk_put(self, key: str, value) -> None:
+        if self.disk_path is None:
+            return
+        tmp_name = ""
+        try:
+            self.disk_path.mkdir(parents=True, exist_ok=True)
+            # write then rename: readers in other processes never see a partial file
+            fd, tmp_name = tempfile.mkstemp(dir=self.disk_path, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((time.time(), value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, self._disk_file(key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # the result is not picklable or the directory is not writable: keep the memory tier only
+            if tmp_name and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    # ---------------------------------------------------------------- info
+    def info(self) -> dict:
+        with self.lock:
+            return {**self.stats, "entries": len(self.entries), "bytes": self.nbytes,
+                    "maxsize": self.maxsize, "max_bytes": self.max_bytes, "ttl": self.ttl,
+                    "disk_dir": str(self.disk_path) if self.disk_path else ""}
+
+    def clear(self, disk: bool = False) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+            for name in self.stats:
+                self.stats[name] = 0
+        if disk and self.disk_path is not None and self.disk_path.is_dir():
+            for path in self.disk_path.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+
+
+def memoize(func: object = None, *, maxsize: int | None = 128, max_bytes: int | None = None,
+            ttl: float | None = None, disk_dir: str = "") -> object:
+    """A decorator that caches the results of a pure function, bounded by entries, bytes and age.
+
+    Arguments are keyed with ``stable_hash``, so NumPy arrays, pandas objects and shapely geometries
+    work as arguments. The memory tier evicts the least recently used entries once ``maxsize``
+    entries or ``max_bytes`` (approximate size of the cached results) are exceeded, and drops entries
+    older than ``ttl`` seconds. With ``disk_dir``, results are also pickled into that directory and
+    reused by later runs, keyed on the function's code so editing the function invalidates them.
+
+    Args:
+        func (object): the function to cache.
+        maxsize (int | None): max number of cached results in memory, None for no limit. Defaults to 128.
+        max_bytes (int | None): max approximate bytes of cached results in memory. Defaults to None.
+        ttl (float | None): seconds a result stays valid, in memory and on disk. Defaults to None, forever.
+        disk_dir (str): directory for the persistent tier. Defaults to "", memory only.
+
+    Examples:
+        >>> from pyufunc import memoize, calc_area_from_wkt_geometry
+        >>> @memoize(maxsize=1024, ttl=3600, disk_dir="./.pyufunc_cache")
+        ... def zone_area(wkt):
+        ...     return calc_area_from_wkt_geometry(wkt)
+        >>> zone_area("POLYGON ((0 0, 1 0, 1 1, 0 1, 0 0))")
+        >>> zone_area.cache_info()
+        {'hits': 0, 'misses': 1, 'disk_hits': 0, 'evictions': 0, 'expired': 0, 'entries': 1, ...}
+        >>> zone_area.cache_clear(disk=True)
+
+    Returns:
+        object: the decorated function, with ``cache_info()`` and ``cache_clear(disk=False)``.
+    """
+    if maxsize is not None and (not isinstance(maxsize, int) or maxsize < 0):
+        raise ValueError("maxsize should be a non-negative integer or None.")
+    if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes < 0):
+        raise ValueError("max_bytes should be a non-negative integer or None.")
+    if ttl is not None and ttl <= 0:
+        raise ValueError("ttl should be a positive number of seconds or None.")
+
+    if func is None:
+        return lambda f: memoize(f, maxsize=maxsize, max_bytes=max_bytes, ttl=ttl, disk_dir=disk_dir)
+
+    cache = _MemoCache(func, maxsize, max_bytes, ttl, disk_dir)
+
+    @wraps(func)
+    def inner(*args, **kwargs):
+        key = stable_hash((args, kwargs))
+        found, value = cache.get(key)
+        if found:
+            return value
+        value = func(*args, **kwargs)
+        cache.put(key, value)
+        return value
+
+    inner.cache_info = cache.info
+    inner.cache_clear = cache.clear
+    return inner
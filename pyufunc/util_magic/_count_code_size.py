@@ -1,19 +1,114 @@
 
 import os
+import json
+import tempfile
 from pathlib import Path
-import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from pyufunc.util_pathio._path import path2linux
 import warnings
 
+# bytes read per call, files are never loaded whole
+_CHUNK_SIZE = 1 << 20
 
-def count_lines_of_code(package_path: str | Path, *, ext: str = "*", verbose: bool = False) -> int:
+# bytes sniffed for a NUL byte to tell binary files from text
+_SNIFF_SIZE = 8192
+
+# below this many files, counting runs in the calling thread
+_PARALLEL_MIN_FILES = 16
+
+
+def _count_file_lines(path: str, skip_binary: bool) -> tuple[int, bool] | None:
+    """Count lines as readlines() does (\\n, \\r\\n and \\r end a line).
+
+    Returns (lines, is_binary), lines is -1 for a skipped binary file; None if the file cannot be read.
+    """
+    lines = 0
+    last = b""
+    try:
+        with open(path, "rb") as f:
+            chunk = f.read(_CHUNK_SIZE)
+            is_binary = b"\0" in chunk[:_SNIFF_SIZE]
+            if is_binary and skip_binary:
+                return -1, True
+            while chunk:
+                # a \r\n split across chunks is one line break
+                cr_lf = chunk.count(b"\r\n") + (last == b"\r" and chunk[:1] == b"\n")
+                lines += chunk.count(b"\n") + chunk.count(b"\r") - cr_lf
+                last = chunk[-1:]
+                chunk = f.read(_CHUNK_SIZE)
+    except OSError:
+        return None
+    # a last line without line break
+    return lines + (last not in (b"", b"\n", b"\r")), is_binary
+
+
+def _count_files_lines(paths: list, skip_binary: bool) -> list:
+    return [_count_file_lines(path, skip_binary) for path in paths]
+
+
+def _scan_files(root: str, ext: str) -> list[tuple[str, int, int]]:
+    """(path, size, mtime_ns) of the files below root matching ext, without following symlinked directories."""
+    files = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file() and (ext == "*" or entry.name.endswith(ext)):
+                            stat = entry.stat()
+                            # root is absolute already, entry paths only need the separator unified
+                            files.append((entry.path.replace("\\", "/"), stat.st_size, stat.st_mtime_ns))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return files
+
+
+def _load_cache(cache_path: str) -> dict:
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_path: str, cache: dict) -> None:
+    cache_dir = os.path.dirname(os.path.abspath(cache_path))
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+def count_lines_of_code(package_path: str | Path, *, ext: str = "*", verbose: bool = False,
+                        by_extension: bool = False, skip_binary: bool = True, max_workers: int | None = None,
+                        cache_path: str = "") -> int | dict:
 
     """Counts the number of lines of code in a Python package.
 
+    The tree is listed with os.scandir and files are counted in a thread pool, on raw bytes read in
+    chunks, so large files are never loaded into memory whole. Lines are counted as ``readlines()``
+    would count them. Binary files (a NUL byte in their first 8 KiB) are skipped.
+
     Args:
         package_path (str): The path to the package.
         ext (str): The extension of the files to count. Default is "*".
         verbose (bool): Whether to print the file paths being counted. Default is False.
+        by_extension (bool): Return the line count per file extension instead of the total. Default is False.
+        skip_binary (bool): Whether to skip binary files. Default is True.
+        max_workers (int | None): Number of threads reading files. Default is None, chosen by
+            ThreadPoolExecutor.
+        cache_path (str): A JSON file caching the line count of every file by (path, size, mtime),
+            so repeated runs only re-read changed files. Default is "", no cache.
 
     Raises:
         TypeError: If package_path is not a string.
@@ -27,12 +122,15 @@ def count_lines_of_code(package_path: str | Path, *, ext: str = "*", verbose: bo
         >>> count_lines_of_code("pyufunc", ext="py")
         >>> 4500
 
+        >>> count_lines_of_code("pyufunc", by_extension=True, cache_path=".loc_cache.json")
+        >>> {'.py': 4500, '.json': 480, '.txt': 20}
+
     Returns:
-        int: The number of lines of code in the package.
+        int | dict: The number of lines of code in the package, or {extension: lines} if by_extension.
     """
 
     # Initialize the count
-    count = 0
+    count = {} if by_extension else 0
 
     if not isinstance(package_path, (str, Path)):
         warnings.warn("Package path must be a string or Path.")
@@ -65,22 +163,59 @@ def count_lines_of_code(package_path: str | Path, *, ext: str = "*", verbose: bo
         warnings.warn(f"Counting lines of code in '{package_path}'...")
 
     if is_file:
-        if ext == "*" or package_path.endswith(ext):
-            with open(package_path, "r") as f:
-                with contextlib.suppress(Exception):
-                    count += len(f.readlines())
-        else:
+        if ext != "*" and not package_path.endswith(ext):
             warnings.warn(f"Package path '{package_path}' does not have the extension '{ext}'.")
+            return count
+        stat = os.stat(package_path)
+        files = [(package_path, stat.st_size, stat.st_mtime_ns)]
+    else:
+        files = _scan_files(package_path, ext)
+
+    # reuse the counts of unchanged files, read the others
+    cache = _load_cache(cache_path) if cache_path else {}
+    results = {}
+    to_read = []
+    for path, size, mtime_ns in files:
+        cached = cache.get(path)
+        # a cached skipped binary file has no line count to reuse when binary files are counted
+        if isinstance(cached, list) and len(cached) == 4 and cached[:2] == [size, mtime_ns] \
+                and (cached[2] >= 0 or skip_binary):
+            results[path] = (-1 if skip_binary and cached[3] else cached[2], cached[3])
+        else:
+            to_read.append(path)
+
+    if len(to_read) < _PARALLEL_MIN_FILES:
+        counted = _count_files_lines(to_read, skip_binary)
+    else:
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        # a few batches per thread: per-file tasks would cost more than reading small files
+        n_batches = 4 * max_workers
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pyufunc-loc") as executor:
+            batches = [to_read[i::n_batches] for i in range(n_batches)]
+            counted_batches = list(executor.map(_count_files_lines, batches, [skip_binary] * n_batches))
+        # interleaved batches back to the order of to_read
+        counted = [None] * len(to_read)
+        for i, batch_counts in enumerate(counted_batches):
+            counted[i::n_batches] = batch_counts
+    results.update(zip(to_read, counted))
+
+    if cache_path and to_read:
+        cache.update({path: [size, mtime_ns, *results[path]] for path, size, mtime_ns in files
+                      if results[path] is not None})
+        _save_cache(cache_path, cache)
+
+    per_extension = {}
+    for path, _, _ in files:
+        lines = results[path][0] if results[path] is not None else -1
+        if lines < 0:
+            if verbose:
+                print(f"  :Skipped binary or unreadable file: {path}")
+            continue
+        suffix = os.path.splitext(path)[1]
+        per_extension[suffix] = per_extension.get(suffix, 0) + lines
 
-        return count
-
-    if is_dir:
-        for root, directories, filenames in os.walk(package_path):
-            for filename in filenames:
-                if ext == "*" or (ext != "*" and filename.endswith(ext)):
-                    with open(os.path.join(root, filename), "r") as f:
-                        with contextlib.suppress(Exception):
-                            count += len(f.readlines())
-        return count
+    if verbose:
+        for suffix, lines in sorted(per_extension.items(), key=lambda item: -item[1]):
+            print(f"  :{suffix or '(no extension)'}: {lines} lines")
 
-    return count
+    return dict(sorted(per_extension.items())) if by_extension else sum(per_extension.values())
@@ -8,14 +8,93 @@
 """
 
 from __future__ import absolute_import
+import sys
+import importlib
+import importlib.util
+import threading
+from functools import wraps
 from collections.abc import Callable
 from typing import Any, TypeVar, cast
 
-from pyufunc.util_magic._import_package import (is_module_importable,
-                                                import_package)
+from pyufunc.util_magic._import_package import import_package
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# process-wide probe cache: import name -> importable or not.
+# Each import name is probed once, no matter how many functions require it.
+_IMPORTABLE_CACHE: dict[str, bool] = {}
+_IMPORTABLE_CACHE_LOCK = threading.Lock()
+
+# install name -> functions disabled because the dependency is missing
+_MISSING_DEPENDENCY_FUNCS: dict[str, list[str]] = {}
+
+
+def _is_importable_cached(import_name: str) -> bool:
+    """Check whether a module is importable, probing each import name only once per process."""
+    available = _IMPORTABLE_CACHE.get(import_name)
+    if available is not None:
+        return available
+
+    with _IMPORTABLE_CACHE_LOCK:
+        available = _IMPORTABLE_CACHE.get(import_name)
+        if available is None:
+            if import_name in sys.modules:
+                available = True
+            else:
+                try:
+                    available = importlib.util.find_spec(import_name) is not None
+                except (ImportError, ValueError):
+                    available = False
+            _IMPORTABLE_CACHE[import_name] = available
+    return available
+
+
+def _clear_dependency_cache(import_names: list | None = None) -> None:
+    """Forget cached probe results, e.g. after installing packages at runtime."""
+    with _IMPORTABLE_CACHE_LOCK:
+        if import_names is None:
+            _IMPORTABLE_CACHE.clear()
+        else:
+            for import_name in import_names:
+                _IMPORTABLE_CACHE.pop(import_name, None)
+    importlib.invalidate_caches()
+
+
+def _record_missing(function: Callable, missing_install_name: list) -> None:
+    func_name = f"{getattr(function, '__module__', '')}.{getattr(function, '__qualname__', function)}"
+    for install_name in missing_install_name:
+        funcs = _MISSING_DEPENDENCY_FUNCS.setdefault(install_name, [])
+        if func_name not in funcs:
+            funcs.append(func_name)
+
+
+def get_missing_dependencies(verbose: bool = False) -> dict[str, list[str]]:
+    """Report optional dependencies that are missing and the functions they disable.
+
+    Only functions whose modules have been imported (and therefore decorated) are reported.
+
+    Args:
+        verbose (bool): print the report. Defaults to False.
+
+    Examples:
+        >>> import pyufunc as pf
+        >>> pf.get_missing_dependencies()
+        {'opencv-python': ['pyufunc.util_img._img_cvt.img_to_gray', ...], ...}
+
+    Returns:
+        dict: {install name: [qualified function names]}
+    """
+    report = {name: sorted(funcs) for name, funcs in sorted(_MISSING_DEPENDENCY_FUNCS.items())}
+
+    if verbose:
+        if not report:
+            print("  :All dependencies of the loaded pyufunc functions are available.")
+        for install_name, funcs in report.items():
+            print(f"  :missing {install_name}, disables {len(funcs)} function(s):")
+            for func_name in funcs:
+                print(f"    - {func_name}")
+    return report
+
 
 # decorator with extra arguments
 def requires(*args, **kwargs) -> Callable[[F], F]:
@@ -35,7 +114,15 @@ def requires(*args, **kwargs) -> Callable[[F], F]:
 
             - auto_install (bool): install the missing dependencies automatically. Defaults to False.
 
+            - defer (bool): postpone the dependency check until the first call of the function. Defaults to False.
+
     Notes:
+        - each import name is probed once per process (``importlib.util.find_spec``) and cached,
+            so decorating many functions with the same dependency costs a single probe.
+        - when the dependencies are available, the original function is returned unchanged,
+            so the decorator adds no overhead to the call.
+        - with defer=True, importing the module performs no probe at all;
+            the check runs on the first call and a thin wrapper stays in place.
         - user can parse the verbose and auto_install options to control the behavior of the decorator.
         - verbose: print the error message if the dependencies are not available. Default is True.
         - auto_install: install the missing dependencies automatically. Default is False.
@@ -68,6 +155,7 @@ def requires(*args, **kwargs) -> Callable[[F], F]:
     # the verbose option is used to print the error message
     verbose = kwargs.get("verbose", True)
     auto_install = kwargs.get("auto_install", False)
+    defer = kwargs.get("defer", False)
     # args_requires = copy.deepcopy(args)
 
     # check if the dependencies have different names
@@ -86,9 +174,9 @@ def requires(*args, **kwargs) -> Callable[[F], F]:
         else:
             raise ValueError("The input arguments should be strings or tuple with two elements.")
 
-    def inner(function: F) -> F:
+    def resolve(function: F) -> F:
         # check if the dependencies are available
-        available = [is_module_importable(arg) for arg in arg_import_name]
+        available = [_is_importable_cached(arg) for arg in arg_import_name]
         if all(available):
             return function
 
@@ -105,10 +193,13 @@ def requires(*args, **kwargs) -> Callable[[F], F]:
                 print(f"  :Info: installing {','.join(missing_install_name)}...")
             for pkg_name in missing_pkg_name:
                 import_package(pkg_name, verbose=verbose)
-            available = [is_module_importable(arg) for arg in missing_import_name]
+            _clear_dependency_cache(missing_import_name)
+            available = [_is_importable_cached(arg) for arg in missing_import_name]
             if all(available):
                 return function
 
+        _record_missing(function, missing_install_name)
+
         def passer(*args, **kwargs):
             if verbose:
                 print(f"  :{function.__name__} missing dependency {','.join(missing_install_name)}"
@@ -121,4 +212,19 @@ def requires(*args, **kwargs) -> Callable[[F], F]:
 
         return cast(F, passer)
 
+    def inner(function: F) -> F:
+        # all probes already cached: resolving now is free, so never defer
+        if not defer or all(arg in _IMPORTABLE_CACHE for arg in arg_import_name):
+            return resolve(function)
+
+        target: list = []
+
+        @wraps(function)
+        def deferred(*args, **kwargs):
+            if not target:
+                target.append(resolve(function))
+            return target[0](*args, **kwargs)
+
+        return cast(F, deferred)
+
     return inner
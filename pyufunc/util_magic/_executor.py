@@ -0,0 +1,279 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import itertools
+import operator
+import time
+import traceback
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor,
+                                FIRST_COMPLETED, wait)
+
+from pyufunc.__cfg import get_cpu_cores
+from pyufunc.util_magic._worker_pool import get_worker_pool, _pool_size
+
+_BACKENDS = ("process", "thread")
+_ON_ERROR = ("capture", "raise", "skip")
+
+
+class TaskError(Exception):
+    """The failure of a single task run by ParallelExecutor.
+
+    With ``on_error="capture"`` a TaskError takes the place of the failed task's result,
+    with ``on_error="raise"`` it is raised when the failed task's result is reached.
+
+    Attributes:
+        index (int): position of the failed item in the input iterable.
+        exc_type (str): name of the original exception type.
+        message (str): message of the original exception.
+        traceback_text (str): formatted traceback from the worker.
+    """
+
+    def __init__(self, index: int, exc_type: str, message: str, traceback_text: str = ""):
+        super().__init__(index, exc_type, message, traceback_text)
+        self.index = index
+        self.exc_type = exc_type
+        self.message = message
+        self.traceback_text = traceback_text
+
+    def __str__(self):
+        return f"task {self.index} failed with {self.exc_type}: {self.message}"
+
+    def __repr__(self):
+        return f"TaskError(index={self.index}, exc_type={self.exc_type!r}, message={self.message!r})"
+
+
+def _run_chunk(func: Callable, start: int, items: list) -> tuple[list, float]:
+    """Run func over one chunk inside a worker, capturing per-item errors.
+
+    Returns the chunk results and the time spent in func, measured in the worker.
+    """
+    results = []
+    time_start = time.perf_counter()
+    for offset, item in enumerate(items):
+        try:
+            results.append(func(item))
+        except Exception as e:
+            results.append(TaskError(start + offset, type(e).__name__, str(e), traceback.format_exc()))
+    return results, time.perf_counter() - time_start
+
+
+class ParallelExecutor:
+    """Chunked, streaming map over a process or thread pool.
+
+    Items are grouped into chunks so that per-task IPC overhead is amortized. Unless a fixed
+    chunksize is given, the chunk size is tuned from task time measured in the workers so that
+    every chunk runs for about ``target_chunk_time`` seconds. At most ``max_inflight`` chunks are
+    submitted or buffered at any time, so the input iterable is consumed lazily (backpressure).
+
+    Args:
+        backend (str): "process" or "thread". Defaults to "process".
+        max_workers (int | None): number of workers. Defaults to cpu cores - 1 (at least 1); with
+            shared_pool, the size of the shared pool. On the shared pool it caps the chunks running at once
+            instead, the pool keeps its size.
+        max_inflight (int | None): max chunks submitted or waiting to be yielded. Defaults to 2 * max_workers.
+        target_chunk_time (float): seconds of work per chunk when tuning chunksize. Defaults to 0.05.
+        max_chunksize (int): upper bound for the tuned chunksize. Defaults to 10000.
+        on_error (str): "capture" to return TaskError in place of the failed result,
+            "raise" to raise the TaskError, "skip" to drop failed items. Defaults to "capture".
+        shared_pool (bool): with the process backend, run on the shared worker pool (see get_worker_pool)
+            instead of a private pool; shutdown() then leaves the shared pool running. Defaults to False.
+
+    Examples:
+        >>> from pyufunc import ParallelExecutor
+        >>> with ParallelExecutor(backend="thread", max_workers=4) as executor:
+        ...     for value in executor.imap(abs, range(-3, 3)):
+        ...         print(value)
+        3 2 1 0 1 2
+
+    """
+
+    def __init__(self, backend: str = "process", max_workers: int | None = None, *,
+                 max_inflight: int | None = None, target_chunk_time: float = 0.05,
+                 max_chunksize: int = 10000, on_error: str = "capture", shared_pool: bool = False):
+
+        if backend not in _BACKENDS:
+            raise ValueError(f"backend should be one of {_BACKENDS}, but got {backend!r}.")
+        if on_error not in _ON_ERROR:
+            raise ValueError(f"on_error should be one of {_ON_ERROR}, but got {on_error!r}.")
+        if max_workers is not None and (not isinstance(max_workers, int) or max_workers <= 0):
+            raise ValueError("max_workers should be a positive integer.")
+        shared_pool = shared_pool and backend == "process"
+        # on the shared pool a requested size limits this executor's chunks, resizing would restart the pool
+        self._max_running = max_workers if shared_pool else None
+        if max_workers is None:
+            cpu_count = get_cpu_cores()
+            max_workers = _pool_size() if shared_pool else cpu_count - 1 if cpu_count > 1 else 1
+
+        self.backend = backend
+        self.max_workers = max_workers
+        self.max_inflight = max_inflight or 2 * max_workers
+        self.target_chunk_time = target_chunk_time
+        self.max_chunksize = max_chunksize
+        self.on_error = on_error
+        self.shared_pool = shared_pool
+
+        self._executor: Executor | None = None
+        # exponential moving average of seconds per item, measured in the workers
+        self._sec_per_item: float | None = None
+
+    # ---------------------------------------------------------------- executor lifecycle
+    def _get_executor(self) -> Executor:
+        if self.shared_pool:
+            return get_worker_pool()
+        if self._executor is None:
+            if self.backend == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the private pool. The executor can be reused, a new pool is created on demand.
+
+        The shared worker pool is left running, see shutdown_worker_pool().
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    # ---------------------------------------------------------------- chunk sizing
+    @property
+    def sec_per_item(self) -> float | None:
+        """The measured average seconds per item, None before the first chunk completes."""
+        return self._sec_per_item
+
+    def _record_timing(self, elapsed: float, n_items: int) -> None:
+        sample = elapsed / max(n_items, 1)
+        if self._sec_per_item is None:
+            self._sec_per_item = sample
+        else:
+            self._sec_per_item = 0.7 * self._sec_per_item + 0.3 * sample
+
+    def _next_chunksize(self, balance_cap: int) -> int:
+        if self._sec_per_item is None:
+            # calibrate on single items until the first measurement arrives
+            return 1
+        if self._sec_per_item <= 0:
+            size = self.max_chunksize
+        else:
+            size = int(self.target_chunk_time / self._sec_per_item)
+        return max(1, min(size, self.max_chunksize, balance_cap))
+
+    def _iter_chunks(self, iterable: Iterable, chunksize: int) -> Iterator[tuple[int, list]]:
+        # keep ~4 chunks per worker when the input length is known, for load balancing
+        n_total = operator.length_hint(iterable, 0)
+        balance_cap = max(1, -(-n_total // (4 * self.max_workers))) if n_total else self.max_chunksize
+
+        iterator = iter(iterable)
+        start = 0
+        while True:
+            size = chunksize if chunksize > 0 else self._next_chunksize(balance_cap)
+            items = list(itertools.islice(iterator, size))
+            if not items:
+                return
+            yield start, items
+            start += len(items)
+
+    # ---------------------------------------------------------------- mapping
+    def _emit(self, results: list) -> Iterator:
+        for value in results:
+            if isinstance(value, TaskError):
+                if self.on_error == "raise":
+                    raise value
+                if self.on_error == "skip":
+                    continue
+            yield value
+
+    def _imap(self, func: Callable, iterable: Iterable, chunksize: int, ordered: bool) -> Iterator:
+        # validate eagerly, before the caller starts iterating
+        if not callable(func):
+            raise TypeError("The input function should be a callable.")
+        if not isinstance(iterable, Iterable):
+            raise TypeError("The input iterable should be an Iterable.")
+        if not isinstance(chunksize, int) or chunksize < 0:
+            raise ValueError("chunksize should be a non-negative integer, 0 for automatic tuning.")
+        return self._imap_chunks(func, iterable, chunksize, ordered)
+
+    def _imap_chunks(self, func: Callable, iterable: Iterable, chunksize: int, ordered: bool) -> Iterator:
+        executor = self._get_executor()
+        chunks = self._iter_chunks(iterable, chunksize)
+
+        pending: dict[Future, int] = {}
+        finished: dict[int, list] = {}
+        next_seq = submitted_seq = 0
+        exhausted = False
+
+        try:
+            while True:
+                # backpressure: submitted + buffered chunks never exceed max_inflight
+                while (not exhausted and len(pending) + len(finished) < self.max_inflight
+                       and (self._max_running is None or len(pending) < self._max_running)):
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    pending[executor.submit(_run_chunk, func, *chunk)] = submitted_seq
+                    submitted_seq += 1
+
+                if ordered and next_seq in finished:
+                    yield from self._emit(finished.pop(next_seq))
+                    next_seq += 1
+                    continue
+
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    seq = pending.pop(future)
+                    results, elapsed = future.result()
+                    self._record_timing(elapsed, len(results))
+                    if ordered:
+                        finished[seq] = results
+                    else:
+                        yield from self._emit(results)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def imap(self, func: Callable, iterable: Iterable, chunksize: int = 0) -> Iterator:
+        """Lazily map func over iterable, yielding results in input order.
+
+        Args:
+            func (Callable): the function to apply, picklable for the process backend.
+            iterable (Iterable): the inputs, consumed lazily.
+            chunksize (int): fixed items per chunk, 0 to tune it from measured task time. Defaults to 0.
+
+        Returns:
+            Iterator: results in input order.
+        """
+        return self._imap(func, iterable, chunksize, ordered=True)
+
+    def imap_unordered(self, func: Callable, iterable: Iterable, chunksize: int = 0) -> Iterator:
+        """Lazily map func over iterable, yielding results as chunks complete.
+
+        Args:
+            func (Callable): the function to apply, picklable for the process backend.
+            iterable (Iterable): the inputs, consumed lazily.
+            chunksize (int): fixed items per chunk, 0 to tune it from measured task time. Defaults to 0.
+
+        Returns:
+            Iterator: results in completion order.
+        """
+        return self._imap(func, iterable, chunksize, ordered=False)
+
+    def map(self, func: Callable, iterable: Iterable, chunksize: int = 0, ordered: bool = True) -> list:
+        """Map func over iterable and collect all results into a list."""
+        return list(self._imap(func, iterable, chunksize, ordered))
@@ -6,8 +6,8 @@
 ##############################################################
 
 from __future__ import absolute_import
-import datetime
-from functools import wraps
+
+from pyufunc.util_magic._instrument import instrument
 
 
 # decorator without arguments
@@ -22,6 +22,10 @@ def func_running_time(func: object) -> object:
         It's equivalent to the func_time as func_running_time have been used in many packages,
         and we keep both of them for compatibility.
 
+        The decorator is a front end of ``instrument``: timings are recorded with nanosecond
+        resolution into the instrumentation registry instead of being printed. Read them with
+        ``get_instrumentation_stats`` or ``export_instrumentation``.
+
     Location:
         The function defined in pyufunc.util_common._func_time_decorator.py.
 
@@ -33,24 +37,15 @@ def func_running_time(func: object) -> object:
         >>>    return
 
         >>> func()
-        INFO Finished running function: func, total: 3s
+        >>> get_instrumentation_stats()["__main__.func"]
+        {'count': 1, 'errors': 0, 'total_ns': 3000412345, 'mean_ns': 3000412345, ...}
 
     Returns:
         object: the decorated function or class method.
 
     """
 
-    @wraps(func)
-    def inner(*args, **kwargs):
-        # print(f'  :INFO: begin to run function: {func.__name__} …')
-        time_start = datetime.datetime.now()
-        res = func(*args, **kwargs)
-        time_diff = datetime.datetime.now() - time_start
-        print(
-            f'  :INFO: finished function: {func.__name__}, total: {time_diff.seconds}s \n')
-        return res
-
-    return inner
+    return instrument(func)
 
 
 def func_time(func: object) -> object:
@@ -64,6 +59,10 @@ def func_time(func: object) -> object:
         It's equivalent to the func_running_time as func_running_time have been used in many packages.
         We keep both of them for compatibility.
 
+        The decorator is a front end of ``instrument``: timings are recorded with nanosecond
+        resolution into the instrumentation registry instead of being printed. Read them with
+        ``get_instrumentation_stats`` or ``export_instrumentation``.
+
     Location:
         The function defined in pyufunc.util_common._func_time_decorator.py.
 
@@ -76,21 +75,12 @@ def func_time(func: object) -> object:
 
         >>> func()
         main function...
-        INFO Finished running function: func, total: 3s
+        >>> get_instrumentation_stats()["__main__.func"]["count"]
+        1
 
     Returns:
         object: the decorated function or class method.
 
     """
 
-    @wraps(func)
-    def inner(*args, **kwargs):
-        # print(f'  :INFO: begin to run function: {func.__name__} …')
-        time_start = datetime.datetime.now()
-        res = func(*args, **kwargs)
-        time_diff = datetime.datetime.now() - time_start
-        print(
-            f'  :INFO: finished function: {func.__name__}, total: {time_diff.seconds}s \n')
-        return res
-
-    return inner
+    return instrument(func)
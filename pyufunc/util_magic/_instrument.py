@@ -0,0 +1,269 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import os
+import json
+import bisect
+import inspect
+import threading
+from collections import deque
+from time import perf_counter_ns
+from functools import wraps
+
+# set PYUFUNC_INSTRUMENT=0 to start with instrumentation disabled
+ENV_INSTRUMENT = "PYUFUNC_INSTRUMENT"
+_ENABLED = os.environ.get(ENV_INSTRUMENT, "1") != "0"
+
+# upper bounds (ns) of the latency histogram buckets: 1us .. 100s, plus +Inf
+_BUCKET_BOUNDS_NS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000,
+                     1_000_000_000, 10_000_000_000, 100_000_000_000)
+
+# pending timings per metric before they are folded into the aggregates
+_FOLD_SIZE = 4096
+
+_REGISTRY_LOCK = threading.Lock()
+_REGISTRY: dict[str, "_Metric"] = {}
+
+
+class _Metric:
+    """Aggregated timings of one instrumented function.
+
+    Calls only append their timing to a deque (atomic, no lock on the hot path); pending
+    timings are folded into the aggregates under the lock on snapshot or every _FOLD_SIZE calls.
+    """
+
+    __slots__ = ("count", "errors", "total_ns", "min_ns", "max_ns", "buckets", "pending", "lock")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * (len(_BUCKET_BOUNDS_NS) + 1)
+        # elapsed ns of successful calls, ~elapsed (negative) of failed calls
+        self.pending = deque()
+        self.lock = threading.Lock()
+
+    def record(self, elapsed_ns: int, failed: bool) -> None:
+        self.pending.append(~elapsed_ns if failed else elapsed_ns)
+        if len(self.pending) >= _FOLD_SIZE:
+            self.fold()
+
+    def fold(self) -> None:
+        with self.lock:
+            pending = self.pending
+            bounds = _BUCKET_BOUNDS_NS
+            while True:
+                try:
+                    elapsed_ns = pending.popleft()
+                except IndexError:
+                    return
+                if elapsed_ns < 0:
+                    elapsed_ns = ~elapsed_ns
+                    self.errors += 1
+                if self.count == 0 or elapsed_ns < self.min_ns:
+                    self.min_ns = elapsed_ns
+                if elapsed_ns > self.max_ns:
+                    self.max_ns = elapsed_ns
+                self.count += 1
+                self.total_ns += elapsed_ns
+                self.buckets[bisect.bisect_left(bounds, elapsed_ns)] += 1
+
+    def snapshot(self) -> dict:
+        self.fold()
+        with self.lock:
+            return {
+                "count": self.count,
+                "errors": self.errors,
+                "total_ns": self.total_ns,
+                "mean_ns": self.total_ns // self.count if self.count else 0,
+                "min_ns": self.min_ns,
+                "max_ns": self.max_ns,
+                "histogram": {"le_ns": [*_BUCKET_BOUNDS_NS, "+Inf"], "counts": list(self.buckets)},
+            }
+
+
+def _get_metric(name: str) -> _Metric:
+    metric = _REGISTRY.get(name)
+    if metric is None:
+        with _REGISTRY_LOCK:
+            metric = _REGISTRY.setdefault(name, _Metric())
+    return metric
+
+
+def record_timing(name: str, elapsed_ns: int, failed: bool = False) -> None:
+    """Record one timing measured elsewhere into the instrumentation registry.
+
+    Args:
+        name (str): the metric name, e.g. "my_module.my_function".
+        elapsed_ns (int): elapsed time in nanoseconds, e.g. from time.perf_counter_ns().
+        failed (bool): whether the measured call failed. Defaults to False.
+
+    Returns:
+        None
+    """
+    if _ENABLED:
+        _get_metric(name).record(elapsed_ns, failed)
+
+
+def instrument(func: object = None, *, name: str | None = None) -> object:
+    """A decorator that records the call count, total/min/max time and a latency histogram of a function.
+
+    Timings use time.perf_counter_ns and go into a process-wide registry, nothing is printed.
+    Read them with get_instrumentation_stats or export_instrumentation. When instrumentation is
+    disabled with set_instrumentation(False), the wrapper only checks a flag and calls the function.
+
+    Args:
+        func (object): the function or coroutine function to instrument.
+        name (str | None): metric name. Defaults to None, "<module>.<qualname>" of the function.
+
+    Examples:
+        >>> from pyufunc import instrument, get_instrumentation_stats
+        >>> @instrument
+        ... def add(a, b):
+        ...     return a + b
+        >>> add(1, 2)
+        3
+        >>> get_instrumentation_stats()["__main__.add"]["count"]
+        1
+
+    Returns:
+        object: the decorated function.
+    """
+    if func is None:
+        return lambda f: instrument(f, name=name)
+
+    metric_name = name or f"{func.__module__}.{func.__qualname__}"
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_inner(*args, **kwargs):
+            if not _ENABLED:
+                return await func(*args, **kwargs)
+            failed = True
+            time_start = perf_counter_ns()
+            try:
+                res = await func(*args, **kwargs)
+                failed = False
+                return res
+            finally:
+                _get_metric(metric_name).record(perf_counter_ns() - time_start, failed)
+        return async_inner
+
+    @wraps(func)
+    def inner(*args, **kwargs):
+        if not _ENABLED:
+            return func(*args, **kwargs)
+        failed = True
+        time_start = perf_counter_ns()
+        try:
+            res = func(*args, **kwargs)
+            failed = False
+            return res
+        finally:
+            _get_metric(metric_name).record(perf_counter_ns() - time_start, failed)
+    return inner
+
+
+def set_instrumentation(enabled: bool) -> bool:
+    """Turn instrumentation on or off globally.
+
+    Args:
+        enabled (bool): True to record timings, False to skip recording.
+
+    Returns:
+        bool: the previous setting.
+    """
+    global _ENABLED
+    previous, _ENABLED = _ENABLED, bool(enabled)
+    return previous
+
+
+def reset_instrumentation() -> None:
+    """Drop all recorded timings."""
+    with _REGISTRY_LOCK:
+        _REGISTRY.clear()
+
+
+def get_instrumentation_stats(name: str | None = None) -> dict:
+    """Return a snapshot of the recorded timings.
+
+    Args:
+        name (str | None): a single metric name. Defaults to None, all metrics.
+
+    Returns:
+        dict: {name: {count, errors, total_ns, mean_ns, min_ns, max_ns, histogram}},
+            or the stats of a single metric if name is given (empty dict if never recorded).
+    """
+    if name is not None:
+        metric = _REGISTRY.get(name)
+        return metric.snapshot() if metric else {}
+    with _REGISTRY_LOCK:
+        metrics = list(_REGISTRY.items())
+    return {metric_name: metric.snapshot() for metric_name, metric in sorted(metrics)}
+
+
+def _prometheus_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _to_prometheus(stats: dict) -> str:
+    family = "pyufunc_function_duration_seconds"
+    lines = [f"# HELP {family} Wall time of instrumented functions.",
+             f"# TYPE {family} histogram"]
+    for metric_name, stat in stats.items():
+        label = f'function="{_prometheus_label(metric_name)}"'
+        cumulative = 0
+        for bound, count in zip(stat["histogram"]["le_ns"], stat["histogram"]["counts"]):
+            cumulative += count
+            le = bound if bound == "+Inf" else repr(bound / 1e9)
+            lines.append(f'{family}_bucket{{{label},le="{le}"}} {cumulative}')
+        lines.append(f"{family}_sum{{{label}}} {stat['total_ns'] / 1e9!r}")
+        lines.append(f"{family}_count{{{label}}} {stat['count']}")
+
+    for suffix, key, help_text in (("min", "min_ns", "Fastest call"), ("max", "max_ns", "Slowest call")):
+        lines.append(f"# HELP {family}_{suffix} {help_text} of instrumented functions.")
+        lines.append(f"# TYPE {family}_{suffix} gauge")
+        for metric_name, stat in stats.items():
+            lines.append(f'{family}_{suffix}{{function="{_prometheus_label(metric_name)}"}} {stat[key] / 1e9!r}')
+
+    lines.append("# HELP pyufunc_function_errors_total Calls of instrumented functions that raised.")
+    lines.append("# TYPE pyufunc_function_errors_total counter")
+    for metric_name, stat in stats.items():
+        lines.append(f'pyufunc_function_errors_total{{function="{_prometheus_label(metric_name)}"}} {stat["errors"]}')
+    return "\n".join(lines) + "\n"
+
+
+def export_instrumentation(fmt: str = "json", path: str = "") -> str:
+    """Export a snapshot of the recorded timings as JSON or Prometheus text format.
+
+    Args:
+        fmt (str): "json" or "prometheus". Defaults to "json".
+        path (str): if given, also write the export to this file. Defaults to "".
+
+    Examples:
+        >>> from pyufunc import export_instrumentation
+        >>> print(export_instrumentation("prometheus"))
+        # HELP pyufunc_function_duration_seconds Wall time of instrumented functions.
+        # TYPE pyufunc_function_duration_seconds histogram
+        pyufunc_function_duration_seconds_bucket{function="__main__.add",le="1e-06"} 1
+        ...
+
+    Returns:
+        str: the exported text.
+    """
+    if fmt not in ("json", "prometheus"):
+        raise ValueError(f"fmt should be 'json' or 'prometheus', but got {fmt!r}.")
+
+    stats = get_instrumentation_stats()
+    text = json.dumps(stats, indent=2) if fmt == "json" else _to_prometheus(stats)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return text
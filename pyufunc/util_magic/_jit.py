@@ -0,0 +1,137 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import os
+import functools
+import importlib.util
+import warnings
+from collections.abc import Callable
+
+# set PYUFUNC_JIT=1 to compile the numeric kernels with numba (opt-in)
+ENV_JIT = "PYUFUNC_JIT"
+_ENABLED = os.environ.get(ENV_JIT, "0") == "1"
+
+_NUMBA_AVAILABLE: bool | None = None
+
+
+def jit_available() -> bool:
+    """Whether numba can be imported (probed once, without importing it)."""
+    global _NUMBA_AVAILABLE
+    if _NUMBA_AVAILABLE is None:
+        _NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+    return _NUMBA_AVAILABLE
+
+
+def is_jit_enabled() -> bool:
+    """Whether kernels run compiled: JIT switched on and numba installed."""
+    return _ENABLED and jit_available()
+
+
+def set_jit(enabled: bool) -> bool:
+    """Turn the numba JIT for pyufunc's numeric kernels on or off globally.
+
+    Compiled kernels are cached on disk by numba (``cache=True``): in the ``__pycache__`` next to
+    the source, or in the directory given by the ``NUMBA_CACHE_DIR`` environment variable when the
+    package directory is read-only, so later processes skip the JIT warm-up.
+
+    Args:
+        enabled (bool): True to run kernels compiled with numba when it is installed,
+            False to run the NumPy / pure Python fallbacks.
+
+    Returns:
+        bool: the previous setting.
+    """
+    global _ENABLED
+    previous, _ENABLED = _ENABLED, bool(enabled)
+    return previous
+
+
+class _JitKernel:
+    """A kernel that runs compiled by numba when the JIT is on, and its fallback otherwise.
+
+    Compilation is lazy (first call with the JIT on); a kernel numba cannot compile warns once
+    and keeps running its fallback.
+    """
+
+    def __init__(self, py_func: Callable, fallback: Callable | None, options: dict):
+        self.py_func = py_func
+        self.fallback = fallback or py_func
+        self.options = options
+        self._compiled = None
+        self._numba_error: type = Exception
+        functools.update_wrapper(self, py_func)
+
+    def _compile(self):
+        if not jit_available():
+            self._compiled = False
+            return False
+        import numba
+
+        self._numba_error = numba.core.errors.NumbaError
+        self._compiled = numba.njit(cache=True, **self.options)(self.py_func)
+        return self._compiled
+
+    def _disable(self, error: Exception) -> None:
+        warnings.warn(f"numba could not compile {self.__name__}, running its fallback: {error}",
+                      RuntimeWarning, stacklevel=3)
+        self._compiled = False
+
+    @property
+    def compiled(self) -> bool:
+        """Whether the next call runs compiled code."""
+        return _ENABLED and self._compiled is not False and jit_available()
+
+    def __call__(self, *args):
+        if _ENABLED:
+            compiled = self._compiled
+            if compiled is None:
+                compiled = self._compile()
+            if compiled is not False:
+                try:
+                    return compiled(*args)
+                except self._numba_error as e:
+                    self._disable(e)
+        return self.fallback(*args)
+
+
+def jit(func: Callable = None, *, fallback: Callable | None = None, **options) -> Callable:
+    """A decorator for numeric kernels: compiled with numba when the JIT is on, a fallback otherwise.
+
+    The kernel is written in the numba subset of Python (loops over NumPy arrays, ``math``
+    functions), so it also runs as plain Python. The JIT is opt-in: switch it on with
+    ``set_jit(True)`` or the environment variable ``PYUFUNC_JIT=1``; without numba, or with the
+    JIT off, the kernel calls ``fallback`` (e.g. a NumPy vectorized version), or itself uncompiled.
+    Compiled code is cached on disk, see set_jit.
+
+    Args:
+        func (Callable): the kernel, positional arguments only.
+        fallback (Callable | None): the implementation used when the kernel does not run compiled.
+            Defaults to None, the kernel itself as plain Python.
+        **options: extra options for ``numba.njit``, e.g. ``fastmath=True``.
+
+    Examples:
+        >>> import math
+        >>> import numpy as np
+        >>> from pyufunc import jit, set_jit
+        >>> def _norm_numpy(xs, ys):
+        ...     return np.hypot(xs, ys)
+        >>> @jit(fallback=_norm_numpy)
+        ... def norm(xs, ys):
+        ...     out = np.empty(xs.shape[0])
+        ...     for i in range(xs.shape[0]):
+        ...         out[i] = math.sqrt(xs[i] * xs[i] + ys[i] * ys[i])
+        ...     return out
+        >>> set_jit(True)  # compiled with numba if installed, cached on disk
+        False
+
+    Returns:
+        Callable: the kernel.
+    """
+    if func is None:
+        return lambda f: jit(f, fallback=fallback, **options)
+    return _JitKernel(func, fallback, options)
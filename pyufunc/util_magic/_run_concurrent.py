@@ -0,0 +1,187 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import inspect
+import traceback
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from pyufunc.util_magic._executor import TaskError, _ON_ERROR
+
+
+def _check_inputs(func: Callable, iterable: Iterable, max_concurrency: int, on_error: str) -> None:
+    if not callable(func):
+        raise TypeError("The input function should be a callable.")
+    if not isinstance(iterable, Iterable):
+        raise TypeError("The input iterable should be an Iterable.")
+    if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+        raise ValueError("max_concurrency should be a positive integer.")
+    if on_error not in _ON_ERROR:
+        raise ValueError(f"on_error should be one of {_ON_ERROR}, but got {on_error!r}.")
+
+
+async def run_concurrent_async(func: Callable,
+                               iterable: Iterable,
+                               max_concurrency: int = 16,
+                               *,
+                               ordered: bool = True,
+                               on_error: str = "capture",
+                               executor: Executor | None = None) -> AsyncIterator:
+    """Asynchronously map func over iterable with at most max_concurrency calls in flight.
+
+    The async counterpart of run_concurrent, for code that already runs inside an event loop.
+    Coroutine functions are awaited directly, plain callables run in a thread pool.
+
+    Args:
+        func (Callable): a coroutine function or a plain (blocking) callable taking one item.
+        iterable (Iterable): the inputs, consumed lazily.
+        max_concurrency (int): max calls in flight. Defaults to 16.
+        ordered (bool): yield results in input order, False to yield them as they finish. Defaults to True.
+        on_error (str): "capture" yields a TaskError in place of a failed result, "raise" raises it,
+            "skip" drops failed items. Defaults to "capture".
+        executor (Executor | None): the executor for plain callables. Defaults to None,
+            a thread pool with max_concurrency threads for the duration of the call.
+
+    Examples:
+        >>> async def main():
+        ...     async for status in run_concurrent_async(fetch_status, urls, max_concurrency=32):
+        ...         print(status)
+
+    Returns:
+        AsyncIterator: the results.
+    """
+    import asyncio  # imported on use: asyncio is slow to import
+
+    _check_inputs(func, iterable, max_concurrency, on_error)
+
+    loop = asyncio.get_running_loop()
+    is_coroutine = inspect.iscoroutinefunction(func)
+    own_executor = None
+    if not is_coroutine and executor is None:
+        own_executor = executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                                     thread_name_prefix="pyufunc-concurrent")
+
+    async def _call(index: int, item):
+        try:
+            if is_coroutine:
+                return index, await func(item)
+            return index, await loop.run_in_executor(executor, func, item)
+        except Exception as e:
+            return index, TaskError(index, type(e).__name__, str(e), traceback.format_exc())
+
+    items = enumerate(iterable)
+    pending: set[asyncio.Task] = set()
+    finished: dict[int, object] = {}
+    next_index = 0
+    exhausted = False
+
+    try:
+        while True:
+            # bounded fan-out: never more than max_concurrency calls in flight
+            while not exhausted and len(pending) < max_concurrency and len(finished) < 4 * max_concurrency:
+                entry = next(items, None)
+                if entry is None:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(_call(*entry)))
+
+            if ordered and next_index in finished:
+                ready = [finished.pop(next_index)]
+                next_index += 1
+            elif pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if ordered:
+                    finished.update(task.result() for task in done)
+                    continue
+                ready = [task.result()[1] for task in done]
+            else:
+                return
+
+            for value in ready:
+                if isinstance(value, TaskError):
+                    if on_error == "raise":
+                        raise value
+                    if on_error == "skip":
+                        continue
+                yield value
+    finally:
+        for task in pending:
+            task.cancel()
+        if own_executor is not None:
+            own_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _stream(func: Callable, iterable: Iterable, max_concurrency: int, ordered: bool, on_error: str) -> Iterator:
+    import asyncio
+
+    # drive the async generator step by step on a private event loop
+    loop = asyncio.new_event_loop()
+    results = run_concurrent_async(func, iterable, max_concurrency, ordered=ordered, on_error=on_error)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(results.aclose())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def run_concurrent(func: Callable,
+                   iterable: Iterable,
+                   max_concurrency: int = 16,
+                   *,
+                   ordered: bool = True,
+                   stream: bool = False,
+                   on_error: str = "capture") -> list | Iterator:
+    """Run an I/O-bound function concurrently over an iterable, without spawning processes.
+
+    Coroutine functions run natively on an asyncio event loop, plain callables run in a thread pool.
+    At most max_concurrency calls are in flight at any time, and the input iterable is consumed
+    lazily. Use run_parallel instead for CPU-bound functions.
+
+    Args:
+        func (Callable): a coroutine function or a plain (blocking) callable taking one item.
+        iterable (Iterable): the inputs.
+        max_concurrency (int): max calls in flight. Defaults to 16.
+        ordered (bool): keep results in input order, False for completion order. Defaults to True.
+        stream (bool): return an iterator yielding results as they become available instead of a list.
+            Defaults to False.
+        on_error (str): "capture" puts a TaskError in place of a failed result, "raise" raises it,
+            "skip" drops failed items. Defaults to "capture".
+
+    Raises:
+        TypeError: if func is not callable or iterable is not an Iterable.
+        ValueError: if max_concurrency is not a positive integer or on_error is not supported.
+        RuntimeError: if called from a running event loop, use run_concurrent_async there.
+
+    Examples:
+        >>> from pyufunc import run_concurrent, get_osm_place
+        >>> places = run_concurrent(get_osm_place, ["Tempe, AZ", "Mesa, AZ", "Phoenix, AZ"], max_concurrency=8)
+
+        >>> for status in run_concurrent(check_url, urls, max_concurrency=64, ordered=False, stream=True):
+        ...     print(status)
+
+    Returns:
+        list | Iterator: the results, a list or an iterator if stream is True.
+    """
+    import asyncio
+
+    _check_inputs(func, iterable, max_concurrency, on_error)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("run_concurrent cannot be called from a running event loop, "
+                           "use `async for ... in run_concurrent_async(...)` instead.")
+
+    results = _stream(func, iterable, max_concurrency, ordered, on_error)
+    return results if stream else list(results)
@@ -7,24 +7,44 @@
 
 
 from __future__ import absolute_import
-from multiprocessing import Pool
 from collections.abc import Iterable, Callable
-import os
-from pyufunc.util_magic._func_time_decorator import func_running_time
+
+from pyufunc.util_magic._executor import ParallelExecutor
+from pyufunc.util_magic._shared_memory import SharedMemoryTransport
 
 
-@func_running_time
 def run_parallel(func: Callable,
                  iterable: Iterable,
                  num_processes: int = None,
-                 chunksize: int = 0) -> list:
+                 chunksize: int = 0,
+                 *,
+                 backend: str = "process",
+                 ordered: bool = True,
+                 on_error: str = "capture",
+                 shared_pool: bool = True,
+                 share_memory: bool = True,
+                 verbose: bool = False) -> list:
     """Run a function in parallel with multiple processors.
 
     Args:
         func (callable): The function to run in parallel.
         iterable (Iterable): The input iterable to the function.
-        num_processes (int, optional): The number of processors to use. Defaults to os.cpu_count() - 1.
-        chunksize (int, optional): The chunksize for the parallel processing. Defaults to 0.
+        num_processes (int, optional): The number of processors to use. Defaults to os.cpu_count() - 1,
+            or with shared_pool the size of the shared pool. On the shared pool it limits the chunks
+            running at once, the pool keeps the size set by configure_worker_pool.
+        chunksize (int, optional): The chunksize for the parallel processing.
+            Defaults to 0, tune the chunksize automatically from measured task time.
+        backend (str, optional): "process" or "thread". Defaults to "process".
+        ordered (bool, optional): keep results in input order. Defaults to True.
+        on_error (str, optional): "capture" puts a TaskError in place of a failed result,
+            "raise" raises the TaskError, "skip" drops failed items. Defaults to "capture".
+        shared_pool (bool, optional): reuse the persistent worker pool across calls instead of starting
+            and stopping processes on every call (process backend only). Defaults to True.
+        share_memory (bool, optional): send large NumPy arrays and pandas numeric data bound to func
+            (e.g. with functools.partial) to the workers once through shared memory, as read-only
+            zero-copy views, instead of pickling them into every task (process backend only).
+            Defaults to True.
+        verbose (bool, optional): print the number of workers used. Defaults to False.
 
     Raises:
         TypeError: If the input function is not callable,
@@ -36,7 +56,15 @@ def run_parallel(func: Callable,
         TypeError: if the input number of processors is not an integer
         TypeError: if the input chunksize should be an integer
         ValueError: if the input number of processors is not greater than 0
-        ValueError: if the input chunksize is not greater than 0
+        ValueError: if the input chunksize is less than 0
+
+    Note:
+        - The shared worker pool stays alive between calls. Configure it with ``configure_worker_pool``
+            and release it with ``shutdown_worker_pool``.
+        - For streaming results, or to reuse the same pool across calls, use ``ParallelExecutor``
+            with ``imap`` / ``imap_unordered`` directly.
+        - Items of the iterable are sent once each and are not placed in shared memory, use
+            ``SharedMemoryTransport`` to share them explicitly.
 
     Examples:
         >>> import numpy as np
@@ -59,38 +87,22 @@ def run_parallel(func: Callable,
         raise TypeError("The input function should be a callable.")
     if not isinstance(iterable, Iterable):
         raise TypeError("The input iterable should be an Iterable.")
-    if not isinstance(num_processes, int):
+    if num_processes is not None and not isinstance(num_processes, int):
         raise TypeError("The input number of processors should be an integer.")
     if not isinstance(chunksize, int):
         raise TypeError("The input chunksize should be an integer.")
 
     # check the number of processors and chunksize are greater than 0
-    if num_processes <= 0:
+    if num_processes is not None and num_processes <= 0:
         raise ValueError("The input number of processors should be greater than 0.")
     if chunksize < 0:
         raise ValueError("The input chunksize should be greater than 0.")
 
-    # Step 1: determine default number of processes if not provided
-    if num_processes is None:
-        cpu_count = os.cpu_count() or 1
-        # prefer using cpu_count - 1 when possible, but ensure at least 1
-        num_processes = cpu_count - 1 if cpu_count > 1 else 1
-
-    # Step 2: get the number of processors to use (cap by available CPUs)
-    available = (os.cpu_count() or 1) - 1
-    available = available if available > 0 else 1
-    num_processors = min(num_processes, available)
-    print(f"  :Info: using {num_processors} processors to run {func.__name__}...")
-
-    # Step 2: check the chunksize
-    if chunksize >= len(iterable):
-        chunksize = len(iterable) // num_processors
-
-    # Step 3: run the function in parallel
-    with Pool(num_processors) as pool:
-        if chunksize == 0:
-            results = pool.map(func, iterable)
-        else:
-            results = pool.map(func, iterable, chunksize=chunksize)
-
-    return results
+    with ParallelExecutor(backend=backend, max_workers=num_processes, on_error=on_error,
+                          shared_pool=shared_pool) as executor, SharedMemoryTransport() as transport:
+        if verbose:
+            func_name = getattr(func, "__name__", repr(func))
+            print(f"  :Info: using {executor.max_workers} {backend} workers to run {func_name}...")
+        if share_memory and backend == "process":
+            func = transport.share(func)
+        return executor.map(func, iterable, chunksize=chunksize, ordered=ordered)
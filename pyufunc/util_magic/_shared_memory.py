@@ -0,0 +1,277 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import sys
+import weakref
+import functools
+import threading
+from multiprocessing import resource_tracker, shared_memory
+
+# arrays smaller than this are cheaper to pickle than to place in shared memory
+_MIN_SHARED_BYTES = 1 << 20
+# column offsets inside a shared DataFrame block are aligned to a cache line
+_ALIGNMENT = 64
+_TRACKER_LOCK = threading.Lock()
+
+
+def _open_untracked(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without registering it with this process's resource tracker.
+
+    The creating process owns (and unlinks) the block. A worker whose tracker also registered it
+    would report it as leaked, and try to unlink it again, when the worker exits.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    with _TRACKER_LOCK:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _attach_block(name: str, size: int):
+    """Worker side: map a shared memory block as a read-only uint8 array.
+
+    Every array rebuilt from the block is a view of the returned array, so the block is
+    closed (unmapped) as soon as the last of those views is garbage collected.
+    """
+    import numpy as np
+
+    shm = _open_untracked(name)
+    block = np.ndarray((size,), dtype=np.uint8, buffer=shm.buf)
+    block.flags.writeable = False
+    finalizer = weakref.finalize(block, shm.close)
+    finalizer.atexit = False
+    return block
+
+
+def _prod(shape: tuple) -> int:
+    size = 1
+    for dim in shape:
+        size *= dim
+    return size
+
+
+def _block_view(block, offset: int, shape: tuple, dtype):
+    nbytes = dtype.itemsize * _prod(shape)
+    return block[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+def _attach_array(name: str, shape: tuple, dtype):
+    return _block_view(_attach_block(name, dtype.itemsize * _prod(shape)), 0, shape, dtype)
+
+
+def _attach_series(values, index, series_name):
+    import pandas as pd
+    return pd.Series(values, index=index, name=series_name, copy=False)
+
+
+def _attach_frame(name: str, size: int, layout: list, columns: dict, index, order: list):
+    import pandas as pd
+
+    block = _attach_block(name, size)
+    data = {col: _block_view(block, offset, shape, dtype) for col, offset, shape, dtype in layout}
+    data.update(columns)
+    return pd.DataFrame(data, index=index, columns=order, copy=False)
+
+
+class _SharedArrayHandle:
+    """Pickles as a reference to a shared memory block, unpickles as a zero-copy ndarray."""
+
+    def __init__(self, name: str, shape: tuple, dtype):
+        self.name, self.shape, self.dtype = name, shape, dtype
+
+    def __reduce__(self):
+        return _attach_array, (self.name, self.shape, self.dtype)
+
+
+class _SharedSeriesHandle:
+    """Pickles the index normally and the values as a shared memory reference."""
+
+    def __init__(self, values: _SharedArrayHandle, index, name):
+        self.values, self.index, self.name = values, index, name
+
+    def __reduce__(self):
+        return _attach_series, (self.values, self.index, self.name)
+
+
+class _SharedFrameHandle:
+    """All numeric columns of a DataFrame in one shared block, other columns pickled normally."""
+
+    def __init__(self, name: str, size: int, layout: list, columns: dict, index, order: list):
+        self.name, self.size, self.layout = name, size, layout
+        self.columns, self.index, self.order = columns, index, order
+
+    def __reduce__(self):
+        return _attach_frame, (self.name, self.size, self.layout, self.columns, self.index, self.order)
+
+
+class SharedMemoryTransport:
+    """Ship large NumPy arrays and pandas numeric data to worker processes through shared memory.
+
+    ``share`` copies every large array found in the input once into a
+    ``multiprocessing.shared_memory`` block and replaces it with a small handle. When the handle is
+    unpickled in a worker it becomes a read-only, zero-copy ndarray (or Series / DataFrame) view of
+    the block, so the data is no longer pickled into every task. Small arrays, object arrays and
+    every other value are left unchanged and pickled as usual. All blocks are released by ``close``
+    or when leaving the ``with`` block.
+
+    ``share`` walks tuples, lists, dicts and ``functools.partial`` objects, so arrays bound to the
+    function with ``functools.partial`` are shared with all tasks. ``run_parallel`` applies it to
+    ``func`` automatically for the process backend.
+
+    Args:
+        min_bytes (int): arrays (and DataFrames' numeric columns in total) smaller than this are
+            pickled as usual. Defaults to 1 MiB.
+
+    Examples:
+        >>> import functools
+        >>> import numpy as np
+        >>> from pyufunc import ParallelExecutor, SharedMemoryTransport
+        >>> lon, lat = np.random.rand(10_000_000), np.random.rand(10_000_000)
+        >>> def block_mean(lon, lat, bounds):
+        ...     start, end = bounds
+        ...     return float((lon[start:end] + lat[start:end]).mean())
+        >>> bounds = [(i, i + 1_000_000) for i in range(0, 10_000_000, 1_000_000)]
+        >>> with SharedMemoryTransport() as transport, ParallelExecutor() as executor:
+        ...     func = transport.share(functools.partial(block_mean, lon, lat))
+        ...     means = executor.map(func, bounds)
+    """
+
+    def __init__(self, min_bytes: int = _MIN_SHARED_BYTES):
+        if not isinstance(min_bytes, int) or min_bytes < 0:
+            raise ValueError("min_bytes should be a non-negative integer.")
+        self.min_bytes = min_bytes
+        self._blocks: list[shared_memory.SharedMemory] = []
+        # id(obj) -> (obj, handle): share the same object only once, keep obj alive so ids stay unique
+        self._shared: dict[int, tuple] = {}
+
+    # ---------------------------------------------------------------- lifecycle
+    @property
+    def nbytes(self) -> int:
+        """Total size of the shared memory blocks currently held."""
+        return sum(shm.size for shm in self._blocks)
+
+    def close(self) -> None:
+        """Release all shared memory blocks. Workers keep their views until they drop them."""
+        while self._blocks:
+            shm = self._blocks.pop()
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._shared.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # ---------------------------------------------------------------- sharing
+    def _new_block(self, size: int):
+        import numpy as np
+
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._blocks.append(shm)
+        return shm, np.ndarray((shm.size,), dtype=np.uint8, buffer=shm.buf)
+
+    def _is_shareable(self, array, np) -> bool:
+        return (type(array) is np.ndarray and not array.dtype.hasobject
+                and array.nbytes >= self.min_bytes and array.nbytes > 0)
+
+    def _share_array(self, array) -> _SharedArrayHandle:
+        shm, block = self._new_block(array.nbytes)
+        _block_view(block, 0, array.shape, array.dtype)[...] = array
+        del block
+        return _SharedArrayHandle(shm.name, array.shape, array.dtype)
+
+    def _share_frame(self, frame, np):
+        layout_cols, numeric_bytes = [], 0
+        for col in frame.columns:
+            if not isinstance(frame[col].dtype, np.dtype):
+                # extension dtypes (categorical, nullable, tz-aware) would not round-trip
+                continue
+            values = frame[col].to_numpy()
+            if type(values) is np.ndarray and not values.dtype.hasobject:
+                layout_cols.append((col, values))
+                numeric_bytes += values.nbytes
+        if not layout_cols or numeric_bytes < self.min_bytes:
+            return frame
+
+        offset, layout = 0, []
+        for col, values in layout_cols:
+            layout.append((col, offset, values.shape, values.dtype))
+            offset += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        shm, block = self._new_block(offset)
+        for (col, values), (_, col_offset, shape, dtype) in zip(layout_cols, layout):
+            _block_view(block, col_offset, shape, dtype)[...] = values
+        del block
+
+        shared_cols = {col for col, _ in layout_cols}
+        others = {col: frame[col] for col in frame.columns if col not in shared_cols}
+        return _SharedFrameHandle(shm.name, offset, layout, others, frame.index, list(frame.columns))
+
+    def share(self, obj):
+        """Return obj with its large arrays replaced by shared memory handles.
+
+        Args:
+            obj: an ndarray, pandas Series / DataFrame, or a tuple, list, dict or functools.partial
+                containing them. Any other value is returned unchanged.
+
+        Returns:
+            the same structure, ready to be pickled to worker processes.
+        """
+        np = sys.modules.get("numpy")
+        if np is None:
+            # numpy was never imported, so obj cannot hold any array
+            return obj
+
+        key = id(obj)
+        if key in self._shared:
+            return self._shared[key][1]
+
+        pd = sys.modules.get("pandas")
+        shared = obj
+        if isinstance(obj, np.ndarray):
+            if self._is_shareable(obj, np):
+                shared = self._share_array(obj)
+        elif pd is not None and isinstance(obj, pd.Series):
+            values = obj.to_numpy()
+            if isinstance(obj.dtype, np.dtype) and self._is_shareable(values, np):
+                shared = _SharedSeriesHandle(self._share_array(values), obj.index, obj.name)
+        elif pd is not None and isinstance(obj, pd.DataFrame):
+            if obj.columns.is_unique:
+                shared = self._share_frame(obj, np)
+        elif isinstance(obj, functools.partial):
+            args, keywords = self.share(obj.args), self.share(obj.keywords)
+            if args is not obj.args or keywords is not obj.keywords:
+                shared = functools.partial(obj.func, *args, **keywords)
+        elif type(obj) in (tuple, list):
+            items = [self.share(item) for item in obj]
+            if any(new is not old for new, old in zip(items, obj)):
+                shared = type(obj)(items)
+        elif type(obj) is dict:
+            items = {key_: self.share(value) for key_, value in obj.items()}
+            if any(items[key_] is not value for key_, value in obj.items()):
+                shared = items
+
+        if shared is not obj:
+            self._shared[key] = (obj, shared)
+        return shared
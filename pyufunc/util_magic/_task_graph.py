@@ -0,0 +1,335 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import os
+import json
+import pickle
+import hashlib
+import tempfile
+from pathlib import Path
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from pyufunc.__cfg import get_cpu_cores
+from pyufunc.util_magic._cache import stable_hash, _function_fingerprint
+from pyufunc.util_magic._worker_pool import get_worker_pool
+
+
+class TaskRef:
+    """A reference to the result of a TaskGraph task, usable as an argument of other tasks."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return f"TaskRef({self.name!r})"
+
+
+class FileInput:
+    """A file argument of a TaskGraph task: passed to the function as its path, keyed by its content."""
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+
+    def __repr__(self):
+        return f"FileInput({self.path!r})"
+
+
+class _CachedResult:
+    """Placeholder for a dependency result, loaded from the cache inside the worker."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: str):
+        self.key = key
+
+
+def _map_args(obj, replace: Callable):
+    """Apply replace to TaskRef / FileInput / _CachedResult leaves of nested tuples, lists and dicts."""
+    if isinstance(obj, (TaskRef, FileInput, _CachedResult)):
+        return replace(obj)
+    if type(obj) in (tuple, list):
+        return type(obj)(_map_args(item, replace) for item in obj)
+    if type(obj) is dict:
+        return {key: _map_args(value, replace) for key, value in obj.items()}
+    return obj
+
+
+def _result_file(cache_dir: str, key: str) -> Path:
+    return Path(cache_dir) / f"{key}.pkl"
+
+
+def _meta_file(cache_dir: str, key: str) -> Path:
+    return Path(cache_dir) / f"{key}.json"
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def _load_result(cache_dir: str, key: str):
+    with open(_result_file(cache_dir, key), "rb") as f:
+        return pickle.load(f)
+
+
+def _execute_task(func: Callable, args: tuple, kwargs: dict, cache_dir: str, key: str, name: str) -> str:
+    """Worker side: load dependency results from the cache, run the task and cache its result.
+
+    Results travel between workers through the cache directory, not through the parent process.
+    Returns the content digest of the pickled result.
+    """
+    def _resolve(obj):
+        if isinstance(obj, _CachedResult):
+            return _load_result(cache_dir, obj.key)
+        return obj.path  # FileInput
+
+    result = func(*_map_args(args, _resolve), **_map_args(kwargs, _resolve))
+
+    data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    _atomic_write(_result_file(cache_dir, key), data)
+    _atomic_write(_meta_file(cache_dir, key), json.dumps({"name": name, "digest": digest}).encode())
+    return digest
+
+
+class TaskGraph:
+    """A small DAG runner with content-hashed, on-disk caching of every task result.
+
+    Tasks declare their inputs as arguments: plain values, other tasks' results (TaskRef, returned by
+    ``task``) and files (``file``). A task's cache key hashes its function code, its plain arguments,
+    the content of its input files and the content digest of each upstream result. On ``run``, a task
+    whose key is already cached is skipped without loading anything; since keys follow result
+    content, a changed input re-runs only the tasks downstream of it, and stops early when a re-run
+    task produces an unchanged result. Independent branches run in parallel on the shared worker pool
+    (``backend="process"``) or a thread pool, and results are passed between tasks through the cache.
+
+    Args:
+        cache_dir (str): directory of the result cache. Defaults to ".pyufunc_cache/task_graph".
+        backend (str): "process" (shared worker pool) or "thread". Defaults to "process".
+        max_workers (int | None): number of tasks running at once. Defaults to None: as many as the shared
+            pool has workers (process backend, the pool keeps its configured size), or cpu cores - 1 threads.
+
+    Note:
+        Only the task function's own code is part of the key. Pass ``version=`` to ``task`` to
+        invalidate cached results after changing a helper it calls.
+
+    Examples:
+        >>> from pyufunc import TaskGraph, gmns_read_node, gmns_read_link
+        >>> graph = TaskGraph(cache_dir="./.dag_cache")
+        >>> nodes = graph.task(gmns_read_node, graph.file("node.csv"), name="nodes")
+        >>> links = graph.task(gmns_read_link, graph.file("link.csv"), name="links")
+        >>> zones = graph.task(assign_zones, nodes, links, name="zones")
+        >>> results = graph.run()            # first run: everything runs
+        >>> results = graph.run(["zones"])   # nothing changed: all tasks skipped
+        >>> graph.last_run
+        {'nodes': 'cached', 'links': 'cached', 'zones': 'cached'}
+    """
+
+    def __init__(self, cache_dir: str = ".pyufunc_cache/task_graph", backend: str = "process",
+                 max_workers: int | None = None):
+        if backend not in ("process", "thread"):
+            raise ValueError(f"backend should be 'process' or 'thread', but got {backend!r}.")
+        if max_workers is not None and (not isinstance(max_workers, int) or max_workers <= 0):
+            raise ValueError("max_workers should be a positive integer.")
+
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.backend = backend
+        self.max_workers = max_workers
+        # name -> (func, args, kwargs, version), in insertion (hence topological) order
+        self._tasks: dict[str, tuple] = {}
+        self.last_run: dict[str, str] = {}
+
+    # ---------------------------------------------------------------- graph building
+    def task(self, func: Callable, *args, name: str = "", version: str = "", **kwargs) -> TaskRef:
+        """Add a task calling func(*args, **kwargs) and return a reference to its result.
+
+        Args:
+            func (Callable): the task function, picklable for the process backend.
+            *args: positional arguments, may contain TaskRef and FileInput (also inside tuples, lists, dicts).
+            name (str): unique task name. Defaults to "", the function name.
+            version (str): bump to invalidate cached results of this task. Defaults to "".
+            **kwargs: keyword arguments, same rules as args.
+
+        Returns:
+            TaskRef: the reference to pass to downstream tasks.
+        """
+        if not callable(func):
+            raise TypeError("The task function should be a callable.")
+        name = name or func.__name__
+        if name in self._tasks:
+            raise ValueError(f"A task named {name!r} already exists.")
+
+        def _check_ref(obj):
+            if isinstance(obj, TaskRef) and obj.name not in self._tasks:
+                raise ValueError(f"Task {name!r} depends on unknown task {obj.name!r}.")
+            return obj
+
+        _map_args((args, kwargs), _check_ref)
+        self._tasks[name] = (func, args, kwargs, version)
+        return TaskRef(name)
+
+    @staticmethod
+    def file(path: str) -> FileInput:
+        """Declare an input file: the task receives the path, its cache key follows the file content."""
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"File: {path} does not exist.")
+        return FileInput(path)
+
+    def dependencies(self, name: str) -> list[str]:
+        """Names of the tasks whose results the given task uses."""
+        deps = []
+        _map_args(self._tasks[name][1:3], lambda obj: deps.append(obj.name) if isinstance(obj, TaskRef) else obj)
+        return list(dict.fromkeys(deps))
+
+    # ---------------------------------------------------------------- keys
+    def _file_digest(self, path: str, stamps: dict) -> str:
+        stat = os.stat(path)
+        stamp = f"{path}|{stat.st_size}|{stat.st_mtime_ns}"
+        if stamp not in stamps:
+            h = hashlib.blake2b(digest_size=16)
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+            stamps[stamp] = h.hexdigest()
+        return stamps[stamp]
+
+    def _task_key(self, name: str, digests: dict, stamps: dict) -> str:
+        func, args, kwargs, version = self._tasks[name]
+
+        def _keyed(obj):
+            if isinstance(obj, TaskRef):
+                return ("task-result", digests[obj.name])
+            return ("file", self._file_digest(obj.path, stamps))
+
+        return stable_hash((_function_fingerprint(func), version, _map_args(args, _keyed), _map_args(kwargs, _keyed)))
+
+    def _cached_digest(self, key: str) -> str | None:
+        try:
+            with open(_meta_file(self.cache_dir, key), "r", encoding="utf-8") as f:
+                digest = json.load(f)["digest"]
+        except (OSError, ValueError, KeyError):
+            return None
+        return digest if _result_file(self.cache_dir, key).is_file() else None
+
+    # ---------------------------------------------------------------- running
+    def _required(self, targets: list[str]) -> list[str]:
+        required, stack = set(), list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in self._tasks:
+                raise KeyError(f"Unknown task {name!r}.")
+            if name not in required:
+                required.add(name)
+                stack.extend(self.dependencies(name))
+        return [name for name in self._tasks if name in required]
+
+    def _load_stamps(self) -> dict:
+        try:
+            with open(Path(self.cache_dir) / "file_stamps.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def run(self, targets: list[str] | None = None, force: bool = False) -> dict:
+        """Run the graph, skipping tasks whose results are cached.
+
+        Args:
+            targets (list[str] | None): task names to compute, with their upstream tasks.
+                Defaults to None, all tasks.
+            force (bool): ignore cached results and re-run every required task. Defaults to False.
+
+        Raises:
+            RuntimeError: if a task fails, pending tasks are cancelled.
+
+        Returns:
+            dict: {target name: result}. ``last_run`` holds "cached" or "ran" for every required task.
+        """
+        targets = list(self._tasks) if targets is None else list(targets)
+        order = self._required(targets)
+        Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+
+        stamps = self._load_stamps()
+        digests: dict[str, str] = {}
+        keys: dict[str, str] = {}
+        self.last_run = {}
+        waiting = list(order)
+        running = {}
+
+        own_executor = None
+        if self.backend == "process":
+            # never resize the shared pool, an explicit max_workers only caps the tasks submitted at once
+            executor = get_worker_pool()
+        else:
+            cpu_count = get_cpu_cores()
+            own_executor = executor = ThreadPoolExecutor(
+                max_workers=self.max_workers or (cpu_count - 1 if cpu_count > 1 else 1))
+
+        try:
+            while waiting or running:
+                # start (or skip) every task whose dependencies are done
+                for name in [n for n in waiting if all(dep in digests for dep in self.dependencies(n))]:
+                    if self.max_workers is not None and len(running) >= self.max_workers:
+                        break
+                    waiting.remove(name)
+                    keys[name] = key = self._task_key(name, digests, stamps)
+                    cached = None if force else self._cached_digest(key)
+                    if cached is not None:
+                        digests[name] = cached
+                        self.last_run[name] = "cached"
+                        continue
+
+                    func, args, kwargs, _ = self._tasks[name]
+
+                    def _placeholder(obj):
+                        return _CachedResult(keys[obj.name]) if isinstance(obj, TaskRef) else obj
+
+                    future = executor.submit(_execute_task, func, _map_args(args, _placeholder),
+                                             _map_args(kwargs, _placeholder), self.cache_dir, key, name)
+                    running[future] = name
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        digests[name] = future.result()
+                    except Exception as e:
+                        raise RuntimeError(f"Task {name!r} failed: {type(e).__name__}: {e}") from e
+                    self.last_run[name] = "ran"
+        finally:
+            for future in running:
+                future.cancel()
+            if own_executor is not None:
+                own_executor.shutdown(wait=True, cancel_futures=True)
+            try:
+                _atomic_write(Path(self.cache_dir) / "file_stamps.json", json.dumps(stamps).encode())
+            except OSError:
+                pass
+
+        return {name: _load_result(self.cache_dir, keys[name]) for name in targets}
+
+    def clear_cache(self) -> None:
+        """Delete all cached results in cache_dir."""
+        cache_path = Path(self.cache_dir)
+        if cache_path.is_dir():
+            for path in [*cache_path.glob("*.pkl"), *cache_path.glob("*.json")]:
+                path.unlink(missing_ok=True)
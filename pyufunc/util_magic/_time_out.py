@@ -5,59 +5,188 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
-import sys
+import time
+import signal
+import inspect
+import importlib
 import threading
-
-# noinspection PyUnusedLocal
 import functools
-import signal
+import multiprocessing
 
+_MODES = ("thread", "process", "asyncio", "cooperative")
 
-class __KThread(threading.Thread):
-    def __init__(self, *args, **kwargs):
-        threading.Thread.__init__(self, *args, **kwargs)
-        self.killed = False
-        self.__run_backup = None
 
-    # noinspection PyAttributeOutsideInit
-    def start(self):
-        """Start the thread."""
-        self.__run_backup = self.run
-        self.run = self.__run  # Force the Thread to install our trace.
-        threading.Thread.start(self)
+# noinspection PyPep8Naming
+class TIMEOUT_EXCEPTION(TimeoutError):
+    """function run timeout"""
+    pass
 
-    def __run(self):
-        """Hacked run function, which installs the trace."""
-        sys.settrace(self.globaltrace)
-        run_backup = self.__run_backup
-        if run_backup is not None:
-            run_backup()
-        self.run = self.__run_backup
 
-    def globaltrace(self, frame, why, arg):
-        return self.localtrace if why == 'call' else None
+class _ThreadKilled(BaseException):
+    """Raised asynchronously inside a timed-out worker thread to stop it."""
 
-    def localtrace(self, frame, why, arg):
-        if why == 'line':
-            if self.killed:
-                raise SystemExit()
-        return self.localtrace
 
-    def kill(self):
-        self.killed = True
+class CancellationToken:
+    """A cancellation token for cooperative timeouts.
 
+    The function decorated with ``timeout(seconds, mode="cooperative")`` receives a token as the
+    ``cancel_token`` keyword argument and checks it at convenient points, e.g. once per loop
+    iteration. Checking the token is a clock read, no thread or trace function is involved.
 
-# noinspection PyPep8Naming
-class TIMEOUT_EXCEPTION(Exception):
-    """function run timeout"""
-    pass
+    Args:
+        seconds (float | None): time budget from now. Defaults to None, no deadline.
+
+    Examples:
+        >>> from pyufunc import CancellationToken
+        >>> token = CancellationToken(0.5)
+        >>> while not token.cancelled:
+        ...     pass  # do a slice of work
+        >>> token.raise_if_cancelled()
+        TIMEOUT_EXCEPTION: operation cancelled after 0.5 seconds timeout
+    """
+
+    __slots__ = ("seconds", "deadline", "_cancelled")
+
+    def __init__(self, seconds: float | None = None):
+        self.seconds = seconds
+        self.deadline = None if seconds is None else time.monotonic() + seconds
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the token explicitly."""
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() was called or the deadline has passed."""
+        if not self._cancelled and self.deadline is not None and time.monotonic() >= self.deadline:
+            self._cancelled = True
+        return self._cancelled
+
+    @property
+    def remaining(self) -> float | None:
+        """Seconds left before the deadline, None without deadline."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def raise_if_cancelled(self) -> None:
+        """Raise TIMEOUT_EXCEPTION if the token is cancelled."""
+        if self.cancelled:
+            raise TIMEOUT_EXCEPTION(f"operation cancelled after {self.seconds} seconds timeout")
+
+
+def _stop_thread(thread: threading.Thread) -> None:
+    # schedule an exception in the thread, checked by the interpreter between bytecodes:
+    # stops pure python code without tracing, code blocked in C returns first (best effort)
+    import ctypes
+
+    if thread.ident is None or not hasattr(ctypes, "pythonapi"):
+        return
+    set_async_exc = ctypes.pythonapi.PyThreadState_SetAsyncExc
+    if set_async_exc(ctypes.c_ulong(thread.ident), ctypes.py_object(_ThreadKilled)) > 1:
+        set_async_exc(ctypes.c_ulong(thread.ident), None)
+
+
+def _run_in_thread(func, seconds: float, args: tuple, kwargs: dict):
+    outcome = {}
+
+    def _target():
+        try:
+            outcome["result"] = func(*args, **kwargs)
+        except _ThreadKilled:
+            pass
+        except BaseException as e:
+            outcome["error"] = e
 
+    thread = threading.Thread(target=_target, name=f"timeout-{func.__name__}", daemon=True)
+    thread.start()
+    thread.join(seconds)
 
-def timeout(seconds: int) -> object:
+    if thread.is_alive():
+        _stop_thread(thread)
+        raise TIMEOUT_EXCEPTION(f'{func.__name__} exceed {seconds} seconds timeout')
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
+
+
+def _resolve_function(module_name: str, qualname: str):
+    # the module attribute is the decorated wrapper, unwrap it to the original function
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return inspect.unwrap(obj)
+
+
+def _process_target(conn, func, args: tuple, kwargs: dict) -> None:
+    if isinstance(func, tuple):
+        func = _resolve_function(*func)
+    try:
+        conn.send((True, func(*args, **kwargs)))
+    except BaseException as e:
+        try:
+            conn.send((False, e))
+        except Exception:
+            conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+    finally:
+        conn.close()
+
+
+def _run_in_process(func, seconds: float, args: tuple, kwargs: dict):
+    ctx = multiprocessing.get_context()
+    # a forked child inherits func, other start methods import it by name
+    func_ref = func if ctx.get_start_method() == "fork" else (func.__module__, func.__qualname__)
+
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_process_target, args=(child_conn, func_ref, args, kwargs), daemon=True)
+    process.start()
+    child_conn.close()
+
+    try:
+        if not parent_conn.poll(seconds):
+            process.terminate()
+            process.join(1)
+            if process.is_alive():
+                process.kill()
+            raise TIMEOUT_EXCEPTION(f'{func.__name__} exceed {seconds} seconds timeout')
+        try:
+            success, value = parent_conn.recv()
+        except EOFError:
+            process.join()
+            raise RuntimeError(
+                f"{func.__name__} exited with code {process.exitcode} without a result.") from None
+    finally:
+        parent_conn.close()
+        process.join(1)
+
+    if not success:
+        raise value
+    return value
+
+
+def timeout(seconds: float, mode: str = "thread") -> object:
     """A decorator to set the timeout for the function.
 
+    None of the modes traces the function line by line, so the wrapped code runs at full speed.
+
     Args:
-        seconds (int): timeout seconds for the function.
+        seconds (float): timeout seconds for the function.
+        mode (str): how the function is run and stopped. Defaults to "thread".
+
+            - "thread": run in a daemon thread; on timeout an exception is scheduled in the thread,
+              which stops pure python code (code blocked in C finishes its call first).
+            - "process": run in a child process that is terminated on timeout (real termination,
+              also for C code). Arguments and result are pickled.
+            - "asyncio": for coroutine functions, uses ``asyncio.wait_for`` and cancels the task.
+            - "cooperative": run in the calling thread, the function receives a
+              ``CancellationToken`` as ``cancel_token`` keyword and stops itself when it is cancelled.
+
+    Raises:
+        ValueError: if mode is not supported or seconds is not positive.
+        TypeError: if the function does not fit the mode (not a coroutine function for "asyncio",
+            no ``cancel_token`` parameter for "cooperative").
+        TIMEOUT_EXCEPTION: when the decorated function exceeds the timeout, a subclass of TimeoutError.
 
     Examples:
         >>> from pyufunc import timeout
@@ -75,36 +204,52 @@ def timeout(seconds: int) -> object:
         >>> my_function()
         >>> Error: my_function exceed 5 seconds timeout
 
+        >>> @timeout(5, mode="cooperative")
+        >>> def my_function(items, cancel_token=None):
+        >>>    for item in items:
+        >>>        cancel_token.raise_if_cancelled()
+        >>>        process(item)
+
     Returns:
         object: the decorated function.
     """
+    if mode not in _MODES:
+        raise ValueError(f"mode should be one of {_MODES}, but got {mode!r}.")
+    if not isinstance(seconds, (int, float)) or seconds <= 0:
+        raise ValueError("seconds should be a positive number.")
 
     def timeout_decorator(func):
-        def _new_func(oldfunc, result, oldfunc_args, oldfunc_kwargs):
-            result.append(oldfunc(*oldfunc_args, **oldfunc_kwargs))
+        if mode == "asyncio":
+            import asyncio
+
+            if not inspect.iscoroutinefunction(func):
+                raise TypeError(f"{func.__name__} should be a coroutine function for mode='asyncio'.")
+
+            @functools.wraps(func)
+            async def _async_wrapper(*args, **kwargs):
+                try:
+                    return await asyncio.wait_for(func(*args, **kwargs), seconds)
+                except asyncio.TimeoutError as e:
+                    raise TIMEOUT_EXCEPTION(f'{func.__name__} exceed {seconds} seconds timeout') from e
+            return _async_wrapper
+
+        if mode == "cooperative":
+            params = inspect.signature(func).parameters
+            if "cancel_token" not in params and not any(
+                    p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+                raise TypeError(f"{func.__name__} should accept a cancel_token argument for mode='cooperative'.")
+
+            @functools.wraps(func)
+            def _cooperative_wrapper(*args, **kwargs):
+                kwargs["cancel_token"] = CancellationToken(seconds)
+                return func(*args, **kwargs)
+            return _cooperative_wrapper
+
+        runner = _run_in_process if mode == "process" else _run_in_thread
 
+        @functools.wraps(func)
         def _(*args, **kwargs):
-            result = []
-            new_kwargs = {
-                'oldfunc': func,
-                'result': result,
-                'oldfunc_args': args,
-                'oldfunc_kwargs': kwargs
-            }
-
-            thd = __KThread(target=_new_func, args=(), kwargs=new_kwargs)
-            thd.start()
-            thd.join(seconds)
-            alive = thd.is_alive()
-            thd.kill()  # kill the child thread
-
-            if alive:
-                # raise TIMEOUT_EXCEPTION('function run too long, timeout %d seconds.' % seconds)
-                raise TIMEOUT_EXCEPTION(f'{func.__name__} exceed {seconds} seconds timeout')
-            return result[0] if result else result
-
-        _.__name__ = func.__name__
-        _.__doc__ = func.__doc__
+            return runner(func, seconds, args, kwargs)
         return _
 
     return timeout_decorator
@@ -112,6 +257,11 @@ def timeout(seconds: int) -> object:
 
 def timeout_linux(timeout: int):
     """A decorator to set the timeout for the function on linux system.
+
+    The timeout is delivered by SIGALRM, which is only possible in the main thread. Called from
+    any other thread, the function falls back to ``timeout(seconds, mode="thread")``.
+    A previously installed SIGALRM handler and pending alarm are restored afterwards.
+
     Args:
         timeout (int): timeout seconds for the function.
 
@@ -137,18 +287,28 @@ def timeout_linux(timeout: int):
     def _timeout_linux(func, ):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if not hasattr(signal, "SIGALRM") or not hasattr(signal, "alarm"):
+            if not hasattr(signal, "SIGALRM") or not hasattr(signal, "setitimer"):
                 raise RuntimeError("timeout_linux is only supported on platforms with SIGALRM.")
 
+            # signal handlers can only be installed in the main thread of the main interpreter
+            if threading.current_thread() is not threading.main_thread():
+                return _run_in_thread(func, timeout, args, kwargs)
+
             def _timeout_handler(signum, frame):
                 raise TimeoutError(
                     f"Function: {func} params: {args}, {kwargs} ,execution timed out: {timeout}")
             # timeout for linux system
-            signal.signal(signal.SIGALRM, _timeout_handler)
-            signal.alarm(timeout)
+            previous_handler = signal.signal(signal.SIGALRM, _timeout_handler)
+            previous_delay, _ = signal.setitimer(signal.ITIMER_REAL, timeout)
+            time_start = time.monotonic()
             try:
                 return func(*args, **kwargs)
             finally:
-                signal.alarm(0)
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM, previous_handler)
+                if previous_delay:
+                    # re-arm the outer alarm with the time it has left
+                    signal.setitimer(signal.ITIMER_REAL,
+                                     max(previous_delay - (time.monotonic() - time_start), 1e-3))
         return wrapper
     return _timeout_linux
@@ -0,0 +1,163 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import os
+import atexit
+import importlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from pyufunc.__cfg import get_cpu_cores
+
+# one process pool per interpreter, created on first use and shared by
+# run_parallel, ParallelExecutor(shared_pool=True) and the GMNS readers
+_POOL_LOCK = threading.RLock()
+_POOL_STATE = {
+    "pool": None,  # the ProcessPoolExecutor
+    "pid": None,  # pid of the process that created the pool
+    "max_workers": None,  # configured pool size, None: cpu cores - 1
+    "preload": (),  # modules imported once per worker (and in the forkserver)
+    "start_method": None,  # multiprocessing start method, None: platform default
+}
+
+
+def _default_pool_size() -> int:
+    cpu_count = get_cpu_cores()
+    return cpu_count - 1 if cpu_count > 1 else 1
+
+
+def _running_pool() -> ProcessPoolExecutor | None:
+    """The shared pool if it was started by this process and still works, else None."""
+    pool = _POOL_STATE["pool"]
+    if pool is None or _POOL_STATE["pid"] != os.getpid() or getattr(pool, "_broken", False):
+        return None
+    return pool
+
+
+def _pool_size() -> int:
+    """Size of the shared pool: the running pool's, else the configured size, else cpu cores - 1."""
+    with _POOL_LOCK:
+        pool = _running_pool()
+        return pool._max_workers if pool is not None else _POOL_STATE["max_workers"] or _default_pool_size()
+
+
+def _preload_modules(modules: tuple) -> None:
+    """Worker initializer: import heavy modules once per worker instead of once per task."""
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+
+def _reset_after_fork() -> None:
+    # a forked child inherits the parent's pool object but not its workers,
+    # drop the reference without shutting down the parent's pool
+    _POOL_STATE["pool"] = None
+    _POOL_STATE["pid"] = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def configure_worker_pool(max_workers: int | None = None,
+                          preload: list | tuple = (),
+                          start_method: str | None = None) -> None:
+    """Configure the shared worker pool used by run_parallel and the GMNS readers.
+
+    The running pool, if any, is shut down and recreated with the new settings on next use.
+
+    Args:
+        max_workers (int | None): number of worker processes. Defaults to None, cpu cores - 1.
+        preload (list | tuple): modules imported once in every worker, e.g. ("numpy", "pandas", "shapely").
+            With start_method="forkserver" they are also imported in the fork server, so new workers
+            start with them already loaded. Defaults to ().
+        start_method (str | None): "fork", "spawn" or "forkserver". Defaults to None, the platform default.
+
+    Examples:
+        >>> import pyufunc as pf
+        >>> pf.configure_worker_pool(max_workers=8, preload=("numpy", "pandas", "shapely"),
+        ...                          start_method="forkserver")
+        >>> pf.run_parallel(func, data)  # workers start with numpy, pandas and shapely imported
+        >>> pf.shutdown_worker_pool()
+
+    Returns:
+        None
+    """
+    if max_workers is not None and (not isinstance(max_workers, int) or max_workers <= 0):
+        raise ValueError("max_workers should be a positive integer.")
+    if start_method is not None and start_method not in multiprocessing.get_all_start_methods():
+        raise ValueError(f"start_method should be one of {multiprocessing.get_all_start_methods()}.")
+
+    with _POOL_LOCK:
+        shutdown_worker_pool()
+        _POOL_STATE["max_workers"] = max_workers
+        _POOL_STATE["preload"] = tuple(preload)
+        _POOL_STATE["start_method"] = start_method
+
+
+def get_worker_pool(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it lazily.
+
+    Callers that only need some of the workers should not pass max_workers, but limit the tasks they
+    submit at once (as ParallelExecutor(shared_pool=True) does): resizing restarts every worker.
+
+    Args:
+        max_workers (int | None): required pool size. If it differs from the running pool,
+            the pool is recreated with this size. Defaults to None, the running pool as it is,
+            or a new pool of the configured size.
+
+    Returns:
+        ProcessPoolExecutor: the shared pool. Do not shut it down directly, use shutdown_worker_pool().
+    """
+    with _POOL_LOCK:
+        size = max_workers or _pool_size()
+        pool = _POOL_STATE["pool"]
+
+        if pool is not None and _POOL_STATE["pid"] != os.getpid():
+            # inherited from a parent process: never reuse or shut it down here
+            pool = _POOL_STATE["pool"] = None
+        if pool is not None and (getattr(pool, "_broken", False) or pool._max_workers != size):
+            shutdown_worker_pool(wait=False)
+            pool = None
+
+        if pool is None:
+            preload = _POOL_STATE["preload"]
+            mp_context = None
+            if _POOL_STATE["start_method"]:
+                mp_context = multiprocessing.get_context(_POOL_STATE["start_method"])
+                if _POOL_STATE["start_method"] == "forkserver" and preload:
+                    mp_context.set_forkserver_preload(list(preload))
+            pool = ProcessPoolExecutor(max_workers=size, mp_context=mp_context,
+                                       initializer=_preload_modules if preload else None,
+                                       initargs=(preload,) if preload else ())
+            _POOL_STATE["pool"] = pool
+            _POOL_STATE["pid"] = os.getpid()
+        return pool
+
+
+def shutdown_worker_pool(wait: bool = True) -> None:
+    """Shut down the shared worker pool. It is created again on next use.
+
+    Args:
+        wait (bool): wait for running tasks to finish. Defaults to True.
+
+    Returns:
+        None
+    """
+    with _POOL_LOCK:
+        pool = _POOL_STATE["pool"]
+        if pool is not None and _POOL_STATE["pid"] == os.getpid():
+            pool.shutdown(wait=wait, cancel_futures=True)
+        _POOL_STATE["pool"] = None
+        _POOL_STATE["pid"] = None
+
+
+atexit.register(shutdown_worker_pool)
@@ -0,0 +1,103 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import (batch,  # pylint: disable=wrong-import-position  # noqa: E402
+                     configure_worker_pool,
+                     get_worker_pool,
+                     shutdown_worker_pool,
+                     cvt_wgs84_to_gcj02,
+                     calc_distance_on_unit_sphere,
+                     str_digit_to_int,
+                     time_str_to_seconds,
+                     cvt_int_to_alpha)
+
+np = pytest.importorskip("numpy")
+
+
+@batch
+def safe_ratio(a, b):
+    """Module level, so the process pool can pickle it."""
+    return a / b
+
+
+def test_element_wise_batch_masks_failures():
+    """Without a kernel, elements are mapped one by one and failures become NaN."""
+    values, failed = safe_ratio.batch([1, 2, 3], [2, 0, 4], return_mask=True)
+    np.testing.assert_allclose(values, [0.5, np.nan, 0.75])
+    assert failed.tolist() == [False, True, False]
+
+    # scalar positional arguments are broadcast, the function itself is unchanged
+    np.testing.assert_allclose(safe_ratio.batch(range(3), 2), [0.0, 0.5, 1.0])
+    assert safe_ratio(1, 4) == 0.25
+
+    with pytest.raises(ValueError, match="same length"):
+        safe_ratio.batch([1, 2], [1, 2, 3])
+    with pytest.raises(ValueError, match="at least one"):
+        safe_ratio.batch(1, 2)
+
+
+def test_parallel_path_matches_serial_path():
+    """The chunked process-pool map gives the same values and mask as the in-process loop."""
+    numerators = list(range(200))
+    denominators = [i % 5 for i in range(200)]
+    serial = safe_ratio.batch(numerators, denominators, parallel=False, return_mask=True)
+    parallel = safe_ratio.batch(numerators, denominators, parallel=True, max_workers=2, return_mask=True)
+    np.testing.assert_array_equal(serial[0], parallel[0])
+    np.testing.assert_array_equal(serial[1], parallel[1])
+
+
+def test_parallel_path_keeps_the_configured_pool(monkeypatch):
+    """The parallel path runs on the configured shared pool, with or without max_workers, without resizing it."""
+    monkeypatch.setenv("PYUFUNC_CPU_CORES", "8")
+    configure_worker_pool(max_workers=2)
+    try:
+        pool = get_worker_pool()
+        for max_workers in (None, 1, 4):
+            values = safe_ratio.batch(range(50), 2, parallel=True, max_workers=max_workers)
+            np.testing.assert_allclose(values, np.arange(50) / 2)
+            assert get_worker_pool() is pool and pool._max_workers == 2
+    finally:
+        configure_worker_pool()
+        shutdown_worker_pool()
+
+
+def test_coordinate_kernel_matches_scalar_function():
+    """The vectorized cvt_wgs84_to_gcj02 kernel returns the scalar results, NaN for invalid input."""
+    rng = np.random.default_rng(0)
+    lng, lat = rng.uniform(73, 135, 1000), rng.uniform(1, 55, 1000)
+
+    expected = np.array([cvt_wgs84_to_gcj02(x, y) for x, y in zip(lng.tolist(), lat.tolist())])
+    np.testing.assert_allclose(cvt_wgs84_to_gcj02.batch(lng, lat), expected, rtol=0, atol=1e-9)
+
+    values, failed = cvt_wgs84_to_gcj02.batch([113.8294754, 0.0, "x"], [22.6926477, 22.0, 22.0], return_mask=True)
+    assert failed.tolist() == [False, True, True]
+    np.testing.assert_allclose(values[0], cvt_wgs84_to_gcj02(113.8294754, 22.6926477))
+
+
+def test_distance_kernel_accepts_arrays_and_points():
+    """calc_distance_on_unit_sphere.batch takes (n, 2) arrays or sequences of points."""
+    shapely_geometry = pytest.importorskip("shapely.geometry")
+    pts1 = np.array([[-0.1276474, 51.5073219], [-1.9026911, 52.4796992]])
+    pts2 = [shapely_geometry.Point(-1.9026911, 52.4796992), (-0.1276474, 51.5073219)]
+
+    distances = calc_distance_on_unit_sphere.batch(pts1, pts2, unit="mile")
+    expected = [calc_distance_on_unit_sphere(tuple(p1), p2, unit="mile") for p1, p2 in zip(pts1, pts2)]
+    np.testing.assert_allclose(distances, expected)
+
+
+def test_scalar_helpers_have_batch_entry_points():
+    """String, time and alphabet helpers are batched element-wise."""
+    pd = pytest.importorskip("pandas")
+    np.testing.assert_array_equal(str_digit_to_int.batch(pd.Series(["1", "2.9", "x"])), [1.0, 2.0, np.nan])
+    np.testing.assert_array_equal(time_str_to_seconds.batch(["9:00am", "bad"], to_unit="minutes"), [540.0, np.nan])
+    assert cvt_int_to_alpha.batch(np.arange(25, 28)).tolist() == ["Z", "AA", "AB"]
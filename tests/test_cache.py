@@ -0,0 +1,121 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import memoize, stable_hash  # pylint: disable=wrong-import-position  # noqa: E402
+
+PKG_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_lru_eviction_and_stats():
+    """Results are reused, the least recently used entry is evicted and stats are counted."""
+    calls = []
+
+    @memoize(maxsize=2)
+    def square(value):
+        calls.append(value)
+        return value * value
+
+    assert [square(1), square(2), square(1), square(3), square(2)] == [1, 4, 1, 9, 4]
+    assert calls == [1, 2, 3, 2]
+    info = square.cache_info()
+    assert (info["hits"], info["misses"], info["evictions"], info["entries"]) == (1, 4, 2, 2)
+
+    square.cache_clear()
+    assert square.cache_info()["entries"] == 0
+
+
+def test_ttl_and_byte_limit():
+    """Entries expire after ttl seconds and the byte budget bounds the memory tier."""
+    np = pytest.importorskip("numpy")
+
+    @memoize(ttl=0.05)
+    def now(_):
+        return time.monotonic()
+
+    first = now(0)
+    assert now(0) == first
+    time.sleep(0.06)
+    assert now(0) != first and now.cache_info()["expired"] == 1
+
+    @memoize(maxsize=None, max_bytes=100_000)
+    def zeros(size):
+        return np.zeros(size)
+
+    for size in range(5):
+        zeros(5_000 + size)  # ~40 kB each
+    info = zeros.cache_info()
+    assert info["entries"] == 2 and info["bytes"] <= 100_000
+    zeros(1_000_000)  # larger than the whole budget: not kept
+    assert zeros.cache_info()["entries"] == 2
+
+
+def test_stable_hash_of_arrays_frames_and_geometries():
+    """Equal data hashes equal regardless of object identity; different data differs."""
+    np = pytest.importorskip("numpy")
+    pd = pytest.importorskip("pandas")
+    shapely = pytest.importorskip("shapely")
+
+    assert stable_hash(np.arange(4)) == stable_hash(np.array([0, 1, 2, 3]))
+    assert stable_hash(np.arange(4)) != stable_hash(np.arange(4).astype(np.int32))
+    assert stable_hash({"a": 1, "b": 2}) == stable_hash({"b": 2, "a": 1})
+    assert stable_hash(1) != stable_hash(1.0) != stable_hash("1")
+
+    frame = pd.DataFrame({"x": [1.0, 2.0], "y": ["a", "b"]})
+    assert stable_hash(frame) == stable_hash(frame.copy())
+    assert stable_hash(frame) != stable_hash(frame.rename(columns={"x": "z"}))
+    assert stable_hash(shapely.Point(1, 2)) == stable_hash(shapely.from_wkt("POINT (1 2)"))
+
+
+def test_lambdas_and_closures_are_told_apart():
+    """Functions sharing a qualname hash by code, defaults and closure contents, so memoize keeps them apart."""
+    def adder(n):
+        return lambda value: value + n
+
+    def countdown():
+        def step(n):
+            return step(n - 1) if n else 0
+        return step
+
+    assert stable_hash(adder(1)) != stable_hash(adder(100))
+    assert stable_hash(adder(1)) == stable_hash(adder(1))
+    assert stable_hash(lambda value: value + 1) != stable_hash(lambda value: value * 2)
+    assert stable_hash(countdown()) == stable_hash(countdown())
+
+    @memoize
+    def apply(func, value):
+        return func(value)
+
+    assert apply(lambda value: value + 1, 10) == 11
+    assert apply(lambda value: value * 2, 10) == 20
+    assert [apply(adder(n), 10) for n in (1, 100, 1)] == [11, 110, 11]
+    assert apply.cache_info()["hits"] == 1
+
+
+def test_disk_tier_is_reused_across_processes(tmp_path):
+    """A second interpreter run reads the result from the disk tier instead of recomputing."""
+    code = (
+        "from pyufunc import memoize\n"
+        f"@memoize(disk_dir={str(tmp_path)!r})\n"
+        "def slow(value):\n"
+        "    return value * 10\n"
+        "print(slow(4), slow.cache_info()['disk_hits'], slow.cache_info()['misses'])\n")
+    env = {**os.environ, "PYTHONPATH": str(PKG_ROOT)}
+    runs = [subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env,
+                           cwd=PKG_ROOT, check=True).stdout.split() for _ in range(2)]
+    assert runs == [["40", "0", "1"], ["40", "1", "0"]]
@@ -0,0 +1,88 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import __cfg as cfg  # pylint: disable=wrong-import-position  # noqa: E402
+
+PKG_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_import_does_no_dns_work():
+    """Importing the package and its config must not touch socket host resolution."""
+    code = (
+        "import socket\n"
+        "def _fail(*args):\n"
+        "    raise RuntimeError('host lookup at import time')\n"
+        "socket.gethostname = socket.gethostbyname = _fail\n"
+        "import pyufunc\n"
+        "from pyufunc.__cfg import *\n"
+        "from pyufunc.__cfg import config_logging, config_gmns\n"
+        "print(config_logging['log_fmt'][4])\n"
+        "print(config_gmns['cpu_cores'] > 0)\n")
+    env = {**os.environ, "PYTHONPATH": str(PKG_ROOT)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env,
+                            cwd=PKG_ROOT, check=True)
+    assert result.stdout.strip().endswith("True")
+
+
+def test_host_identity_env_overrides(monkeypatch: pytest.MonkeyPatch):
+    """Host name and IP honor environment overrides and feed log format 9."""
+    monkeypatch.setenv(cfg.ENV_HOSTNAME, "worker-01")
+    monkeypatch.setenv(cfg.ENV_HOST_IP, "10.0.0.1")
+
+    assert cfg.computer_name == "worker-01"
+    assert cfg.computer_ip == "10.0.0.1"
+    assert "(10.0.0.1,worker-01)" in cfg._build_log_fmt_host()
+
+
+def test_host_ip_falls_back_on_resolver_error(monkeypatch: pytest.MonkeyPatch):
+    """A failing resolver yields the loopback address instead of an exception."""
+    def _fail(host):
+        raise OSError("resolver down")
+
+    monkeypatch.setattr("socket.gethostbyname", _fail)
+    cfg._resolve_host_ip.cache_clear()
+    try:
+        assert cfg._resolve_host_ip("no-such-host") == "127.0.0.1"
+    finally:
+        cfg._resolve_host_ip.cache_clear()
+
+
+def test_cpu_cores_env_override(monkeypatch: pytest.MonkeyPatch):
+    """PYUFUNC_CPU_CORES overrides os.cpu_count and invalid values are ignored."""
+    monkeypatch.setenv(cfg.ENV_CPU_CORES, "3")
+    assert cfg.get_cpu_cores() == 3
+    monkeypatch.setenv(cfg.ENV_CPU_CORES, "zero")
+    assert cfg.get_cpu_cores() == (os.cpu_count() or 1)
+
+
+def test_lazy_dict_computes_once_and_copies():
+    """Lazy config values are computed on first read and survive dict copies."""
+    calls = []
+
+    def _value():
+        calls.append(1)
+        return 42
+
+    lazy = cfg._LazyDict({"a": 1, "b": cfg._Lazy(_value)})
+    assert "b" in lazy
+    assert isinstance(lazy.copy(), cfg._LazyDict)
+    assert not calls
+    assert lazy["b"] == 42
+    assert lazy.get("b") == 42
+    assert dict(lazy) == {"a": 1, "b": 42}
+    assert calls == [1]
@@ -0,0 +1,59 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import json
+import os
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import count_lines_of_code  # pylint: disable=wrong-import-position  # noqa: E402
+from pyufunc.util_magic import _count_code_size  # pylint: disable=wrong-import-position  # noqa: E402
+
+
+def test_counts_like_readlines_and_skips_binary(tmp_path, monkeypatch):
+    """Line endings are counted as readlines() counts them, also across read chunks; binary files are skipped."""
+    texts = {"unix.py": b"a\nb\n", "windows.py": b"a\r\nb\r\nc", "mac.txt": b"a\rb\r", "empty.txt": b""}
+    for name, data in texts.items():
+        (tmp_path / name).write_bytes(data)
+    (tmp_path / "image.png").write_bytes(b"\x89PNG\r\n\x1a\n\0\0\0\rIHDR\n")
+
+    expected = sum(len(data.decode().splitlines(keepends=True)) for data in texts.values())
+    assert count_lines_of_code(tmp_path) == expected == 7
+    assert count_lines_of_code(tmp_path, by_extension=True) == {".py": 5, ".txt": 2}
+    assert count_lines_of_code(tmp_path, skip_binary=False, by_extension=True)[".png"] == 4
+
+    # a \r\n split between two reads is still one line break
+    monkeypatch.setattr(_count_code_size, "_CHUNK_SIZE", 2)
+    assert count_lines_of_code(tmp_path / "windows.py") == 3
+
+
+def test_thread_pool_and_cache(tmp_path):
+    """Many files are counted in the thread pool; with a cache only changed files are read again."""
+    package = tmp_path / "pkg"
+    for i in range(40):
+        sub = package / f"sub_{i % 4}"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"module_{i}.py").write_text("x = 1\n" * (i + 1), encoding="utf-8")
+    cache_path = str(tmp_path / "loc_cache.json")
+
+    assert count_lines_of_code(package, ext="py", cache_path=cache_path) == sum(range(1, 41))
+    with open(cache_path, encoding="utf-8") as f:
+        assert len(json.load(f)) == 40
+
+    # rewrite a file with the same size and mtime: the cached count is used
+    changed = package / "sub_0" / "module_0.py"
+    stat = changed.stat()
+    changed.write_text("y = 2\n", encoding="utf-8")
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert count_lines_of_code(package, cache_path=cache_path) == sum(range(1, 41))
+
+    # a real change (size / mtime) is read again
+    changed.write_text("y = 2\nz = 3\n", encoding="utf-8")
+    assert count_lines_of_code(package, cache_path=cache_path) == sum(range(1, 41)) + 1
+    assert count_lines_of_code(package, max_workers=2) == sum(range(1, 41)) + 1
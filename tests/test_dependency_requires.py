@@ -0,0 +1,78 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import importlib.util
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc.util_magic import _dependency_requires_decorator as req  # pylint: disable=wrong-import-position  # noqa: E402
+from pyufunc import get_missing_dependencies, requires  # pylint: disable=wrong-import-position  # noqa: E402
+
+
+@pytest.fixture
+def count_find_spec(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Count calls to importlib.util.find_spec made by the requires decorator."""
+    calls = []
+    original = importlib.util.find_spec
+
+    def _counting_find_spec(name, *args, **kwargs):
+        calls.append(name)
+        return original(name, *args, **kwargs)
+
+    monkeypatch.setattr(req.importlib.util, "find_spec", _counting_find_spec)
+    return calls
+
+
+def test_each_dependency_is_probed_once(count_find_spec: list):
+    """Decorating many functions with the same dependency probes it once."""
+    req._clear_dependency_cache(["pyufunc_fake_dep_a"])
+
+    for _ in range(5):
+        @requires("pyufunc_fake_dep_a", verbose=False)
+        def func():
+            return 1
+
+    assert count_find_spec.count("pyufunc_fake_dep_a") == 1
+
+
+def test_available_dependency_returns_original_function():
+    """When dependencies are available the function is returned unwrapped."""
+    def func():
+        return "ok"
+
+    assert requires("json", "os")(func) is func
+
+
+def test_missing_dependency_is_reported(capsys: pytest.CaptureFixture[str]):
+    """Missing dependencies disable the function and appear in the report."""
+    @requires(("pyufunc-fake-dist", "pyufunc_fake_dep_b"))
+    def needs_fake():
+        return "ran"
+
+    assert needs_fake() is None
+    assert "missing dependency pyufunc-fake-dist" in capsys.readouterr().out
+
+    report = get_missing_dependencies()
+    assert any(name.endswith("needs_fake") for name in report["pyufunc-fake-dist"])
+
+
+def test_deferred_check_runs_on_first_call(count_find_spec: list):
+    """With defer=True decoration performs no probe, the first call does."""
+    req._clear_dependency_cache(["pyufunc_fake_dep_c"])
+
+    @requires("pyufunc_fake_dep_c", verbose=False, defer=True)
+    def deferred(value):
+        return value
+
+    assert "pyufunc_fake_dep_c" not in count_find_spec
+    assert deferred.__name__ == "deferred"
+    assert deferred(3) == 3
+    assert count_find_spec.count("pyufunc_fake_dep_c") == 1
@@ -0,0 +1,69 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+import pyufunc  # pylint: disable=wrong-import-position  # noqa: E402
+from pyufunc import _func_catalog  # pylint: disable=wrong-import-position  # noqa: E402
+
+PKG_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_catalog_matches_live_all():
+    """Every category in the catalog lists exactly the live __all__ of that category."""
+    catalog = _func_catalog.load_catalog()
+    for category in pyufunc._UTIL_CATEGORIES:
+        live_all = importlib.import_module(f"pyufunc.{category}").__all__
+        assert catalog["categories"][category] == list(live_all), category
+    assert catalog["categories"]["pkg_utils"] == _func_catalog.PKG_UTILS
+
+
+def test_shipped_catalog_is_up_to_date():
+    """The shipped json equals a fresh build; run `python -m pyufunc._func_catalog` if this fails."""
+    with open(_func_catalog.CATALOG_FILE, "r", encoding="utf-8") as f:
+        shipped = json.load(f)
+    assert shipped == json.loads(json.dumps(_func_catalog.build_catalog()))
+
+
+def test_catalog_entries_describe_functions():
+    """Catalog entries carry signature, summary and @requires dependencies."""
+    functions = _func_catalog.load_catalog()["functions"]
+    entry = functions["calc_distance_on_unit_haversine"]
+    assert entry["category"] == "util_geo"
+    assert entry["signature"].startswith("(lon1: np.ndarray")
+    assert entry["requires"] == ["numpy"]
+    assert entry["summary"]
+
+
+def test_keyword_and_docstring_search():
+    """Name search keeps substring semantics, docstring search uses the inverted index."""
+    assert "algo_quick_sort" in pyufunc.find_util_func_by_keyword("quick", verbose=False)
+    assert "calc_distance_on_unit_haversine" not in pyufunc.find_util_func_by_keyword("great", verbose=False)
+    found = pyufunc.find_util_func_by_keyword("coordinate convert", verbose=False, search_doc=True)
+    assert "cvt_wgs84_to_gcj02" in found
+
+
+def test_lookups_do_not_import_categories():
+    """Showing and searching functions must not import any util_* category."""
+    code = (
+        "import sys, pyufunc\n"
+        "pyufunc.show_util_func_by_category(verbose=False)\n"
+        "pyufunc.find_util_func_by_keyword('geo', verbose=False, search_doc=True)\n"
+        "print(','.join(m for m in sys.modules if m.startswith('pyufunc.util_')))")
+    env = {**os.environ, "PYTHONPATH": str(PKG_ROOT)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env,
+                            cwd=PKG_ROOT, check=True)
+    assert result.stdout.strip() == ""
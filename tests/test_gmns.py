@@ -0,0 +1,328 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import os
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+pytest.importorskip("pandas")
+pytest.importorskip("shapely")
+pytest.importorskip("tqdm")
+
+from pyufunc import (configure_worker_pool, get_worker_pool,  # pylint: disable=wrong-import-position  # noqa: E402
+                     shutdown_worker_pool)
+from pyufunc.__cfg import config_gmns  # pylint: disable=wrong-import-position  # noqa: E402
+from pyufunc.util_geo import _gmns  # pylint: disable=wrong-import-position  # noqa: E402
+
+
+@pytest.fixture
+def node_file(tmp_path):
+    path = tmp_path / "node.csv"
+    rows = ["node_id,x_coord,y_coord,activity_type,zone_id"]
+    rows += [f"{i},{-111.9 + i * 0.001},{33.4 + i * 0.001},residential,{i % 3}" for i in range(1, 2501)]
+    path.write_text("\n".join(rows) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def link_file(tmp_path):
+    path = tmp_path / "link.csv"
+    rows = ["link_id,name,from_node_id,to_node_id,length,lanes,free_speed,free_speed_raw,capacity,"
+            "link_type,facility_type,dir_flag,allowed_uses,geometry"]
+    rows += [f"{i},road {i},{i},{i + 1},{10.0 * i},1,30,30,1000,1,residential,1,auto,"
+             f"\"LINESTRING ({i} 0, {i + 1} 0)\"" for i in range(1, 1201)]
+    path.write_text("\n".join(rows) + "\n")
+    return str(path)
+
+
+def test_read_node_loads_every_chunk(node_file):
+    """read_node returns all nodes across chunks and leaves the config untouched."""
+    node_fields = list(config_gmns["node_fields"])
+    nodes = _gmns.read_node(node_file, cpu_cores=2)
+    assert len(nodes) == 2500
+    assert nodes[7]["x_coord"] == pytest.approx(-111.893)
+    assert nodes[7]["_zone_id"] == 1
+    assert config_gmns["node_fields"] == node_fields
+
+
+def test_read_link_loads_every_chunk(link_file):
+    """read_link returns all links with mode_type taken from allowed_uses."""
+    links = _gmns.read_link(link_file, cpu_cores=2)
+    assert len(links) == 1200
+    assert links[5]["from_node_id"] == 5 and links[5]["mode_type"] == "auto"
+
+
+def test_missing_file_raises():
+    """A missing input file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        _gmns.read_node("does/not/exist.csv")
+
+
+def test_zone_and_poi_columns_are_built_as_a_whole():
+    """Zone centroids/bounds and missing POI areas are computed for every row of a chunk."""
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyproj")
+    polygons = [f"POLYGON (({x} 40, {x + 1} 40, {x + 1} 42, {x} 42, {x} 40))" for x in range(3)]
+
+    zones = _gmns._create_zone_from_dataframe_by_geometry(pd.DataFrame({"zone_id": [1, 2, 3], "geometry": polygons}))
+    assert zones[2]["centroid"] == "POINT (1.5 41)"
+    assert (zones[2]["x_min"], zones[2]["y_min"], zones[2]["x_max"], zones[2]["y_max"]) == (1.0, 40.0, 2.0, 42.0)
+    assert zones[2]["node_id_list"] == [] and zones[2]["node_id_list"] is not zones[3]["node_id_list"]
+
+    df_poi = pd.DataFrame({"poi_id": [1, 2, 3], "building": "yes", "amenity": "",
+                           "centroid": ["POINT (0.5 41)", "POINT (1.5 41)", "POINT (2.5 41)"],
+                           "area": [None, 120000.0, 50.0], "geometry": polygons})
+    pois = _gmns._create_poi_from_dataframe(df_poi)
+    assert pois[1]["area"] > 1e9 and pois[2]["area"] == 0 and pois[3]["area"] == 50.0
+    assert (pois[3]["x_coord"], pois[3]["y_coord"]) == (2.5, 41.0)
+
+
+def test_readers_return_columnar_tables(node_file, link_file):
+    """With as_table=True the readers return tables that behave like the dicts and export to pandas / Arrow."""
+    np = pytest.importorskip("numpy")
+    nodes_dict = _gmns.read_node(node_file, cpu_cores=2)
+    nodes = _gmns.read_node(node_file, cpu_cores=2, as_table=True)
+    assert len(nodes) == 2500 and 7 in nodes and 0 not in nodes
+    assert nodes[7]["x_coord"] == pytest.approx(-111.893) and nodes[7]._zone_id == 1
+    assert nodes.to_dict()[7].keys() == nodes_dict[7].keys()
+    np.testing.assert_array_equal(nodes.rows_of([3, 1]), [2, 0])
+    with pytest.raises(KeyError):
+        nodes[0]["x_coord"]
+
+    links = _gmns.read_link(link_file, cpu_cores=2, as_table=True)
+    links[5]["lanes"] = 3
+    assert links.column("lanes")[links.rows_of([5])[0]] == 3
+    assert links[5].to_networkx()[:2] == (5, 6) and links[5].to_networkx()[2]["weight"] == 50.0
+    assert list(links.ids[links.column("length") > 11990]) == [1200]
+
+    df_link = links.to_pandas()
+    assert len(df_link) == 1200 and np.shares_memory(df_link["length"].to_numpy(), links.column("length"))
+    pytest.importorskip("pyarrow")
+    assert nodes.to_arrow().num_rows == 2500
+
+
+def test_cache_is_reused_until_the_file_changes(link_file, tmp_path, monkeypatch):
+    """A cached parse is loaded while link.csv is unchanged (also when only touched) and refreshed after an edit."""
+    pytest.importorskip("pyarrow")
+    cache_dir = str(tmp_path / "cache")
+    parsed = _gmns.read_link(link_file, cpu_cores=2, as_table=True, cache=True, cache_dir=cache_dir)
+
+    def parse_again(*args, **kwargs):
+        raise AssertionError("link.csv was parsed again")
+
+    monkeypatch.setattr(_gmns, "_create_in_parallel", parse_again)
+    os.utime(link_file)
+    cached = _gmns.read_link(link_file, cpu_cores=2, as_table=True, cache=True, cache_dir=cache_dir)
+    assert cached.to_dict() == parsed.to_dict()
+    assert _gmns.read_link(link_file, cache=True, cache_dir=cache_dir) == parsed.to_dict()
+
+    # memory-mapped columns are copied on first write, as writable as a parsed table's
+    cached[5]["lanes"] = 3
+    cached.column("length")[0] = -1.0
+    assert cached[5]["lanes"] == 3 and cached[1]["length"] == -1.0
+    reloaded = _gmns.read_link(link_file, cpu_cores=2, as_table=True, cache=True, cache_dir=cache_dir)
+    assert reloaded[5]["lanes"] == 1 and reloaded[1]["length"] == 10.0
+    monkeypatch.undo()
+
+    with open(link_file, "a", encoding="utf-8") as f:
+        f.write('1201,new,1201,1202,5.0,1,30,30,1000,1,residential,1,auto,"LINESTRING (0 0, 1 0)"\n')
+    links = _gmns.read_link(link_file, cpu_cores=2, as_table=True, cache=True, cache_dir=cache_dir)
+    assert len(links) == 1201 and links[1201]["name"] == "new"
+
+
+def test_cache_without_pyarrow_parses_with_a_warning(node_file, link_file, tmp_path, monkeypatch):
+    """Without pyarrow, cache=True warns and parses the file instead of failing, and writes no cache."""
+    import importlib.util  # pylint: disable=import-outside-toplevel
+
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec",
+                        lambda name, *args: None if name.split(".")[0] == "pyarrow" else find_spec(name, *args))
+
+    def load_cached(*args, **kwargs):
+        raise AssertionError("the cache was used without pyarrow")
+
+    monkeypatch.setattr(_gmns, "_load_cached_table", load_cached)
+    cache_dir = tmp_path / "cache"
+    with pytest.warns(UserWarning, match="needs pyarrow"):
+        nodes = _gmns.read_node(node_file, cpu_cores=1, cache=True, cache_dir=str(cache_dir))
+    with pytest.warns(UserWarning, match="needs pyarrow"):
+        links = _gmns.read_link(link_file, cpu_cores=1, as_table=True, cache=True, cache_dir=str(cache_dir))
+    assert len(nodes) == 2500 and nodes[7]["_zone_id"] == 1
+    assert len(links) == 1200 and links[5]["from_node_id"] == 5
+    assert not cache_dir.exists()
+
+
+def test_cached_and_table_nodes_match_the_dict_reader(node_file, tmp_path):
+    """Tables and the cache return the values and Python types of read_node, also for fields without a column."""
+    pytest.importorskip("pyarrow")
+    cache_dir = str(tmp_path / "cache")
+    expected = _gmns.read_node(node_file, cpu_cores=1)
+    _gmns.read_node(node_file, cpu_cores=1, cache=True, cache_dir=cache_dir)
+    readings = {"table": _gmns.read_node(node_file, cpu_cores=1, as_table=True).to_dict(),
+                "cache": _gmns.read_node(node_file, cpu_cores=1, cache=True, cache_dir=cache_dir)}
+
+    for how, nodes in readings.items():
+        assert nodes.keys() == expected.keys(), how
+        for node_id in (1, 7, 2500):
+            node, expected_node = nodes[node_id], expected[node_id]
+            assert list(node.keys()) == list(expected_node.keys()), how
+            for name, value in expected_node.items():
+                assert node[name] == value and type(node[name]) is type(value), (how, name)
+
+
+def test_csv_chunks_are_read_once_by_either_engine(node_file, tmp_path):
+    """pyarrow and pandas yield the same rows; a value pyarrow cannot parse hands over to pandas without repeats."""
+    pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+    from pyufunc.util_geo._gmns_csv import iter_csv_chunks  # pylint: disable=import-outside-toplevel
+
+    columns = ["node_id", "x_coord", "zone_id"]
+    by_engine = {engine: pd.concat(list(iter_csv_chunks(node_file, columns, {"x_coord": "float64"},
+                                                        block_size=8192, engine=engine)), ignore_index=True)
+                 for engine in ("pyarrow", "pandas")}
+    assert list(by_engine["pyarrow"].columns) == columns and len(by_engine["pyarrow"]) == 2500
+    pd.testing.assert_frame_equal(by_engine["pyarrow"], by_engine["pandas"])
+
+    # zone_id looks like an integer in the first blocks only
+    mixed_file = tmp_path / "mixed.csv"
+    mixed_file.write_text("node_id,zone_id\n" + "".join(f"{i},{i % 3}\n" for i in range(5000)) + "5000,downtown\n")
+    with pytest.warns(UserWarning, match="reading on with pandas"):
+        chunks = list(iter_csv_chunks(str(mixed_file), ["node_id", "zone_id"], block_size=4096))
+    node_ids = pd.concat(chunks)["node_id"].tolist()
+    assert node_ids == list(range(5001))
+
+    # blank lines are no rows to either engine, the pandas resume must not count them
+    mixed_file.write_text("node_id,zone_id\n" + "".join(f"{i},{i % 3}\n" for i in range(2500)) + "\n\n"
+                          + "".join(f"{i},{i % 3}\n" for i in range(2500, 4999)) + "\n4999,downtown\n")
+    with pytest.warns(UserWarning, match="reading on with pandas"):
+        chunks = list(iter_csv_chunks(str(mixed_file), ["node_id", "zone_id"], block_size=4096))
+    node_ids = pd.concat(chunks)["node_id"].tolist()
+    assert node_ids == list(range(5000))
+
+
+def test_iter_links_streams_filtered_batches(link_file, monkeypatch):
+    """iter_links yields LinkTables of batch_size rows, filtered by bbox and attributes while reading."""
+    np = pytest.importorskip("numpy")
+    monkeypatch.setitem(config_gmns, "data_block_size", 8192)
+
+    batches = list(_gmns.iter_links(link_file, batch_size=500, cpu_cores=1))
+    assert [len(batch) for batch in batches] == [500, 500, 200]
+    assert type(batches[0]).__name__ == "LinkTable" and batches[2].ids[-1] == 1200
+
+    # link i runs from x = i to x = i + 1
+    inside = list(_gmns.iter_links(link_file, batch_size=500, bbox=(100.5, -1, 200.5, 1),
+                                   where={"length": lambda length: length > 1500}, cpu_cores=1))
+    np.testing.assert_array_equal(np.concatenate([batch.ids for batch in inside]), np.arange(151, 201))
+
+    with pytest.raises(KeyError):
+        next(_gmns.iter_links(link_file, where={"no_such_column": 1}))
+
+
+def test_iter_nodes_and_zones_filter_by_location(node_file, tmp_path):
+    """Nodes are kept by coordinates, zone polygons by overlapping bounds."""
+    pytest.importorskip("pyproj")
+    nodes = list(_gmns.iter_nodes(node_file, batch_size=1000, bbox=(-111.9, 33.4, -111.85, 33.45),
+                                  where={"zone_id": [0, 1]}, cpu_cores=1))
+    ids = [node_id for batch in nodes for node_id in batch]
+    assert ids == [i for i in range(1, 51) if i % 3 in (0, 1)]
+
+    zone_file = tmp_path / "zone.csv"
+    zone_file.write_text("zone_id,geometry\n" + "".join(
+        f"{z},\"POLYGON (({z} 0, {z + 1} 0, {z + 1} 1, {z} 1, {z} 0))\"\n" for z in range(10)))
+    zones = next(_gmns.iter_zones(str(zone_file), bbox=(2.5, 0.5, 4.5, 0.6), cpu_cores=1))
+    assert list(zones) == [2, 3, 4] and zones[3]["x_min"] == 3.0
+
+
+def test_small_files_skip_the_worker_pool(node_file, monkeypatch):
+    """Small files are parsed in this process; large ones in blocks sized for every worker, with the same result."""
+    assert _gmns._chunk_plan(node_file, 8) == (1, config_gmns["data_block_size"])
+    inline = _gmns.read_node(node_file, cpu_cores=8, as_table=True)
+
+    # treat node.csv (2500 rows) as a large file, blocks of at least 10_000 rows would leave one worker
+    monkeypatch.setitem(config_gmns, "parallel_min_size", 0)
+    assert _gmns._chunk_plan(node_file, 8)[0] == 1
+    monkeypatch.setattr(_gmns, "_MIN_ROWS_PER_BLOCK", 200)
+    workers, block_size = _gmns._chunk_plan(node_file, 2)
+    assert workers == 2 and block_size * 2 * _gmns._BLOCKS_PER_WORKER >= os.path.getsize(node_file)
+
+    pooled = _gmns.read_node(node_file, cpu_cores=2, as_table=True)
+    assert pooled.to_dict() == inline.to_dict()
+
+
+def test_readers_keep_the_configured_pool(node_file, monkeypatch):
+    """Reads planned with any number of workers run on the configured shared pool without resizing it."""
+    monkeypatch.setenv("PYUFUNC_CPU_CORES", "8")
+    monkeypatch.setitem(config_gmns, "parallel_min_size", 0)
+    monkeypatch.setattr(_gmns, "_MIN_ROWS_PER_BLOCK", 200)
+    configure_worker_pool(max_workers=2)
+    try:
+        pool = get_worker_pool()
+        for cpu_cores in (3, 4, 8):
+            assert _gmns._chunk_plan(node_file, cpu_cores)[0] == cpu_cores
+            assert len(_gmns.read_node(node_file, cpu_cores=cpu_cores, as_table=True)) == 2500
+            assert get_worker_pool() is pool and pool._max_workers == 2
+    finally:
+        configure_worker_pool()
+        shutdown_worker_pool()
+
+
+def test_table_geometries_are_decoded_on_access(node_file, link_file, tmp_path):
+    """Node points are stored as WKB and decoded when read; geometries() decodes a whole column once."""
+    shapely = pytest.importorskip("shapely")
+    nodes = _gmns.read_node(node_file, cpu_cores=1, as_table=True)
+    assert isinstance(nodes.column("geometry")[0], bytes)
+    point = nodes[7]["geometry"]
+    assert point == _gmns.read_node(node_file, cpu_cores=1)[7]["geometry"] and point is nodes[7]["geometry"]
+    assert nodes.to_dict()[7]["geometry"] == point
+
+    points = nodes.geometries()
+    assert points is nodes.geometries() and shapely.get_x(points[6]) == pytest.approx(-111.893)
+    nodes[7]["geometry"] = shapely.Point(0, 0)
+    assert nodes.geometries()[6] == shapely.Point(0, 0) and nodes.to_pandas()["geometry"][6] == shapely.Point(0, 0)
+
+    # WKT text of links stays text in rows
+    links = _gmns.read_link(link_file, cpu_cores=1, as_table=True)
+    assert links[3]["geometry"] == "LINESTRING (3 0, 4 0)"
+    assert shapely.length(links.geometries()).sum() == pytest.approx(1200)
+
+    # a cached table keeps the WKB until it is used
+    pytest.importorskip("pyarrow")
+    cache_dir = str(tmp_path / "cache")
+    _gmns.read_node(node_file, cpu_cores=1, cache=True, cache_dir=cache_dir)
+    cached = _gmns.read_node(node_file, cpu_cores=1, as_table=True, cache=True, cache_dir=cache_dir)
+    assert isinstance(cached.column("geometry")[0], bytes) and cached[7]["geometry"] == point
+
+
+def test_id_index_translates_arrays(node_file, link_file):
+    """IdIndex maps ids to dense indices and back, for consecutive and arbitrary ids; links attach node indices."""
+    np = pytest.importorskip("numpy")
+    from pyufunc.util_geo._gmns_index import IdIndex  # pylint: disable=import-outside-toplevel
+
+    for ids in ([5, 6, 7, 8], [100, 7, 42, -3]):
+        index = IdIndex(ids)
+        np.testing.assert_array_equal(index.to_index(ids[::-1]), [3, 2, 1, 0])
+        np.testing.assert_array_equal(index.to_id([[1, 0]]), [[ids[1], ids[0]]])
+        np.testing.assert_array_equal(index.to_index([ids[2], 1000, 7.5], missing=-1), [2, -1, -1])
+        assert index.index_of(ids[3]) == 3 and 1000 not in index and "x" not in index
+        with pytest.raises(KeyError):
+            index.to_index([1000])
+        with pytest.raises(IndexError):
+            index.to_id([4])
+    with pytest.raises(ValueError):
+        IdIndex([1, 3, 1])
+
+    nodes = _gmns.read_node(node_file, cpu_cores=1, as_table=True)
+    assert nodes.index.to_index([7])[0] == 6 and nodes.index.nbytes == 0
+    links = _gmns.read_link(link_file, cpu_cores=1, as_table=True, node_index=nodes)
+    np.testing.assert_array_equal(links.column("from_node_index")[:3], [0, 1, 2])
+    assert links[1200]["to_node_index"] == 1200
+    from_x = nodes.column("x_coord")[links.column("from_node_index")]
+    assert from_x[6] == pytest.approx(nodes[7]["x_coord"])
@@ -0,0 +1,95 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import asyncio
+import json
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import (export_instrumentation,  # pylint: disable=wrong-import-position  # noqa: E402
+                     func_time, get_instrumentation_stats, instrument, record_timing, reset_instrumentation,
+                     set_instrumentation)
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    reset_instrumentation()
+    previous = set_instrumentation(True)
+    yield
+    set_instrumentation(previous)
+    reset_instrumentation()
+
+
+def test_func_time_records_instead_of_printing(capsys):
+    """func_time aggregates nanosecond timings into the registry and prints nothing."""
+    @func_time
+    def add(a, b):
+        return a + b
+
+    assert [add(i, 1) for i in range(5)] == [1, 2, 3, 4, 5]
+    assert capsys.readouterr().out == ""
+
+    stats = get_instrumentation_stats(f"{__name__}.test_func_time_records_instead_of_printing.<locals>.add")
+    assert stats["count"] == 5 and stats["errors"] == 0
+    assert 0 < stats["min_ns"] <= stats["mean_ns"] <= stats["max_ns"] <= stats["total_ns"]
+    assert sum(stats["histogram"]["counts"]) == 5
+
+
+def test_errors_async_and_custom_names():
+    """Failed calls are counted, coroutine functions and custom names are supported."""
+    @instrument(name="div")
+    def div(a, b):
+        return a / b
+
+    @instrument(name="coro")
+    async def coro():
+        return "ok"
+
+    div(1, 1)
+    with pytest.raises(ZeroDivisionError):
+        div(1, 0)
+    assert asyncio.run(coro()) == "ok"
+    record_timing("external", 2_500)
+
+    stats = get_instrumentation_stats()
+    assert stats["div"]["count"] == 2 and stats["div"]["errors"] == 1
+    assert stats["coro"]["count"] == 1
+    assert stats["external"]["histogram"]["counts"][1] == 1
+
+
+def test_disabled_instrumentation_records_nothing():
+    """With instrumentation off the wrapper only calls through."""
+    @instrument(name="off")
+    def identity(value):
+        return value
+
+    set_instrumentation(False)
+    assert identity(3) == 3
+    record_timing("off", 10)
+    assert get_instrumentation_stats("off") == {}
+
+
+def test_json_and_prometheus_export(tmp_path):
+    """Snapshots export as JSON and as cumulative Prometheus histograms."""
+    record_timing('a"b', 500)
+    record_timing('a"b', 5_000_000)
+
+    path = tmp_path / "stats.json"
+    assert json.loads(export_instrumentation("json", path=str(path)))['a"b']["count"] == 2
+    assert json.loads(path.read_text())['a"b']["max_ns"] == 5_000_000
+
+    text = export_instrumentation("prometheus")
+    assert "# TYPE pyufunc_function_duration_seconds histogram" in text
+    assert 'pyufunc_function_duration_seconds_bucket{function="a\\"b",le="1e-06"} 1' in text
+    assert 'pyufunc_function_duration_seconds_bucket{function="a\\"b",le="+Inf"} 2' in text
+    assert 'pyufunc_function_duration_seconds_count{function="a\\"b"} 2' in text
+    with pytest.raises(ValueError):
+        export_instrumentation("xml")
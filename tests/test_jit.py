@@ -0,0 +1,96 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import math
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import (jit,  # pylint: disable=wrong-import-position  # noqa: E402
+                     set_jit,
+                     is_jit_enabled,
+                     jit_available,
+                     algo_quick_sort,
+                     algo_merge_sort,
+                     algo_heap_sort,
+                     algo_selection_sort,
+                     algo_insertion_sort,
+                     algo_bubble_sort,
+                     calc_distance_on_unit_haversine,
+                     cvt_wgs84_to_gcj02)
+
+np = pytest.importorskip("numpy")
+
+SORTS = (algo_quick_sort, algo_merge_sort, algo_heap_sort, algo_selection_sort, algo_insertion_sort, algo_bubble_sort)
+
+
+@pytest.fixture
+def jit_on():
+    """Switch the JIT on for one test."""
+    previous = set_jit(True)
+    yield
+    set_jit(previous)
+
+
+def _norm_numpy(xs, ys, out):
+    out[:] = np.hypot(xs, ys)
+
+
+@jit(fallback=_norm_numpy)
+def _norm(xs, ys, out):
+    for i in range(xs.shape[0]):
+        out[i] = math.sqrt(xs[i] * xs[i] + ys[i] * ys[i])
+
+
+def test_switch_and_fallback():
+    """The switch is global and reversible, the fallback runs whenever the kernel is not compiled."""
+    previous = set_jit(True)
+    try:
+        assert is_jit_enabled() is jit_available()
+        assert set_jit(False) is True
+        assert not is_jit_enabled() and not _norm.compiled
+    finally:
+        set_jit(previous)
+
+    out = np.empty(2)
+    _norm(np.array([3.0, 5.0]), np.array([4.0, 12.0]), out)
+    assert out.tolist() == [5.0, 13.0]
+    assert _norm.__name__ == "_norm" and _norm.py_func is not _norm.fallback
+
+
+def test_compiled_kernels_match_fallbacks(jit_on):
+    """With numba installed, the compiled kernels give the fallback results."""
+    pytest.importorskip("numba")
+    xs, ys = np.random.default_rng(1).uniform(-10, 10, (2, 1000))
+    compiled, expected = np.empty(1000), np.empty(1000)
+    _norm(xs, ys, compiled)
+    assert _norm.compiled
+    _norm_numpy(xs, ys, expected)
+    np.testing.assert_allclose(compiled, expected)
+
+    lng, lat = np.random.default_rng(2).uniform(73, 135, 500), np.random.default_rng(3).uniform(1, 55, 500)
+    expected = np.array([cvt_wgs84_to_gcj02(x, y) for x, y in zip(lng.tolist(), lat.tolist())])
+    np.testing.assert_allclose(cvt_wgs84_to_gcj02.batch(lng, lat), expected, rtol=0, atol=1e-9)
+
+
+def test_kernels_keep_results(jit_on):
+    """Sorts and haversine return the same values with the JIT switched on, compiled or not."""
+    values = [3, 6, 8, 10, 1, 2, 1, -4]
+    for sort in SORTS:
+        assert sort(values) == sorted(values)
+        assert sort([2.5, -1.0, 2.5]) == [-1.0, 2.5, 2.5]
+        assert sort(np.array([3, 1, 2])) == [1, 2, 3]
+        assert sort(["b", "c", "a"]) == ["a", "b", "c"]
+        assert sort([]) == []
+
+    distances = calc_distance_on_unit_haversine(np.array([-0.1276474, 0.0]), np.array([51.5073219, 0.0]),
+                                                -1.9026911, 52.4796992)
+    np.testing.assert_allclose(distances[0], 162.66049634, rtol=1e-9)
+    assert calc_distance_on_unit_haversine(0.0, 0.0, 0.0, 0.0) == 0.0
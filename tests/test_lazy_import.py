@@ -0,0 +1,77 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+import pyufunc  # pylint: disable=wrong-import-position  # noqa: E402
+
+PKG_ROOT = Path(__file__).resolve().parents[1]
+
+# generous budget for `import pyufunc` alone, measured inside the child process
+IMPORT_TIME_BUDGET_SEC = 0.25
+
+
+def _run_python(code: str) -> str:
+    env = {**os.environ, "PYTHONPATH": str(PKG_ROOT)}
+    env.pop("PYUFUNC_EAGER_IMPORT", None)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env,
+                            cwd=PKG_ROOT, check=True)
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_util_categories():
+    """Importing pyufunc should not import any util_* sub-package."""
+    out = _run_python(
+        "import sys, pyufunc\n"
+        "print(','.join(sorted(m for m in sys.modules if m.startswith('pyufunc.'))))")
+    assert out == ""
+
+
+def test_import_time_budget():
+    """Importing pyufunc should stay within the import time budget."""
+    out = _run_python(
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import pyufunc\n"
+        "print(time.perf_counter() - start)")
+    assert float(out) < IMPORT_TIME_BUDGET_SEC
+
+
+def test_attribute_access_loads_only_defining_category():
+    """Accessing one function should only import the category defining it."""
+    out = _run_python(
+        "import sys, pyufunc\n"
+        "pyufunc.path2linux('a/b')\n"
+        "print(','.join(sorted({m.split('.')[1] for m in sys.modules if m.startswith('pyufunc.util_')})))")
+    assert "util_pathio" in out.split(",")
+    assert "util_geo" not in out.split(",")
+
+
+def test_all_and_dir_cover_every_category():
+    """pyufunc.__all__ and dir(pyufunc) list the names of every util_* category."""
+    from pyufunc import util_algorithm, util_pathio  # pylint: disable=import-outside-toplevel
+
+    for name in [*util_algorithm.__all__, *util_pathio.__all__]:
+        assert name in pyufunc.__all__
+        assert name in dir(pyufunc)
+    assert "show_util_func_by_category" in pyufunc.__all__
+    assert pyufunc.path2linux is util_pathio.path2linux
+
+
+def test_unknown_attribute_raises():
+    """Unknown names still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        _ = pyufunc.not_a_pyufunc_function
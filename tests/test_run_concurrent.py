@@ -0,0 +1,70 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import TaskError, run_concurrent, run_concurrent_async  # pylint: disable=wrong-import-position  # noqa: E402
+
+
+def test_sync_callables_run_in_threads_with_bounded_concurrency():
+    """Blocking callables overlap in threads, never exceeding max_concurrency."""
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def fetch(value):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.02)
+        with lock:
+            state["running"] -= 1
+        return value * 2
+
+    time_start = time.monotonic()
+    assert run_concurrent(fetch, range(40), max_concurrency=8) == [v * 2 for v in range(40)]
+    assert time.monotonic() - time_start < 40 * 0.02 / 2
+    assert state["peak"] == 8
+
+
+def test_coroutines_unordered_streaming():
+    """Coroutine functions run natively; unordered streaming yields fast results first."""
+    async def delayed(value):
+        await asyncio.sleep(0.05 if value == 0 else 0)
+        return value
+
+    stream = run_concurrent(delayed, range(5), max_concurrency=5, ordered=False, stream=True)
+    results = list(stream)
+    assert sorted(results) == [0, 1, 2, 3, 4] and results[-1] == 0
+
+
+def test_errors_and_validation():
+    """Errors follow on_error, and run_concurrent refuses to nest in a running loop."""
+    def inverse(value):
+        return 1 / value
+
+    results = run_concurrent(inverse, [1, 0, 2])
+    assert isinstance(results[1], TaskError) and results[1].index == 1
+    assert run_concurrent(inverse, [1, 0, 2], on_error="skip") == [1.0, 0.5]
+    with pytest.raises(TaskError):
+        run_concurrent(inverse, [1, 0, 2], on_error="raise")
+    with pytest.raises(ValueError):
+        run_concurrent(inverse, [1], max_concurrency=0)
+
+    async def nested():
+        with pytest.raises(RuntimeError):
+            run_concurrent(inverse, [1])
+        return [value async for value in run_concurrent_async(inverse, [1, 2, 4])]
+
+    assert asyncio.run(nested()) == [1.0, 0.5, 0.25]
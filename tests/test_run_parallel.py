@@ -0,0 +1,83 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import ParallelExecutor, TaskError, run_parallel  # pylint: disable=wrong-import-position  # noqa: E402
+
+
+def _square(value):
+    return value * value
+
+
+def _inverse(value):
+    return 1 / value
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_run_parallel_preserves_order(backend: str):
+    """run_parallel returns results in input order for both backends."""
+    assert run_parallel(_square, list(range(50)), 2, backend=backend) == [x * x for x in range(50)]
+
+
+def test_run_parallel_default_num_processes_and_validation():
+    """num_processes=None is accepted and invalid inputs are rejected."""
+    assert run_parallel(_square, [1, 2, 3], backend="thread") == [1, 4, 9]
+    with pytest.raises(TypeError):
+        run_parallel(_square, [1], num_processes="2")
+    with pytest.raises(ValueError):
+        run_parallel(_square, [1], num_processes=0)
+    with pytest.raises(ValueError):
+        run_parallel(_square, [1], chunksize=-1)
+
+
+def test_errors_are_captured_per_task():
+    """A failing task does not abort the map, its slot holds a TaskError."""
+    results = run_parallel(_inverse, [1, 0, 2], 2)
+    assert results[0] == 1.0 and results[2] == 0.5
+    assert isinstance(results[1], TaskError)
+    assert results[1].index == 1
+    assert results[1].exc_type == "ZeroDivisionError"
+
+    assert run_parallel(_inverse, [1, 0, 2], 2, backend="thread", on_error="skip") == [1.0, 0.5]
+    with pytest.raises(TaskError):
+        run_parallel(_inverse, [1, 0, 2], 2, backend="thread", on_error="raise")
+
+
+def test_imap_unordered_streams_all_results():
+    """imap_unordered yields every result, in any order."""
+    with ParallelExecutor(backend="thread", max_workers=3) as executor:
+        assert sorted(executor.imap_unordered(_square, range(100))) == [x * x for x in range(100)]
+
+
+def test_inflight_work_is_bounded():
+    """The input iterable is consumed lazily, bounded by max_inflight chunks."""
+    consumed = []
+
+    def source():
+        for value in range(10_000):
+            consumed.append(value)
+            yield value
+
+    with ParallelExecutor(backend="thread", max_workers=2, max_inflight=4) as executor:
+        stream = executor.imap(_square, source(), chunksize=10)
+        assert next(stream) == 0
+        assert len(consumed) <= 4 * 10 + 1
+        stream.close()
+
+
+def test_chunksize_is_tuned_from_task_time():
+    """Fast tasks grow the chunk size beyond the single-item calibration chunks."""
+    executor = ParallelExecutor(backend="thread", max_workers=2)
+    with executor:
+        assert executor.map(_square, range(5000)) == [x * x for x in range(5000)]
+    assert executor.sec_per_item is not None
+    assert executor._next_chunksize(balance_cap=10_000) > 1
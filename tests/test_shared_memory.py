@@ -0,0 +1,68 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import functools
+import pickle
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+np = pytest.importorskip("numpy")
+
+from pyufunc import SharedMemoryTransport, run_parallel  # pylint: disable=wrong-import-position  # noqa: E402
+
+
+def _slice_sum(values, bounds):
+    start, end = bounds
+    return float(values[start:end].sum())
+
+
+def _is_shared_view(values, _):
+    return not values.flags.writeable
+
+
+def test_large_array_round_trips_as_readonly_view():
+    """A shared array unpickles as a read-only view with the same data; small arrays are untouched."""
+    values = np.arange(300_000, dtype=np.float64)
+    small = np.arange(10)
+    with SharedMemoryTransport() as transport:
+        shared = transport.share((values, small, "label"))
+        assert shared[1] is small and shared[2] == "label"
+        assert transport.nbytes >= values.nbytes
+
+        restored = pickle.loads(pickle.dumps(shared[0]))
+        assert len(pickle.dumps(shared[0])) < 1000
+        np.testing.assert_array_equal(restored, values)
+        assert not restored.flags.writeable
+        del restored
+    assert transport.nbytes == 0
+
+
+def test_pandas_numeric_columns_are_shared():
+    """DataFrame numeric columns go through shared memory, other columns and dtypes are kept."""
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame({"x": np.arange(200_000, dtype=np.float64),
+                          "name": ["a"] * 200_000,
+                          "kind": pd.Categorical(["u", "v"] * 100_000)})
+    with SharedMemoryTransport() as transport:
+        restored = pickle.loads(pickle.dumps(transport.share({"frame": frame, "s": frame["x"]})))
+        pd.testing.assert_frame_equal(restored["frame"], frame)
+        pd.testing.assert_series_equal(restored["s"], frame["x"])
+        del restored
+
+
+def test_run_parallel_shares_partial_arguments():
+    """run_parallel ships arrays bound with functools.partial once, as views in the workers."""
+    values = np.arange(400_000, dtype=np.float64)
+    bounds = [(i, i + 100_000) for i in range(0, 400_000, 100_000)]
+    func = functools.partial(_slice_sum, values)
+    assert run_parallel(func, bounds, 2) == [float(values[s:e].sum()) for s, e in bounds]
+    assert run_parallel(functools.partial(_is_shared_view, values), [0], 1) == [True]
+    assert run_parallel(functools.partial(_is_shared_view, values), [0], 1, share_memory=False) == [False]
@@ -0,0 +1,143 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Saturday, October 17th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import heapq
+import math
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+np = pytest.importorskip("numpy")
+
+from pyufunc.util_geo._shortest_path import CSRGraph  # pylint: disable=wrong-import-position  # noqa: E402
+
+
+def _reference_cost(from_nodes, to_nodes, weights, source, target) -> float:
+    adjacency = {}
+    for u, v, w in zip(from_nodes.tolist(), to_nodes.tolist(), weights.tolist()):
+        adjacency.setdefault(u, []).append((v, w))
+    dist, heap = {source: 0.0}, [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for v, w in adjacency.get(u, []):
+            if d + w < dist.get(v, math.inf):
+                dist[v] = d + w
+                heapq.heappush(heap, (d + w, v))
+    return dist.get(target, math.inf)
+
+
+def test_searches_agree_with_reference():
+    """Dijkstra, A* and bidirectional search find the reference costs and consistent node / link paths."""
+    rng = np.random.default_rng(7)
+    n, m = 60, 240
+    from_nodes, to_nodes = rng.integers(0, n, m) * 5 + 3, rng.integers(0, n, m) * 5 + 3
+    node_ids = np.unique(np.concatenate([from_nodes, to_nodes]))
+    weights = rng.random(m) * 100
+    link_ids = np.arange(m) + 1000
+    # weights are at least the angle between the ends, so the A* heuristic needs no earth radius
+    x_coord, y_coord = rng.random(len(node_ids)) * 1e-3, rng.random(len(node_ids)) * 1e-3
+    graph = CSRGraph(from_nodes, to_nodes, weights, link_ids, x_coord=x_coord, y_coord=y_coord)
+    links = dict(zip(link_ids.tolist(), zip(from_nodes.tolist(), to_nodes.tolist(), weights.tolist())))
+
+    for source, target in rng.choice(node_ids, (40, 2)).tolist():
+        expected = _reference_cost(from_nodes, to_nodes, weights, source, target)
+        for method in ("dijkstra", "astar", "bidirectional"):
+            path = graph.shortest_path(source, target, method=method)
+            assert path.cost == pytest.approx(expected), method
+            if math.isinf(expected):
+                assert path.nodes == [] and path.links == []
+                continue
+            assert path.nodes[0] == source and path.nodes[-1] == target
+            assert [links[link][:2] for link in path.links] == list(zip(path.nodes, path.nodes[1:]))
+            assert sum(links[link][2] for link in path.links) == pytest.approx(expected)
+
+    dist = graph.distances(int(node_ids[0]))
+    assert dist[0] == 0 and dist[5] == pytest.approx(_reference_cost(from_nodes, to_nodes, weights,
+                                                                     int(node_ids[0]), int(node_ids[5])))
+    with pytest.raises(KeyError):
+        graph.shortest_path(1, int(node_ids[0]))
+    with pytest.raises(ValueError):
+        graph.shortest_path(int(node_ids[0]), int(node_ids[1]), method="bfs")
+    with pytest.raises(ValueError):
+        CSRGraph([1], [2], [-1.0])
+
+
+def test_graph_from_gmns_links():
+    """from_links reads LinkTable and dict links, honours dir_flag and the free_flow_time weight."""
+    pytest.importorskip("pandas")
+    from pyufunc.util_geo._gmns_table import LinkTable, NodeTable  # pylint: disable=import-outside-toplevel
+
+    # 1 -> 2 -> 3 one way, 3 <-> 4 both ways, 5 -> 4 given as 4 -> 5 with dir_flag -1
+    links = {10: {"id": 10, "from_node_id": 1, "to_node_id": 2, "length": 3.0, "free_speed": 1.0, "dir_flag": 1},
+             11: {"id": 11, "from_node_id": 2, "to_node_id": 3, "length": 4.0, "free_speed": 2.0, "dir_flag": 1},
+             12: {"id": 12, "from_node_id": 3, "to_node_id": 4, "length": 5.0, "free_speed": 5.0, "dir_flag": 0},
+             13: {"id": 13, "from_node_id": 4, "to_node_id": 5, "length": 6.0, "free_speed": 3.0, "dir_flag": -1}}
+    nodes = {i: {"id": i, "x_coord": -111.9 + i * 1e-5, "y_coord": 33.4} for i in range(1, 7)}
+    table = LinkTable({name: np.array([link[name] for link in links.values()]) for name in links[10]})
+    node_table = NodeTable({name: np.array([node[name] for node in nodes.values()]) for name in nodes[1]})
+
+    for graph in (CSRGraph.from_links(links, nodes), CSRGraph.from_links(table, node_table)):
+        assert graph.n_nodes == 6 and graph.n_links == 5
+        path = graph.shortest_path(1, 4)
+        assert path.cost == 12.0 and path.nodes == [1, 2, 3, 4] and path.links == [10, 11, 12]
+        assert graph.shortest_path(4, 3).links == [12]
+        assert graph.shortest_path(5, 3, method="astar").nodes == [5, 4, 3]
+        assert math.isinf(graph.shortest_path(4, 1).cost) and graph.shortest_path(6, 6).nodes == [6]
+
+    assert CSRGraph.from_links(table, weight="free_flow_time").shortest_path(1, 4).cost == 6.0
+    with pytest.raises(KeyError):
+        CSRGraph.from_links(table, weight="toll")
+    with pytest.raises(ValueError):
+        CSRGraph.from_links(table).shortest_path(1, 4, method="astar")
+
+
+def test_contraction_hierarchy_matches_dijkstra(tmp_path):
+    """CH queries give the Dijkstra costs and valid link paths, also memory-mapped back from its file."""
+    pytest.importorskip("tqdm")
+    from pyufunc.util_geo._contraction_hierarchy import ContractionHierarchy  # pylint: disable=import-outside-toplevel
+
+    rng = np.random.default_rng(3)
+    # a 12 x 12 grid with faster arterials every 4th row and column, plus a few one-way links
+    k = 12
+    grid = np.arange(k * k).reshape(k, k)
+    ends = np.concatenate([grid[:, :-1].ravel(), grid[:-1, :].ravel()]), \
+        np.concatenate([grid[:, 1:].ravel(), grid[1:, :].ravel()])
+    speed = np.where(np.arange(k) % 4 == 0, 3.0, 1.0)
+    length = 100 * (1 + rng.random(len(ends[0]))) / np.concatenate([np.repeat(speed, k - 1), np.tile(speed, k - 1)])
+    one_way = rng.random(len(ends[0])) < 0.1
+    from_nodes = np.concatenate([ends[0], ends[1][~one_way]]) + 1
+    to_nodes = np.concatenate([ends[1], ends[0][~one_way]]) + 1
+    weights = np.concatenate([length, length[~one_way]])
+    graph = CSRGraph(from_nodes, to_nodes, weights, link_ids=np.arange(len(weights)) * 2)
+    links = dict(zip((np.arange(len(weights)) * 2).tolist(), zip(from_nodes.tolist(), to_nodes.tolist())))
+
+    ch = ContractionHierarchy(graph)
+    ch.save(tmp_path / "grid.ch")
+    loaded = ContractionHierarchy.load(tmp_path / "grid.ch", graph=graph)
+    assert repr(loaded) == repr(ch) and loaded.nbytes == ch.nbytes
+
+    sources, targets = rng.integers(1, k * k + 1, 60), rng.integers(1, k * k + 1, 60)
+    expected = [graph.shortest_path(s, t, method="dijkstra").cost for s, t in zip(sources, targets)]
+    np.testing.assert_allclose(loaded.costs(sources, targets), expected)
+    for source, target, cost in zip(sources.tolist(), targets.tolist(), expected):
+        path = ch.shortest_path(source, target)
+        assert path.cost == pytest.approx(cost) and loaded.cost(source, target) == pytest.approx(cost)
+        if not math.isinf(cost):
+            assert path.nodes[0] == source and path.nodes[-1] == target
+            assert [links[link] for link in path.links] == list(zip(path.nodes, path.nodes[1:]))
+
+    other = CSRGraph(from_nodes, to_nodes, weights * 2)
+    with pytest.raises(ValueError):
+        ContractionHierarchy.load(tmp_path / "grid.ch", graph=other)
+    (tmp_path / "bad.ch").write_bytes(b"not a hierarchy")
+    with pytest.raises(ValueError):
+        ContractionHierarchy.load(tmp_path / "bad.ch")
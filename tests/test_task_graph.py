@@ -0,0 +1,147 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import os
+import time
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import (TaskGraph,  # pylint: disable=wrong-import-position  # noqa: E402
+                     configure_worker_pool, get_worker_pool, shutdown_worker_pool)
+
+
+def _log_call(log_dir: str, name: str) -> None:
+    # calls are recorded on disk, so they are visible from worker processes too
+    with open(os.path.join(log_dir, name), "a", encoding="utf-8") as f:
+        f.write("x")
+
+
+def _calls(log_dir, name: str) -> int:
+    path = os.path.join(log_dir, name)
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def read_numbers(path: str, log_dir: str) -> list:
+    _log_call(log_dir, "read_numbers")
+    with open(path, encoding="utf-8") as f:
+        return [int(line) for line in f if line.strip()]
+
+
+def total(numbers: list, log_dir: str) -> int:
+    _log_call(log_dir, "total")
+    return sum(numbers)
+
+
+def parity(numbers: list, log_dir: str) -> int:
+    _log_call(log_dir, "parity")
+    return sum(numbers) % 2
+
+
+def report(values: dict, log_dir: str) -> str:
+    _log_call(log_dir, "report")
+    return f"{values['total']}-{values['parity']}"
+
+
+def slow_constant(log_dir: str, value: int) -> int:
+    _log_call(log_dir, f"slow_{value}")
+    time.sleep(0.3)
+    return value
+
+
+def fail(_):
+    raise ValueError("broken task")
+
+
+def _build(graph: TaskGraph, data_file, log_dir):
+    numbers = graph.task(read_numbers, graph.file(str(data_file)), str(log_dir), name="numbers")
+    sum_ref = graph.task(total, numbers, str(log_dir), name="total")
+    parity_ref = graph.task(parity, numbers, str(log_dir), name="parity")
+    graph.task(report, {"total": sum_ref, "parity": parity_ref}, str(log_dir), name="report")
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_results_are_cached_and_unchanged_subgraphs_skipped(tmp_path, backend):
+    """A second run loads nothing; a changed file re-runs only what its content actually affects."""
+    data_file, log_dir = tmp_path / "numbers.txt", tmp_path / "log"
+    log_dir.mkdir()
+    data_file.write_text("1\n2\n3\n")
+
+    graph = TaskGraph(cache_dir=str(tmp_path / "cache"), backend=backend, max_workers=2)
+    _build(graph, data_file, log_dir)
+
+    assert graph.run() == {"numbers": [1, 2, 3], "total": 6, "parity": 0, "report": "6-0"}
+    assert set(graph.last_run.values()) == {"ran"}
+
+    assert graph.run(["report"]) == {"report": "6-0"}
+    assert set(graph.last_run.values()) == {"cached"}
+    assert _calls(log_dir, "total") == 1
+
+    # same total, same parity: the numbers task re-runs, its dependents are skipped
+    data_file.write_text("3\n2\n1\n")
+    assert graph.run(["report"]) == {"report": "6-0"}
+    assert graph.last_run == {"numbers": "ran", "total": "ran", "parity": "ran", "report": "cached"}
+
+    # a fresh graph over the same cache directory reuses the results as well
+    graph = TaskGraph(cache_dir=str(tmp_path / "cache"), backend=backend)
+    _build(graph, data_file, log_dir)
+    assert graph.run(["total"]) == {"total": 6}
+    assert graph.last_run == {"numbers": "cached", "total": "cached"}
+
+    graph.run(["total"], force=True)
+    assert graph.last_run == {"numbers": "ran", "total": "ran"}
+
+
+def test_independent_branches_run_in_parallel(tmp_path):
+    """Tasks without dependencies between them run at the same time."""
+    graph = TaskGraph(cache_dir=str(tmp_path / "cache"), backend="thread", max_workers=3)
+    for value in range(3):
+        graph.task(slow_constant, str(tmp_path), value, name=f"slow_{value}")
+
+    time_start = time.monotonic()
+    assert graph.run() == {"slow_0": 0, "slow_1": 1, "slow_2": 2}
+    assert time.monotonic() - time_start < 0.8
+
+
+def test_process_backend_keeps_the_configured_pool(tmp_path, monkeypatch):
+    """A max_workers on the process backend caps the running tasks without resizing the shared pool."""
+    monkeypatch.setenv("PYUFUNC_CPU_CORES", "8")
+    configure_worker_pool(max_workers=2)
+    try:
+        pool = get_worker_pool()
+        for max_workers in (None, 1, 3):
+            graph = TaskGraph(cache_dir=str(tmp_path / f"cache_{max_workers}"), max_workers=max_workers)
+            for value in range(3):
+                graph.task(slow_constant, str(tmp_path), value, name=f"slow_{value}")
+            assert graph.run() == {"slow_0": 0, "slow_1": 1, "slow_2": 2}
+            assert get_worker_pool() is pool and pool._max_workers == 2
+    finally:
+        configure_worker_pool()
+        shutdown_worker_pool()
+
+
+def test_invalid_graphs_and_failures(tmp_path):
+    """Unknown dependencies, duplicated names and failing tasks are reported."""
+    graph = TaskGraph(cache_dir=str(tmp_path / "cache"), backend="thread")
+    broken = graph.task(fail, 1, name="broken")
+    graph.task(total, broken, str(tmp_path), name="after")
+
+    with pytest.raises(ValueError, match="already exists"):
+        graph.task(fail, 2, name="broken")
+    with pytest.raises(ValueError, match="unknown task"):
+        graph.task(total, TaskGraph(cache_dir=str(tmp_path)).task(fail, 3), str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        graph.file(str(tmp_path / "missing.csv"))
+    with pytest.raises(KeyError):
+        graph.run(["nope"])
+
+    with pytest.raises(RuntimeError, match="Task 'broken' failed: ValueError: broken task"):
+        graph.run()
+    assert _calls(tmp_path, "total") == 0
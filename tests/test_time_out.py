@@ -0,0 +1,125 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import asyncio
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import CancellationToken, timeout, timeout_linux  # pylint: disable=wrong-import-position  # noqa: E402
+
+
+@timeout(5, mode="process")
+def _square_in_child(value):
+    return value * value
+
+
+@timeout(0.3, mode="process")
+def _sleep_in_child():
+    time.sleep(10)
+
+
+def test_thread_mode_does_not_trace_and_stops_python_loops():
+    """Thread mode runs without a trace function and stops a busy pure-python loop."""
+    state = {"trace": "unset", "iterations": 0}
+
+    @timeout(0.2)
+    def spin():
+        state["trace"] = sys.gettrace()
+        while True:
+            state["iterations"] += 1
+
+    with pytest.raises(TimeoutError, match="spin exceed 0.2 seconds timeout"):
+        spin()
+    assert state["trace"] is None
+    time.sleep(0.1)
+    stopped_at = state["iterations"]
+    time.sleep(0.1)
+    assert state["iterations"] == stopped_at
+
+
+def test_thread_mode_returns_and_raises():
+    """Results are returned and exceptions of the function are re-raised."""
+    assert timeout(1)(lambda x: x + 1)(1) == 2
+    with pytest.raises(ZeroDivisionError):
+        timeout(1)(lambda: 1 / 0)()
+
+
+def test_process_mode_terminates_the_child():
+    """Process mode returns the child's result, and terminates a child that exceeds the timeout."""
+    assert _square_in_child(7) == 49
+    time_start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        _sleep_in_child()
+    assert time.monotonic() - time_start < 3
+
+
+def test_asyncio_mode():
+    """Asyncio mode cancels the coroutine through asyncio.wait_for."""
+    @timeout(0.1, mode="asyncio")
+    async def slow():
+        await asyncio.sleep(10)
+
+    @timeout(1, mode="asyncio")
+    async def fast():
+        return "ok"
+
+    assert asyncio.run(fast()) == "ok"
+    with pytest.raises(TimeoutError):
+        asyncio.run(slow())
+    with pytest.raises(TypeError):
+        timeout(1, mode="asyncio")(lambda: None)
+
+
+def test_cooperative_mode_and_token():
+    """Cooperative mode hands a CancellationToken to the function."""
+    @timeout(0.05, mode="cooperative")
+    def loop(cancel_token=None):
+        steps = 0
+        while True:
+            cancel_token.raise_if_cancelled()
+            steps += 1
+
+    with pytest.raises(TimeoutError):
+        loop()
+    with pytest.raises(TypeError):
+        timeout(1, mode="cooperative")(lambda: None)
+
+    token = CancellationToken()
+    assert not token.cancelled and token.remaining is None
+    token.cancel()
+    assert token.cancelled
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGALRM"), reason="SIGALRM is unavailable")
+def test_timeout_linux_in_worker_thread_and_nested():
+    """timeout_linux works outside the main thread and restores an outer alarm."""
+    results = []
+
+    @timeout_linux(1)
+    def quick():
+        return "ok"
+
+    thread = threading.Thread(target=lambda: results.append(quick()))
+    thread.start()
+    thread.join()
+    assert results == ["ok"]
+
+    @timeout_linux(0.2)
+    def outer():
+        quick()
+        time.sleep(2)
+
+    with pytest.raises(TimeoutError):
+        outer()
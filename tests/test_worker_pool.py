@@ -0,0 +1,93 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Friday, October 16th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+import os
+
+import pytest
+
+import _path_setup
+
+_path_setup.add_pkg_to_sys_path("pyufunc", verbose=False)
+
+from pyufunc import (configure_worker_pool,  # pylint: disable=wrong-import-position  # noqa: E402
+                     get_worker_pool, run_parallel, shutdown_worker_pool)
+from pyufunc.util_magic import _worker_pool  # pylint: disable=wrong-import-position  # noqa: E402
+
+
+def _worker_pid(_):
+    return os.getpid()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    configure_worker_pool()
+    yield
+    configure_worker_pool()
+
+
+def test_pool_is_reused_across_calls():
+    """Consecutive run_parallel calls run on the same worker processes."""
+    configure_worker_pool(max_workers=2)
+    first = set(run_parallel(_worker_pid, range(8), 2, chunksize=1))
+    pool = get_worker_pool()
+    second = set(run_parallel(_worker_pid, range(8), 2, chunksize=1))
+    assert get_worker_pool() is pool
+    assert first & second
+    assert os.getpid() not in first
+
+
+def test_shutdown_and_resize_recreate_the_pool():
+    """shutdown_worker_pool drops the pool and a different size starts a new one."""
+    pool = get_worker_pool(2)
+    shutdown_worker_pool()
+    assert _worker_pool._POOL_STATE["pool"] is None
+
+    new_pool = get_worker_pool(2)
+    assert new_pool is not pool
+    assert get_worker_pool(1) is not new_pool
+
+
+def test_callers_keep_the_configured_pool(monkeypatch: pytest.MonkeyPatch):
+    """run_parallel, with or without a size, and get_worker_pool() reuse the configured pool instead of resizing it."""
+    monkeypatch.setenv("PYUFUNC_CPU_CORES", "8")
+    configure_worker_pool(max_workers=2)
+    assert run_parallel(abs, [-1, -2, -3]) == [1, 2, 3]
+    pool = get_worker_pool()
+    assert pool._max_workers == 2
+
+    assert run_parallel(abs, [-1, -2, -3], 1) == [1, 2, 3]
+    assert run_parallel(abs, [-1, -2, -3], 5) == [1, 2, 3]
+    assert get_worker_pool() is pool
+
+
+def test_configure_validates_and_preloads():
+    """configure_worker_pool rejects bad settings and preloads modules in the workers."""
+    with pytest.raises(ValueError):
+        configure_worker_pool(max_workers=0)
+    with pytest.raises(ValueError):
+        configure_worker_pool(start_method="teleport")
+
+    configure_worker_pool(max_workers=1, preload=("json",))
+    assert run_parallel(abs, [-1, -2]) == [1, 2]
+    assert get_worker_pool()._max_workers == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_inherit_the_pool():
+    """A forked child gets its own pool instead of the parent's."""
+    parent_pool = get_worker_pool(1)
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # child
+        ok = _worker_pool._POOL_STATE["pool"] is None
+        os.write(write_fd, b"1" if ok else b"0")
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b"1"
+    os.close(read_fd)
+    os.close(write_fd)
+    assert get_worker_pool(1) is parent_pool